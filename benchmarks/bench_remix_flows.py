@@ -0,0 +1,243 @@
+"""
+End-to-end benchmark: the addon's server round trips against a local mock.
+
+Starts remix_mock_server.MockRemixServer in-process and runs, per scene size,
+the request sequences of an export (pre-flight selection check, prim index
+and version match, model ingest, replace or append, prim selection, special
+texture ingest overlapped with the model ingest, texture assignment) and of
+the USD import (selection, file paths, resolving mesh files on disk). Each
+scene is exported twice: the first export appends a new asset with a cold
+ingest manifest, the second finds it by name, replaces it and reuses the
+already ingested textures.
+
+The requests themselves come from remix_server_flows, the bpy-free module the
+export and import operators call (upload_model, place_asset,
+ingest_special_textures, assign_special_textures, fetch_selected_usd_files),
+so only the sequencing around them is rebuilt here: the prim index is
+fetched right after the pre-flight check, and the special texture ingest runs
+on its own thread from before the model ingest until the texture assignment,
+as in the operator. Baking, OBJ export and geometry scanning are not included.
+To time the operators themselves, run remix_mock_server.py standalone and
+point the addon's server URLs at it.
+
+    python benchmarks/bench_remix_flows.py --scene medium --repeat 3
+    python benchmarks/bench_remix_flows.py --scene small --fail-rate 0.2 --fail-on ingest,query
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import remix_http
+import remix_prim_index
+import remix_server_flows
+from remix_mock_server import DEFAULT_LATENCY, MockRemixProject, MockRemixServer
+
+ASSET_BASE_NAME = "BenchAsset"
+
+# project_assets: captured meshes in the open project (size of the full prim listing)
+# selected: meshes selected in Remix (what the import brings in)
+SCENES = {
+    'small': dict(project_assets=200, selected=2, materials=2, textures_per_material=2),
+    'medium': dict(project_assets=2000, selected=12, materials=12, textures_per_material=3),
+    'large': dict(project_assets=20000, selected=60, materials=40, textures_per_material=4),
+}
+
+
+class StageTimer:
+    def __init__(self):
+        self.times = {}
+
+    def stage(self, name):
+        timer = self
+
+        class _Stage:
+            def __enter__(self):
+                self.start = time.perf_counter()
+
+            def __exit__(self, *exc):
+                timer.times[name] = time.perf_counter() - self.start
+
+        return _Stage()
+
+
+def write_scene(export_dir, export_index, scene, texture_bytes, rng):
+    """An exported OBJ/MTL pair plus the special textures its materials carry."""
+    os.makedirs(export_dir, exist_ok=True)
+    obj_path = os.path.join(export_dir, f"{ASSET_BASE_NAME}_{export_index}.obj")
+    mtl_name = f"{ASSET_BASE_NAME}_{export_index}.mtl"
+    material_names = [f"Mat-{i:02d}" for i in range(scene['materials'])]
+    with open(obj_path, 'w', encoding='utf-8') as f:
+        f.write(f"mtllib {mtl_name}\nv 0 0 0\nv 1 0 0\nv 0 1 0\n")
+        for name in material_names:
+            f.write(f"usemtl {name}\nf 1 2 3\n")
+    with open(os.path.join(export_dir, mtl_name), 'w', encoding='utf-8') as f:
+        f.writelines(f"newmtl {name}\n" for name in material_names)
+
+    assignments = {}
+    texture_types = list(remix_server_flows.SPECIAL_TEXTURE_MAP)
+    for i, name in enumerate(material_names):
+        textures = []
+        for t in range(scene['textures_per_material']):
+            tex_type = texture_types[(i + t) % len(texture_types)]
+            path = os.path.join(export_dir, f"{name}_{tex_type.lower()}.png")
+            if not os.path.exists(path):
+                # Same bytes on every export of a scene, like an unchanged bake.
+                with open(path, 'wb') as tf:
+                    tf.write(rng.randbytes(texture_bytes))
+            textures.append({'path': path, 'type': tex_type})
+        assignments[name] = textures
+    return obj_path, {name: name for name in material_names}, assignments
+
+
+def server_settings(server, ingest_dir):
+    """The preference values the flows read (main.server_settings_snapshot)."""
+    return SimpleNamespace(
+        remix_server_url=server.server_url, remix_export_url=server.export_url,
+        remix_ingest_directory=ingest_dir, remix_verify_ssl=True,
+    )
+
+
+def timed_special_ingest(settings, assignments, manifest_path):
+    """Runs on the ingest thread, so the time covers the ingest alone, not the wait for it."""
+    start = time.perf_counter()
+    result = remix_server_flows.ingest_special_textures(settings, assignments, manifest_path)
+    return result, time.perf_counter() - start
+
+
+def run_export(server, work_dir, export_index, scene, texture_bytes, rng):
+    timer = StageTimer()
+    ingest_dir = os.path.join(work_dir, "project", "ingested").replace('\\', '/')
+    settings = server_settings(server, ingest_dir)
+    obj_path, material_name_map, assignments = write_scene(os.path.join(work_dir, "export"), export_index, scene, texture_bytes, rng)
+    start = time.perf_counter()
+
+    with timer.stage("pre-flight selection"):
+        selected_prims = remix_prim_index.fetch_prim_paths(server.server_url, selection=True)
+    if not selected_prims:
+        return timer.times, "pre-flight failed"
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # execute() starts the full listing right after the pre-flight check; it
+        # runs while the export bakes.
+        index_future = pool.submit(remix_prim_index.RemixPrimIndex.fetch, server.server_url)
+        # _finalize_export starts the special texture ingest before the OBJ export.
+        special_future = pool.submit(timed_special_ingest, settings, assignments, os.path.join(work_dir, "ingest_manifest.json"))
+
+        with timer.stage("model ingest"):
+            ingested_usd, _ = remix_server_flows.upload_model(settings, obj_path, ingest_dir)
+        if ingested_usd is None:
+            return timer.times, "model ingest failed"
+        with timer.stage("prim index wait"):
+            prim_index = index_future.result()
+        replaced = prim_index is not None and prim_index.find_versioned_asset(ASSET_BASE_NAME)[0] is not None
+        with timer.stage("replace/append + select"):
+            try:
+                remix_server_flows.place_asset(
+                    settings, ingested_usd, ASSET_BASE_NAME, prim_index_future=index_future,
+                    selected_mesh_prims=remix_server_flows.mesh_prim_paths(selected_prims),
+                )
+            except RuntimeError:
+                return timer.times, f"{'replace' if replaced else 'append'} failed"
+        with timer.stage("special texture wait"):
+            special, timer.times["special texture ingest"] = special_future.result()
+
+    with timer.stage("texture assignment"):
+        assigned = (special['status'] == 'FINISHED' and bool(special['assignments'])
+                    and remix_server_flows.assign_special_textures(settings, material_name_map, special['assignments']) == 'FINISHED')
+    timer.times["export total"] = time.perf_counter() - start
+    note = f"{'replace' if replaced else 'append'}, {special['ingested_count']} ingested, {special['reused_count']} reused"
+    if special['duplicate_count']:
+        note += f", {special['duplicate_count']} shared"
+    if special['failed_count']:
+        note += f", {special['failed_count']} failed"
+    return timer.times, note if assigned else note + ", assignment failed"
+
+
+def run_import(server):
+    timer = StageTimer()
+    start = time.perf_counter()
+    with timer.stage("resolve selection"):
+        try:
+            usd_files, base_dir = remix_server_flows.fetch_selected_usd_files(server_settings(server, ""))
+        except RuntimeError:
+            return timer.times, "file paths failed"
+    if not base_dir:
+        return timer.times, "no selection"
+    timer.times["import total"] = time.perf_counter() - start
+    return timer.times, f"{len(usd_files)} USD file(s)"
+
+
+def run_scene(name, scene, args, run_index):
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix=f"remix_bench_{name}_") as work_dir:
+        project = MockRemixProject(os.path.join(work_dir, "project"))
+        project.seed(scene['project_assets'], selected=scene['selected'], write_files=True)
+        captured_selection = list(project.selection)
+        server = MockRemixServer(
+            project=project, latency={kind: getattr(args, f"{kind}_latency") for kind in DEFAULT_LATENCY},
+            ingest_item_latency=args.ingest_item_latency, max_concurrent_ingests=args.max_concurrent_ingests,
+            fail_rate=args.fail_rate, fail_on=[k for k in args.fail_on.split(',') if k], seed=args.seed + run_index,
+        )
+        with server:
+            results = [
+                ("export #1",) + run_export(server, work_dir, 1, scene, args.texture_kb * 1024, rng),
+                ("export #2",) + run_export(server, work_dir, 2, scene, args.texture_kb * 1024, rng),
+            ]
+            # The artist selects the captured meshes again before importing them.
+            project.selection = captured_selection
+            results.append(("import",) + run_import(server))
+            stats = server.stats()
+        remix_http.close_sessions()
+    return results, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scene", choices=sorted(SCENES) + ['all'], default='all')
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per scene; stage times are medians.")
+    parser.add_argument("--texture-kb", type=int, default=256, help="Size of each special texture file.")
+    for kind, seconds in DEFAULT_LATENCY.items():
+        parser.add_argument(f"--{kind}-latency", type=float, default=seconds, help=f"Mock seconds per {kind} request.")
+    parser.add_argument("--ingest-item-latency", type=float, default=0.05, help="Mock seconds per file in an ingest job.")
+    parser.add_argument("--max-concurrent-ingests", type=int, default=1)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--fail-on", default="ingest", help="Comma-separated endpoint classes that may fail.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    ok = True
+    for name in (list(SCENES) if args.scene == 'all' else [args.scene]):
+        scene = SCENES[name]
+        stage_times, notes, stats = defaultdict(lambda: defaultdict(list)), {}, {}
+        for run_index in range(max(1, args.repeat)):
+            results, stats = run_scene(name, scene, args, run_index)
+            for flow, times, note in results:
+                for stage, seconds in times.items():
+                    stage_times[flow][stage].append(seconds)
+                notes[flow] = note
+                ok = ok and "failed" not in note and note != "no selection"
+
+        print(f"\nScene '{name}': {scene['project_assets']} project prims, {scene['selected']} selected, "
+              f"{scene['materials']} materials x {scene['textures_per_material']} special textures")
+        for flow, stages in stage_times.items():
+            print(f"  {flow} ({notes[flow]})")
+            for stage, values in stages.items():
+                print(f"    {stage:<24}: {statistics.median(values):8.3f} s")
+        requests_sent = sum(count for count, _, _ in stats.values())
+        failures = sum(failed for _, failed, _ in stats.values())
+        print(f"  server: {requests_sent} requests in the last run, {failures} answered with an error")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,469 @@
+"""
+Local stand-in for the RTX Remix toolkit REST server.
+
+Implements the stagecraft/ingestcraft endpoints the addon calls, with enough
+project state to let whole flows run: prim listing and selection, reference
+file paths (replace via PUT, append via POST), texture listing and connection,
+and model/material ingest jobs that answer with the '.usd' / '.rtex.dds' paths
+a real server would write. Latency is configurable per endpoint class (query,
+mutation, ingest) plus a per-file cost for ingest jobs, which by default run
+one at a time like the toolkit's mass validator. Failures can be injected by
+rate, by endpoint class, or by input file name.
+
+Used by bench_remix_flows.py in-process, or standalone so the addon's own
+operators can be pointed at it from Blender (Preferences > Add-ons):
+
+    python benchmarks/remix_mock_server.py --port 8011 --project-dir /tmp/remix_mock
+
+Only the standard library is needed.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+REMIX_CONTENT_TYPE = 'application/lightspeed.remix.service+json; version=1.0'
+TEXTURE_INPUTS = ("diffuse_texture", "normalmap_texture", "reflectionroughness_texture")
+
+# Seconds per request before any work is simulated.
+DEFAULT_LATENCY = {
+    'query': 0.005,
+    'mutation': 0.02,
+    'ingest': 0.25,
+}
+
+
+def endpoint_class(method, path):
+    """Same split as remix_http.endpoint_class, without importing requests."""
+    if path.startswith('/ingestcraft/'):
+        return 'ingest'
+    return 'query' if method in ('GET', 'HEAD', 'OPTIONS') else 'mutation'
+
+
+def _short_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16].upper()
+
+
+def _usd_material_name(name):
+    # Exported '-' turns into '_' on the USD side; the addon matches on that.
+    return re.sub(r'[^A-Za-z0-9_]', '_', name)
+
+
+def read_mtl_material_names(obj_path):
+    """The 'newmtl' names of the MTL files an OBJ references, in file order."""
+    names = []
+    try:
+        with open(obj_path, 'r', encoding='utf-8', errors='replace') as f:
+            mtl_files = [line.split(None, 1)[1].strip() for line in f if line.startswith('mtllib ')]
+        for mtl in mtl_files:
+            with open(os.path.join(os.path.dirname(obj_path), mtl), 'r', encoding='utf-8', errors='replace') as f:
+                names.extend(line.split(None, 1)[1].strip() for line in f if line.startswith('newmtl '))
+    except OSError as e:
+        logging.warning(f"Mock server could not read materials of '{obj_path}': {e}")
+    return names
+
+
+class MockRemixProject:
+    """Prims, selection, reference files and texture connections of one open project."""
+
+    def __init__(self, project_dir=None):
+        self.project_dir = (project_dir or os.path.join(os.getcwd(), "remix_mock_project")).replace('\\', '/')
+        self.lock = threading.Lock()
+        self.prim_paths = []
+        self.selection = []
+        self.reference_files = {}  # ref prim -> USD file
+        self.textures = {}  # '<shader>.inputs:<name>' -> texture path
+        self.ingested_models = {}  # ingested USD -> material names read from its MTL
+
+    def _add_reference(self, mesh_prim, usd_path, materials):
+        stem = os.path.splitext(os.path.basename(usd_path))[0]
+        ref_prim = f"{mesh_prim}/ref_{_short_hash(usd_path + str(len(self.prim_paths)))}"
+        self.prim_paths.extend([ref_prim, f"{ref_prim}/XForms/ReferenceTarget/{stem}"])
+        self.reference_files[ref_prim] = usd_path
+        for material in materials:
+            shader = f"{ref_prim}/Looks/{_usd_material_name(material)}/Shader"
+            self.prim_paths.append(shader)
+            for name in TEXTURE_INPUTS:
+                self.textures[f"{shader}.inputs:{name}"] = ""
+        return ref_prim
+
+    def _remove_subtree(self, prim):
+        prefix = prim + '/'
+        self.prim_paths = [p for p in self.prim_paths if p != prim and not p.startswith(prefix)]
+        self.textures = {k: v for k, v in self.textures.items() if not k.startswith(prefix)}
+        for ref_prim in [r for r in self.reference_files if r == prim or r.startswith(prefix)]:
+            del self.reference_files[ref_prim]
+
+    def seed(self, asset_count, materials_per_asset=2, selected=1, write_files=False):
+        """
+        Fills the project with captured game meshes, selecting the first `selected`
+        of them. Their references point at the capture layer, with the mesh files
+        in 'captures/meshes/' next to it, which is where the USD import looks.
+        """
+        capture_dir = f"{self.project_dir}/captures"
+        with self.lock:
+            for i in range(asset_count):
+                mesh_prim = f"/RootNode/meshes/mesh_{_short_hash(f'captured-{i}')}"
+                self.prim_paths.append(mesh_prim)
+                ref_prim = self._add_reference(mesh_prim, f"{capture_dir}/capture.usda", [f"Captured{i}_{m}" for m in range(materials_per_asset)])
+                if i < selected:
+                    self.selection.extend([mesh_prim, ref_prim])
+                if write_files:
+                    usd_path = f"{capture_dir}/meshes/{mesh_prim.rsplit('/', 1)[-1]}.usd"
+                    os.makedirs(os.path.dirname(usd_path), exist_ok=True)
+                    with open(usd_path, 'w', encoding='utf-8') as f:
+                        f.write("#usda 1.0\n")
+
+    def _selected_paths(self):
+        selected = set(self.selection)
+        prefixes = tuple(p + '/' for p in selected)
+        return [p for p in self.prim_paths if p in selected or p.startswith(prefixes)]
+
+    def list_prims(self, selection):
+        with self.lock:
+            return self._selected_paths() if selection else list(self.prim_paths)
+
+    def select(self, prim):
+        with self.lock:
+            if prim not in self.prim_paths:
+                return False
+            self.selection = [prim]
+            return True
+
+    def reference_paths(self, prim):
+        """[[ref prim, [layer, file]]] for every reference at or under `prim`."""
+        with self.lock:
+            layer = f"{self.project_dir}/mod.usda"
+            return [[ref, [layer, path]] for ref, path in self.reference_files.items()
+                    if ref == prim or ref.startswith(prim + '/') or prim.startswith(ref + '/')]
+
+    def replace_reference(self, prim, usd_path):
+        with self.lock:
+            ref_prim = prim if prim in self.reference_files else next((r for r in self.reference_files if r.startswith(prim + '/')), None)
+            if ref_prim is None:
+                return None
+            self._remove_subtree(ref_prim)
+            mesh_prim = ref_prim.rsplit('/', 1)[0]
+            materials = self.ingested_models.get(usd_path, [])
+            return self._add_reference(mesh_prim, usd_path, materials)
+
+    def append_reference(self, parent_prim, usd_path):
+        with self.lock:
+            segments = parent_prim.strip('/').split('/')
+            if len(segments) >= 3 and segments[2].startswith('mesh_'):
+                mesh_prim = '/' + '/'.join(segments[:3])
+            else:
+                mesh_prim = f"/RootNode/meshes/mesh_{_short_hash(usd_path + str(len(self.prim_paths)))}"
+                self.prim_paths.append(mesh_prim)
+            return self._add_reference(mesh_prim, usd_path, self.ingested_models.get(usd_path, []))
+
+    def list_textures(self, selection):
+        with self.lock:
+            if not selection:
+                return [[k, v] for k, v in self.textures.items()]
+            prefixes = tuple(p + '/' for p in self.selection)
+            return [[k, v] for k, v in self.textures.items() if k.startswith(prefixes)]
+
+    def connect_textures(self, connections):
+        with self.lock:
+            missing = [attr for attr, _ in connections if attr.rsplit('.inputs:', 1)[0] not in self.prim_paths]
+            if missing:
+                return missing
+            for attr, path in connections:
+                self.textures[attr] = path
+            return []
+
+
+class MockRemixServer:
+    """
+    Threaded HTTP server around a MockRemixProject. Use as a context manager,
+    or start()/stop(); server_url and export_url are what the addon's
+    'Remix Server URL' and 'Remix Export URL' preferences expect.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, project=None, latency=None, ingest_item_latency=0.05, jitter=0.1,
+                 fail_rate=0.0, fail_status=503, fail_on=('ingest',), fail_inputs=(), max_concurrent_ingests=1,
+                 write_files=True, seed=0):
+        self.project = project or MockRemixProject()
+        self.latency = dict(DEFAULT_LATENCY, **(latency or {}))
+        self.ingest_item_latency = ingest_item_latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.fail_status = fail_status
+        self.fail_on = frozenset(fail_on)
+        self.fail_inputs = tuple(fail_inputs)
+        self.write_files = write_files
+        self._ingest_slots = threading.BoundedSemaphore(max(1, max_concurrent_ingests))
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.request_log = []  # (method, route, status, seconds)
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def server_url(self):
+        return f"{self.base_url}/stagecraft"
+
+    @property
+    def export_url(self):
+        return f"{self.base_url}/ingestcraft/mass-validator/queue"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="RemixMockServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def _random(self):
+        with self._rng_lock:
+            return self._rng.random()
+
+    def simulated_delay(self, kind, item_count=0):
+        base = self.latency.get(kind, 0.0) + self.ingest_item_latency * item_count
+        return max(0.0, base * (1.0 + self.jitter * (2.0 * self._random() - 1.0)))
+
+    def should_fail(self, kind):
+        return self.fail_rate > 0 and kind in self.fail_on and self._random() < self.fail_rate
+
+    def log_request(self, method, route, status, seconds):
+        with self._stats_lock:
+            self.request_log.append((method, route, status, seconds))
+
+    def stats(self):
+        """{'<METHOD> <route>': (count, failures, total seconds)} over every request served so far."""
+        summary = {}
+        with self._stats_lock:
+            for method, route, status, seconds in self.request_log:
+                count, failures, total = summary.get(f"{method} {route}", (0, 0, 0.0))
+                summary[f"{method} {route}"] = (count + 1, failures + (status >= 400), total + seconds)
+        return summary
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.request_log.clear()
+
+    # --- Ingest jobs ---
+
+    def _completed_job(self, payload, outputs):
+        schema = json.loads(json.dumps(payload))
+        flows = schema.setdefault("context_plugin", {}).setdefault("data", {}).setdefault("data_flows", [])
+        flows.append({"channel": "ingestion_output", "name": "InOutData", "output_data": outputs})
+        return {"completed_schemas": [schema]}
+
+    def _write_output(self, path, content):
+        if not self.write_files:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        except OSError as e:
+            logging.warning(f"Mock server could not write '{path}': {e}")
+
+    def ingest_model(self, payload):
+        data = payload.get("context_plugin", {}).get("data", {})
+        inputs, output_dir = data.get("input_files", []), data.get("output_directory", "")
+        if not inputs or not output_dir:
+            return 500, {"detail": "Mass validation did not complete successfully: no input files or output directory."}
+        outputs = []
+        for obj_path in inputs:
+            usd_path = f"{output_dir.rstrip('/')}/{os.path.splitext(os.path.basename(obj_path))[0]}.usd"
+            materials = read_mtl_material_names(obj_path)
+            with self.project.lock:
+                self.project.ingested_models[usd_path] = materials
+            self._write_output(usd_path, "#usda 1.0\n")
+            outputs.append(usd_path)
+        return 200, self._completed_job(payload, outputs)
+
+    def ingest_material(self, payload):
+        data = payload.get("context_plugin", {}).get("data", {})
+        inputs, output_dir = data.get("input_files", []), data.get("output_directory", "")
+        bad = [path for path, _ in inputs if any(token in path for token in self.fail_inputs)]
+        if bad:
+            return 500, {"detail": f"Mass validation did not complete successfully: could not convert {bad}"}
+        outputs = []
+        for path, texture_type in inputs:
+            base_name = os.path.splitext(os.path.basename(path))[0]
+            dds_path = f"{output_dir.rstrip('/')}/{base_name}.{texture_type[0].lower()}.rtex.dds"
+            self._write_output(dds_path, "DDS ")
+            outputs.append(dds_path)
+        return 200, self._completed_job(payload, outputs)
+
+
+_FILE_PATHS_ROUTE = re.compile(r"^/stagecraft/assets/(?P<prim>[^/]+)/file-paths/?$")
+_SELECT_ROUTE = re.compile(r"^/stagecraft/assets/selection/(?P<prim>[^/]+)/?$")
+
+
+def _make_handler(server):
+    project = server.project
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # Keep-alive, so client-side connection pooling is measurable.
+        disable_nagle_algorithm = True  # Headers and body go out separately; don't wait on delayed ACKs.
+
+        def log_message(self, format, *args):
+            logging.debug("Mock server: " + format % args)
+
+        def _send(self, status, body):
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            if status == 503:
+                self.send_header('Retry-After', '0')
+            self.send_header('Content-Type', REMIX_CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return status
+
+        def _read_json(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            if not length:
+                return {}
+            return json.loads(self.rfile.read(length).decode('utf-8'))
+
+        def _dispatch(self):
+            start = time.perf_counter()
+            parts = urlsplit(self.path)
+            path, query = parts.path, parse_qs(parts.query)
+            kind = endpoint_class(self.command, path)
+            try:
+                payload = self._read_json() if self.command in ('POST', 'PUT') else {}
+            except ValueError:
+                payload = None
+            if payload is None:
+                route, status, body = path, 422, {"detail": "Body is not valid JSON."}
+            elif server.should_fail(kind):
+                # Decided before any state changes, so a retried request sees the project unchanged.
+                time.sleep(server.simulated_delay(kind))
+                route, status, body = "injected-failure", server.fail_status, {"detail": "Injected failure."}
+            else:
+                route, status, body = self._route(path, query, payload, kind)
+            self._send(status, body)
+            server.log_request(self.command, route, status, time.perf_counter() - start)
+
+        def _route(self, path, query, payload, kind):
+            selection = query.get('selection', ['false'])[0] == 'true'
+
+            if path.startswith('/ingestcraft/mass-validator/queue/'):
+                job = path.rstrip('/').rsplit('/', 1)[-1]
+                handler = {'model': server.ingest_model, 'material': server.ingest_material}.get(job)
+                if self.command != 'POST' or handler is None:
+                    return path, 404, {"detail": "Not found."}
+                item_count = len(payload.get("context_plugin", {}).get("data", {}).get("input_files", []))
+                with server._ingest_slots:
+                    time.sleep(server.simulated_delay(kind, item_count))
+                    status, body = handler(payload)
+                return f"ingestcraft/{job}", status, body
+
+            time.sleep(server.simulated_delay(kind))
+
+            if path.rstrip('/') == '/stagecraft/assets' and self.command == 'GET':
+                return "assets", 200, {"prim_paths": project.list_prims(selection)}
+
+            match = _SELECT_ROUTE.match(path)
+            if match and self.command == 'PUT':
+                ok = project.select(unquote(match.group('prim')))
+                return "assets/selection", (200 if ok else 404), ({} if ok else {"detail": "Prim not found."})
+
+            match = _FILE_PATHS_ROUTE.match(path)
+            if match:
+                prim = unquote(match.group('prim'))
+                asset_path = payload.get("asset_file_path", "").replace('\\', '/')
+                if self.command == 'GET':
+                    return "assets/file-paths", 200, {"reference_paths": project.reference_paths(prim)}
+                if self.command == 'PUT':
+                    ref_prim = project.replace_reference(prim, asset_path)
+                elif self.command == 'POST':
+                    ref_prim = project.append_reference(prim, asset_path)
+                else:
+                    return "assets/file-paths", 405, {"detail": "Method not allowed."}
+                if ref_prim is None:
+                    return "assets/file-paths", 404, {"detail": f"No reference under '{prim}'."}
+                return "assets/file-paths", 200, {"reference_paths": [[ref_prim, [f"{project.project_dir}/mod.usda", asset_path]]]}
+
+            if path.rstrip('/') == '/stagecraft/textures':
+                if self.command == 'GET':
+                    return "textures", 200, {"textures": project.list_textures(selection)}
+                if self.command == 'PUT':
+                    missing = project.connect_textures(payload.get("textures", []))
+                    if missing:
+                        return "textures", 422, {"detail": f"Unknown shader inputs: {missing}"}
+                    return "textures", 200, {}
+
+            return path, 404, {"detail": "Not found."}
+
+        do_GET = do_PUT = do_POST = do_DELETE = _dispatch
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8011, help="8011 matches the addon's default URLs.")
+    parser.add_argument("--project-dir", default=None, help="Where ingested USD/DDS files and captured meshes are written.")
+    parser.add_argument("--assets", type=int, default=200, help="Captured meshes in the seeded project.")
+    parser.add_argument("--selected", type=int, default=1, help="How many of them start selected.")
+    for kind, seconds in DEFAULT_LATENCY.items():
+        parser.add_argument(f"--{kind}-latency", type=float, default=seconds, help=f"Seconds per {kind} request.")
+    parser.add_argument("--ingest-item-latency", type=float, default=0.05, help="Extra seconds per file in an ingest job.")
+    parser.add_argument("--max-concurrent-ingests", type=int, default=1)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Probability of an injected failure.")
+    parser.add_argument("--fail-status", type=int, default=503)
+    parser.add_argument("--fail-on", default="ingest", help="Comma-separated endpoint classes that may fail (query, mutation, ingest).")
+    parser.add_argument("--fail-input", action="append", default=[], help="Fail material ingests whose input path contains this text.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    project = MockRemixProject(args.project_dir)
+    project.seed(args.assets, selected=args.selected, write_files=True)
+    server = MockRemixServer(
+        args.host, args.port, project,
+        latency={kind: getattr(args, f"{kind}_latency") for kind in DEFAULT_LATENCY},
+        ingest_item_latency=args.ingest_item_latency, max_concurrent_ingests=args.max_concurrent_ingests,
+        fail_rate=args.fail_rate, fail_status=args.fail_status, fail_on=[k for k in args.fail_on.split(',') if k],
+        fail_inputs=args.fail_input, seed=args.seed,
+    )
+    print(f"Remix Server URL : {server.server_url}")
+    print(f"Remix Export URL : {server.export_url}")
+    print(f"Project directory: {project.project_dir}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,7 +24,6 @@ except ImportError:
 
 if IS_BLENDER_CONTEXT:
     import bpy
-    import requests
     import os
     import logging
     import tempfile
@@ -39,15 +38,12 @@ if IS_BLENDER_CONTEXT:
     from bpy.props import BoolProperty, StringProperty, CollectionProperty, IntProperty, EnumProperty, FloatProperty, PointerProperty
     from bpy.types import Operator, Panel, PropertyGroup, AddonPreferences
     import bpy_extras.io_utils
-    import urllib.parse
     import subprocess
     from pathlib import Path
     from mathutils import Vector, Matrix
-    import math
     from threading import Lock
     from datetime import datetime
     from subprocess import Popen, PIPE
-    import json
     import sys
     import uuid
     import textwrap
@@ -58,9 +54,23 @@ if IS_BLENDER_CONTEXT:
     from collections import defaultdict, deque 
     import atexit
     import hashlib
+    import weakref
     import multiprocessing
     import numpy as np
     from . import usd_scanner
+    from . import remix_ipc
+    from . import remix_array_ops
+    from . import remix_node_eval
+    from . import remix_export_journal
+    from . import remix_bake_agent
+    from . import remix_bake_telemetry
+    from . import remix_image_jobs
+    from . import remix_http
+    from . import remix_prim_index
+    from . import remix_server_flows
+    import concurrent.futures
+    from concurrent.futures import ThreadPoolExecutor, Future
+    from types import SimpleNamespace
 
     # --- Globals & Configuration ---
     log_file_path = ""
@@ -71,6 +81,16 @@ if IS_BLENDER_CONTEXT:
     PSUTIL_INSTALLED = False
     PILLOW_INSTALLED = False
     ACTIVE_WORKER_PROCESSES = []
+    # --- Headless batch exports ---
+    # Worker process -> (operator, slot_index) whose messages its reader threads deliver to.
+    WORKER_ROUTES = {}
+    # Idle workers kept alive between headless exports, adopted by the next export.
+    PARKED_WORKERS = []
+    # Summary of the most recent export (read by remix_batch_export.py).
+    LAST_EXPORT_STATS = {}
+    # Worker process -> version of the texture translation map it holds. Parked
+    # workers keep theirs, so an unchanged map is not resent to them.
+    WORKER_TEXTURE_MAP_VERSIONS = weakref.WeakKeyDictionary()
     TEMP_FILES_FOR_ATEXIT_CLEANUP = []
     TEMP_DIR_PREFIX = "remix_ingestor_temp_"
     # --- NEW: Material Caching Globals ---
@@ -79,6 +99,15 @@ if IS_BLENDER_CONTEXT:
     # Define the custom paths here to be used by all functions
     CUSTOM_COLLECT_PATH = os.path.join(tempfile.gettempdir(), "remix_collect")
     CUSTOM_FINALIZE_PATH = os.path.join(tempfile.gettempdir(), "remix_finalize")
+    # Export journals live outside remix_collect so the startup wipe cannot remove them.
+    CUSTOM_JOURNAL_PATH = os.path.join(tempfile.gettempdir(), "remix_journal")
+    # PNG conversions of EXR textures, reused across exports (see remix_image_jobs).
+    CUSTOM_EXR_CACHE_PATH = os.path.join(tempfile.gettempdir(), "remix_exr_cache")
+    # PNGs recovered from packed and generated images, keyed by their fingerprint.
+    CUSTOM_IMAGE_CACHE_PATH = os.path.join(tempfile.gettempdir(), "remix_image_cache")
+    # Digests of textures the server already converted, kept with the user config so it
+    # survives temp cleanup and restarts (see remix_ingest_manifest).
+    CUSTOM_INGEST_MANIFEST_PATH = os.path.join(bpy.utils.user_resource('CONFIG'), "remix_ingestor", "ingest_manifest.json")
 
     # Baking Worker Configuration
     BAKE_WORKER_PY = None 
@@ -267,7 +296,8 @@ if IS_BLENDER_CONTEXT:
     def cleanup_orphan_directories():
         """
         [DEFINITIVE FIX V2] Scans and cleans ALL addon-related temporary directories on startup.
-        - Wipes the entire bake cache ('remix_collect') to ensure a fresh start.
+        - Wipes the bake cache ('remix_collect') to ensure a fresh start, keeping only
+          bake outputs that an unfinished export journal still references for resuming.
         - Intelligently removes only orphaned session folders ('remix_finalize') from crashed instances.
         """
         if not PSUTIL_INSTALLED:
@@ -289,8 +319,13 @@ if IS_BLENDER_CONTEXT:
             if os.path.normpath(base_path) == os.path.normpath(CUSTOM_COLLECT_PATH):
                 logging.info(f"Wiping bake cache directory: {base_path}")
                 try:
+                    journaled_outputs = remix_export_journal.referenced_outputs_in(CUSTOM_JOURNAL_PATH)
+                    if journaled_outputs:
+                        logging.info(f"Keeping {len(journaled_outputs)} bake output(s) referenced by resumable export journals.")
                     for item_name in os.listdir(base_path):
                         item_path = os.path.join(base_path, item_name)
+                        if os.path.normpath(item_path) in journaled_outputs:
+                            continue
                         if os.path.isdir(item_path):
                             shutil.rmtree(item_path)
                         else:
@@ -516,6 +551,45 @@ if IS_BLENDER_CONTEXT:
             default='EMIT_HIJACK'
         )
 
+        udim_atlas_max_dimension: IntProperty(
+            name="UDIM Atlas Max Size",
+            description="UDIM tiles are packed into a near-square grid atlas. If either side of the atlas would exceed this many pixels, the tiles are scaled down to fit. 0 disables the limit",
+            default=8192,
+            min=0,
+            max=32768
+        )
+
+        # --- Bake Worker Settings ---
+        bake_worker_hang_timeout: IntProperty(
+            name="Worker Hang Timeout (s)",
+            description="A bake worker that sends no message or heartbeat for this many seconds while holding a task is considered hung. It is killed and the task is requeued. 0 disables hang detection",
+            default=int(remix_ipc.HANG_TIMEOUT_SEC),
+            min=0
+        )
+        bake_worker_max_rss_mb: IntProperty(
+            name="Worker Memory Limit (MB)",
+            description="A local bake worker whose resident memory exceeds this after a task is restarted before its next task, releasing fragmented Cycles and image memory. 0 disables the limit",
+            default=8192,
+            min=0
+        )
+        bake_worker_max_tasks: IntProperty(
+            name="Tasks per Worker",
+            description="A local bake worker is restarted after completing this many tasks. 0 disables recycling by task count",
+            default=40,
+            min=0
+        )
+        bake_agents: StringProperty(
+            name="Remote Bake Agents",
+            description="Comma-separated host:port list of machines running remix_bake_agent.py. Append *N to an entry to use N worker slots on that agent (e.g. 'render01:47820*4, 127.0.0.1:47821')",
+            default=""
+        )
+        bake_agent_token: StringProperty(
+            name="Bake Agent Token",
+            description="Shared secret the remote bake agents were started with (--token or REMIX_AGENT_TOKEN). Agents reject connections without it",
+            subtype='PASSWORD',
+            default=""
+        )
+
         # --- Substance Painter Settings ---
         spp_exe: StringProperty(
             name="Substance Painter Executable Path",
@@ -537,6 +611,14 @@ if IS_BLENDER_CONTEXT:
             layout.prop(self, "remix_export_url")
             layout.prop(self, "spp_exe")
             layout.prop(self, "export_folder")
+            layout.prop(self, "udim_atlas_max_dimension")
+            layout.separator()
+            layout.label(text="Bake Workers:")
+            layout.prop(self, "bake_worker_hang_timeout")
+            layout.prop(self, "bake_worker_max_rss_mb")
+            layout.prop(self, "bake_worker_max_tasks")
+            layout.prop(self, "bake_agents")
+            layout.prop(self, "bake_agent_token")
 
     class AssetNumberItem(PropertyGroup):
         blend_name: StringProperty(name="Blend File Name")
@@ -620,6 +702,117 @@ if IS_BLENDER_CONTEXT:
                     logging.error(f"atexit cleanup failed for '{path_to_clean}': {e}")
             TEMP_FILES_FOR_ATEXIT_CLEANUP.clear()
 
+    def shutdown_parked_workers():
+        """Stops the workers that headless exports kept alive for reuse."""
+        while PARKED_WORKERS:
+            worker = PARKED_WORKERS.pop()['process']
+            WORKER_ROUTES.pop(worker, None)
+            if worker.poll() is None:
+                try:
+                    worker.stdin.write(remix_ipc.encode_frame({"action": remix_ipc.ACTION_QUIT}))
+                    worker.stdin.flush()
+                    worker.stdin.close()
+                    worker.wait(timeout=5)
+                except (subprocess.TimeoutExpired, OSError, ValueError):
+                    worker.kill()
+            if worker in ACTIVE_WORKER_PROCESSES:
+                ACTIVE_WORKER_PROCESSES.remove(worker)
+
+    class SystemResourceSampler:
+        """
+        [NEW] Samples system CPU/RAM and the RSS of every tracked worker PID on a
+        background thread. The modal dispatcher only reads the latest smoothed
+        snapshot, so it never blocks on psutil.
+        """
+        def __init__(self, interval=0.5, smoothing=0.5):
+            self.interval = interval
+            # Weight of the newest reading in the exponential moving average.
+            self.smoothing = smoothing
+            self._lock = threading.Lock()
+            self._stop_event = threading.Event()
+            self._thread = None
+            self._tracked_pids = set()
+            self._snapshot = {'cpu': 0.0, 'ram': 0.0, 'worker_rss': {}, 'timestamp': 0.0}
+
+        def start(self):
+            if not PSUTIL_INSTALLED or (self._thread and self._thread.is_alive()):
+                return
+            import psutil
+            # Prime cpu_percent() so the first threaded reading covers a real interval,
+            # and seed RAM immediately since virtual_memory() does not block.
+            psutil.cpu_percent(interval=None)
+            with self._lock:
+                self._snapshot = {'cpu': 0.0, 'ram': psutil.virtual_memory().percent, 'worker_rss': {}, 'timestamp': time.monotonic()}
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="RemixResourceSampler", daemon=True)
+            self._thread.start()
+
+        def stop(self):
+            self._stop_event.set()
+            if self._thread and self._thread.is_alive():
+                self._thread.join(timeout=self.interval + 1.0)
+            self._thread = None
+
+        def track_pid(self, pid):
+            with self._lock:
+                self._tracked_pids.add(pid)
+
+        def untrack_pid(self, pid):
+            with self._lock:
+                self._tracked_pids.discard(pid)
+                self._snapshot['worker_rss'].pop(pid, None)
+
+        def snapshot(self):
+            """Returns a copy of the latest smoothed readings. Never blocks on psutil."""
+            with self._lock:
+                snap = dict(self._snapshot)
+                snap['worker_rss'] = dict(self._snapshot['worker_rss'])
+            return snap
+
+        def _smooth(self, previous, current):
+            if previous is None:
+                return current
+            return previous + self.smoothing * (current - previous)
+
+        def _run(self):
+            import psutil
+            processes = {}
+            while not self._stop_event.wait(self.interval):
+                try:
+                    # Non-blocking: measures usage since the previous call on this thread.
+                    cpu = psutil.cpu_percent(interval=None)
+                    ram = psutil.virtual_memory().percent
+
+                    with self._lock:
+                        pids = set(self._tracked_pids)
+
+                    rss_by_pid = {}
+                    for pid in pids:
+                        try:
+                            proc = processes.get(pid)
+                            if proc is None:
+                                proc = processes[pid] = psutil.Process(pid)
+                            rss_by_pid[pid] = proc.memory_info().rss
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            processes.pop(pid, None)
+                    for stale_pid in set(processes) - pids:
+                        processes.pop(stale_pid, None)
+
+                    with self._lock:
+                        previous = self._snapshot
+                        has_history = previous['timestamp'] > 0.0 and previous['cpu'] > 0.0
+                        self._snapshot = {
+                            'cpu': self._smooth(previous['cpu'] if has_history else None, cpu),
+                            'ram': self._smooth(previous['ram'], ram),
+                            'worker_rss': {
+                                pid: self._smooth(previous['worker_rss'].get(pid), rss)
+                                for pid, rss in rss_by_pid.items() if pid in self._tracked_pids
+                            },
+                            'timestamp': time.monotonic(),
+                        }
+                except Exception as e:
+                    logging.debug(f"Resource sampler iteration failed: {e}")
+
     def _collect_relevant_node_groups(start_tree, relevant_groups_set, visited_groups_set):
         """
         Recursively traverses a node tree to find all used node groups, including nested ones,
@@ -637,13 +830,18 @@ if IS_BLENDER_CONTEXT:
                 # Recurse into the found group to find any nested groups
                 _collect_relevant_node_groups(node.node_tree, relevant_groups_set, visited_groups_set)
       
-    def convert_exr_textures_to_png(context, objects_to_export, temp_files_for_cleanup):
+    def start_exr_texture_conversion(context, objects_to_export):
         """
-        [NON-DESTRUCTIVE FIX] Finds all EXR textures used in materials ON THE
-        SPECIFIED OBJECTS. Converts them to PNG on disk and returns a map of
-        {exr_path: png_path} without altering the scene's node setup.
+        [NON-DESTRUCTIVE FIX V3 - PARALLEL, CACHED, NON-BLOCKING] Finds all EXR textures
+        used in materials ON THE SPECIFIED OBJECTS without altering the scene's node
+        setup. PNGs live in a persistent cache keyed by the source's fingerprint; missing
+        ones are submitted to a process pool running remix_image_jobs (OpenImageIO) and
+        this returns right away. Returns None on error, otherwise a conversion dict whose
+        'png_map' holds the cache hits and whose 'pending' result (None if nothing was
+        submitted) the caller polls before calling finish_exr_texture_conversion.
         """
         global conversion_count
+        conversion = {'exr_images': {}, 'png_map': {}, 'jobs': [], 'pool': None, 'pending': None}
         try:
             bpy.ops.file.unpack_all(method="USE_LOCAL")
             logging.info("Starting NON-DESTRUCTIVE conversion of EXR textures to PNG.")
@@ -656,7 +854,7 @@ if IS_BLENDER_CONTEXT:
 
             if not materials_in_use:
                 logging.info("No materials found on the objects selected for export. Skipping EXR conversion.")
-                return True, {}
+                return conversion
 
             logging.info(f"Scanning {len(materials_in_use)} materials and their dependencies for export selection.")
 
@@ -669,102 +867,147 @@ if IS_BLENDER_CONTEXT:
             node_trees_to_scan = list(material_node_trees.union(relevant_node_groups))
             logging.info(f"Deep scan identified {len(node_trees_to_scan)} total relevant node trees to check.")
 
-            # --- SURGICAL CHANGE START ---
-            # This map will store the path translations without modifying scene data.
-            generated_png_map = {}
-            # --- SURGICAL CHANGE END ---
-            conversion_count = 0
-
+            # {exr_path: image datablock}, collected without touching any pixels.
+            exr_images = conversion['exr_images']
             for node_tree in node_trees_to_scan:
                 if not node_tree: continue
-                # --- SURGICAL CHANGE START ---
-                # Pass the map and cleanup list to be populated by the helper function.
-                success = process_nodes_recursively(node_tree.nodes, node_tree, context, generated_png_map, temp_files_for_cleanup)
-                if not success:
+                process_nodes_recursively(node_tree.nodes, exr_images)
+
+            conversion_count = 0
+            if not exr_images:
+                return conversion
+
+            os.makedirs(CUSTOM_EXR_CACHE_PATH, exist_ok=True)
+            lib_path = get_persistent_lib_path()
+            jobs = conversion['jobs']
+            for exr_path, image in exr_images.items():
+                high_precision = image.depth >= 64
+                png_path = remix_image_jobs.cached_png_path(CUSTOM_EXR_CACHE_PATH, exr_path, high_precision)
+                if os.path.exists(png_path):
+                    remix_image_jobs.touch(png_path)
+                    conversion['png_map'][exr_path] = png_path
+                else:
+                    jobs.append((exr_path, png_path, high_precision, lib_path))
+            logging.info(f"EXR cache: {len(conversion['png_map'])} hit(s), {len(jobs)} conversion(s) needed.")
+
+            if jobs and remix_image_jobs.exr_reader_available(lib_path):
+                ctx = multiprocessing.get_context('spawn')
+                conversion['pool'] = ctx.Pool(processes=max(1, min(len(jobs), os.cpu_count() - 1)))
+                conversion['pending'] = conversion['pool'].map_async(remix_image_jobs.convert_exr_job, jobs, chunksize=1)
+                conversion['pool'].close()
+            elif jobs:
+                logging.info("OpenImageIO is not available. Converting EXR textures through Blender.")
+            return conversion
+
+        except Exception as e:
+            logging.error(f"Error during non-destructive EXR to PNG conversion: {e}", exc_info=True)
+            abort_exr_texture_conversion(conversion)
+            return None
+
+    def finish_exr_texture_conversion(context, conversion):
+        """
+        Collects a started conversion once its 'pending' result is ready (or at once if
+        nothing was submitted). EXRs whose job failed, or every one if OpenImageIO is
+        unavailable, are converted through bpy on the main thread.
+        Returns (success, {exr_path: png_path}).
+        """
+        global conversion_count
+        try:
+            generated_png_map = conversion['png_map']
+            failed_jobs = []
+            if conversion['pending'] is not None:
+                for exr_path, png_path, error in conversion['pending'].get():
+                    if error:
+                        logging.warning(f"Parallel conversion of '{os.path.basename(exr_path)}' failed ({error}). Retrying through Blender.")
+                        failed_jobs.append((exr_path, png_path))
+                        continue
+                    logging.info(f"Converted '{os.path.basename(exr_path)}' -> '{os.path.basename(png_path)}'")
+                    generated_png_map[exr_path] = png_path
+                    conversion_count += 1
+                conversion['pool'].join()
+                conversion['pool'] = None
+            else:
+                failed_jobs = [(exr_path, png_path) for exr_path, png_path, _, _ in conversion['jobs']]
+
+            for exr_path, png_path in failed_jobs:
+                if not _convert_exr_with_blender(context, conversion['exr_images'][exr_path], exr_path, png_path):
                     return False, {}
-                # --- SURGICAL CHANGE END ---
+                generated_png_map[exr_path] = png_path
+                conversion_count += 1
+
+            if conversion['exr_images']:
+                removed = remix_image_jobs.prune_cache(CUSTOM_EXR_CACHE_PATH, keep=generated_png_map.values())
+                if removed:
+                    logging.info(f"Pruned {removed} least recently used PNG(s) from the EXR cache.")
 
             logging.info(f"Non-destructive scan complete. Converted {conversion_count} EXR textures to PNG files.")
-            # --- SURGICAL CHANGE START ---
-            # Return the map of generated files instead of a list of scene changes.
             return True, generated_png_map
-            # --- SURGICAL CHANGE END ---
 
         except Exception as e:
             logging.error(f"Error during non-destructive EXR to PNG conversion: {e}", exc_info=True)
+            abort_exr_texture_conversion(conversion)
             return False, {}
 
-    def process_nodes_recursively(nodes, node_tree, context, generated_files_map, temp_files_for_cleanup):
+    def abort_exr_texture_conversion(conversion):
+        """Stops the process pool of a conversion that will not be finished."""
+        if conversion and conversion.get('pool') is not None:
+            conversion['pool'].terminate()
+            conversion['pool'].join()
+            conversion['pool'] = None
+
+    def process_nodes_recursively(nodes, exr_images):
         """
-        [NON-DESTRUCTIVE FIX] Helper function to traverse a node tree, find
-        EXR nodes, convert them to PNG on disk, and populate a map with the results
-        WITHOUT changing the node's image property.
+        [NON-DESTRUCTIVE FIX V2] Helper function to traverse a node tree and collect
+        the EXR files its image nodes use as {exr_path: image}. Nothing is converted here.
         """
-        global conversion_count
+        for node in nodes:
+            if node.type == 'GROUP' and node.node_tree:
+                process_nodes_recursively(node.node_tree.nodes, exr_images)
+
+            elif node.type == 'TEX_IMAGE' and node.image and node.image.source == 'FILE':
+                filepath = node.image.filepath_from_user()
+                if not filepath or not filepath.lower().endswith('.exr'):
+                    continue
+
+                exr_path = bpy.path.abspath(filepath)
+                if not os.path.exists(exr_path):
+                    logging.warning(f"EXR file does not exist, skipping: {exr_path}")
+                    continue
+                exr_images.setdefault(exr_path, node.image)
+
+    def _convert_exr_with_blender(context, original_image, exr_path, png_path):
+        """Converts one EXR through a temporary image datablock on the main thread (fallback path)."""
         scene_settings = context.scene.render.image_settings
         original_color_depth = scene_settings.color_depth
         original_compression = scene_settings.compression
-
+        temp_path = f"{png_path}.tmp.png"
         try:
-            for node in nodes:
-                if node.type == 'GROUP' and node.node_tree:
-                    success = process_nodes_recursively(node.node_tree.nodes, node.node_tree, context, generated_files_map, temp_files_for_cleanup)
-                    if not success:
-                        raise RuntimeError("Recursive processing failed.")
-
-                elif node.type == 'TEX_IMAGE' and node.image and node.image.source == 'FILE':
-                    filepath = node.image.filepath_from_user()
-                    if not filepath or not filepath.lower().endswith('.exr'):
-                        continue
-
-                    exr_path = bpy.path.abspath(filepath)
-                    if not os.path.exists(exr_path):
-                        logging.warning(f"EXR file does not exist, skipping: {exr_path}")
-                        continue
-                
-                    png_path = os.path.splitext(exr_path)[0] + ".png"
-                
-                    # If the PNG already exists and is newer, skip conversion.
-                    if os.path.exists(png_path) and os.path.getmtime(png_path) >= os.path.getmtime(exr_path):
-                        generated_files_map[exr_path] = png_path
-                        continue
-
-                    logging.info(f"Converting '{os.path.basename(exr_path)}' -> '{os.path.basename(png_path)}'")
-                
-                    original_image = node.image
-
-                    if original_image.depth >= 64:
-                        scene_settings.color_depth = '16'
-                        scene_settings.compression = 0
-                    else:
-                        scene_settings.color_depth = '8'
-                        scene_settings.compression = 15
-
-                    # Perform the conversion using a temporary image datablock
-                    new_image = bpy.data.images.new(
-                        name=os.path.basename(png_path),
-                        width=original_image.size[0],
-                        height=original_image.size[1],
-                        alpha=(original_image.channels == 4),
-                        float_buffer=(original_image.depth >= 64)
-                    )
-                    new_image.pixels = original_image.pixels[:]
-                    new_image.file_format = 'PNG'
-                    new_image.filepath_raw = png_path
-                    new_image.save()
-                    bpy.data.images.remove(new_image) # Clean up the temp datablock
-
-                    # --- SURGICAL CHANGE START ---
-                    # DO NOT change the node. We only record the file that was created.
-                    # The workers will use this map to find the PNG instead of the EXR.
-                    generated_files_map[exr_path] = png_path
-                    temp_files_for_cleanup.add(png_path)
-                    # --- SURGICAL CHANGE END ---
-                    conversion_count += 1
-                
+            logging.info(f"Converting '{os.path.basename(exr_path)}' -> '{os.path.basename(png_path)}' through Blender")
+            if original_image.depth >= 64:
+                scene_settings.color_depth = '16'
+                scene_settings.compression = 0
+            else:
+                scene_settings.color_depth = '8'
+                scene_settings.compression = 15
+
+            new_image = bpy.data.images.new(
+                name=os.path.basename(png_path),
+                width=original_image.size[0],
+                height=original_image.size[1],
+                alpha=(original_image.channels == 4),
+                float_buffer=(original_image.depth >= 64)
+            )
+            pixels = np.empty(len(original_image.pixels), dtype=np.float32)
+            original_image.pixels.foreach_get(pixels)
+            new_image.pixels.foreach_set(pixels)
+            new_image.file_format = 'PNG'
+            new_image.filepath_raw = temp_path
+            new_image.save()
+            bpy.data.images.remove(new_image) # Clean up the temp datablock
+            os.replace(temp_path, png_path)
             return True
         except Exception as e:
-            logging.error(f"Error during node processing: {e}", exc_info=True)
+            logging.error(f"Error converting EXR '{exr_path}': {e}", exc_info=True)
             return False
         finally:
             scene_settings.color_depth = original_color_depth
@@ -1174,28 +1417,9 @@ if IS_BLENDER_CONTEXT:
 
         return extracted_data
 
-    def make_request_with_retries(method, url, headers=None, json_payload=None, retries=3, delay=5, **kwargs):
-        last_response = None
-        for attempt in range(1, retries + 1):
-            try:
-                logging.debug(f"Attempt {attempt}: {method} {url}")
-                response = requests.request(method, url, headers=headers, json=json_payload, timeout=60, **kwargs)
-                last_response = response
-                logging.debug(f"Response: {response.status_code} - {response.text}")
-                if response.status_code in [200, 201, 204]:
-                    return response
-                else:
-                    logging.warning(f"Attempt {attempt} failed with status {response.status_code}")
-            except requests.exceptions.RequestException as e:
-                logging.warning(f"Attempt {attempt} encountered exception: {e}")
-                # For network errors, last_response remains None or the last http error response
-    
-        if last_response is not None:
-             logging.error(f"All {retries} attempts failed for {method} {url}. Last status: {last_response.status_code}")
-        else:
-             logging.error(f"All {retries} attempts failed for {method} {url}. No response from server (network error).")
-
-        return last_response # Return the last response object, even if it's an error
+    def make_request_with_retries(method, url, headers=None, json_payload=None, retries=3, delay=remix_http.DEFAULT_BACKOFF_BASE, **kwargs):
+        """Sends a toolkit server request on the pooled session layer; see remix_http.request_with_retries."""
+        return remix_http.request_with_retries(method, url, headers=headers, json_payload=json_payload, retries=retries, delay=delay, **kwargs)
 
     def get_blend_filename():
         blend_file = bpy.path.basename(bpy.data.filepath)
@@ -1249,12 +1473,15 @@ if IS_BLENDER_CONTEXT:
             logging.error(f"Error flipping normals for object '{obj.name}': {e}")
             print(f"Error flipping normals for object '{obj.name}': {e}")
         
-    def fetch_selected_mesh_prim_paths():
+    def fetch_selected_mesh_prim_paths(prim_paths=None):
         """
         Fetches the list of currently-selected mesh prim paths from the Remix server.
         Returns a list of paths (each with a single leading slash) under "/meshes/".
         Falls back to a default server URL if addon preferences are unavailable.
+        Pass `prim_paths` (an already fetched selection listing) to skip the request.
         """
+        if prim_paths is not None:
+            return remix_server_flows.mesh_prim_paths(prim_paths)
         try:
             # Default in case preferences aren't accessible
             server_url_base = "http://localhost:8011/stagecraft"
@@ -1266,12 +1493,12 @@ if IS_BLENDER_CONTEXT:
                 addon_prefs = context.preferences.addons[__name__].preferences
                 server_url_base = addon_prefs.remix_server_url.rstrip('/')
                 verify_ssl_cert = addon_prefs.remix_verify_ssl
-                url = f"{server_url_base}/assets/?selection=true&filter_session_assets=false&exists=true"
             except (AttributeError, KeyError):
                 logging.warning(
                     "fetch_selected_mesh_prim_paths: Could not get addon_prefs from context. Using default URL."
                 )
-                url = f"{server_url_base}/assets/?selection=true&filter_session_assets=false&exists=true"
+            # Same query as the operator's pre-flight check, whose listing is passed in as `prim_paths`.
+            url = remix_prim_index.assets_url(server_url_base, selection=True)
 
             headers = {'accept': 'application/lightspeed.remix.service+json; version=1.0'}
             response = make_request_with_retries('GET', url, headers=headers, verify=verify_ssl_cert)
@@ -1420,189 +1647,83 @@ if IS_BLENDER_CONTEXT:
         except Exception as e:
             logging.error(f"Error attaching original textures: {e}", exc_info=True)
 
-    def select_mesh_prim_in_remix(reference_prim, context):
+    def server_settings_snapshot(context):
+        """
+        Plain copy of the server preferences, for network stages that run off the
+        main thread (bpy data must not be read there).
+        """
         addon_prefs = context.preferences.addons[__name__].preferences
-        try:
-            encoded_prim = urllib.parse.quote(reference_prim, safe='')
-            url = f"{addon_prefs.remix_server_url.rstrip('/')}/assets/selection/{encoded_prim}"
-            headers = {
-                'accept': 'application/lightspeed.remix.service+json; version=1.0'
-            }
-
-            logging.info(f"Selecting mesh prim at: {url}")
-            print(f"Selecting mesh prim at: {url}")
-
-            response = make_request_with_retries(
-                'PUT',
-                url,
-                headers=headers,
-                verify=addon_prefs.remix_verify_ssl
-            )
-
-            if response and response.status_code in [200, 204]:
-                logging.info("Mesh prim selected successfully.")
-                return True
-            else:
-                status = response.status_code if response else 'No Response'
-                response_text = response.text if response else 'No Response'
-                logging.error(f"Failed to select mesh prim. Status: {status}, Response: {response_text}")
-                print(f"Failed to select mesh prim. Status: {status}, Response: {response_text}")
-                return False
-        except Exception as e:
-            logging.error(f"Error selecting mesh prim: {e}")
-            print(f"Error selecting mesh prim: {e}")
-            return False
+        return SimpleNamespace(
+            remix_server_url=addon_prefs.remix_server_url,
+            remix_export_url=addon_prefs.remix_export_url,
+            remix_ingest_directory=addon_prefs.remix_ingest_directory,
+            remix_verify_ssl=addon_prefs.remix_verify_ssl,
+        )
 
-    def handle_special_texture_assignments(self, context, reference_prim, export_data=None):
+    def detached_context(context):
         """
-        [DEFINITIVE V18 - CORRECTED DATA LOOKUP & BATCHED INGEST]
-        This version fixes the logical flaw where special texture information was stored
-        by an (object, material) key but retrieved only by material. It now reorganizes
-        the data purely by material for correct lookup. It also introduces batched
-        ingestion to handle large numbers of textures without server timeouts, processing
-        them in chunks of 5 before performing a single final assignment operation.
+        Stand-in for `context` in the network helpers, which only read
+        context.preferences.addons[__name__].preferences. The preferences are copied
+        into plain values, so a background thread never touches bpy data and later
+        edits in the preferences window do not leak into a running upload.
         """
         addon_prefs = context.preferences.addons[__name__].preferences
-    
-        try:
-            logging.info("--- Starting Special Texture Assignment (Corrected Data Lookup & Batched Ingest) ---")
-
-            final_mtl_name_map = (export_data or {}).get("material_name_map", {})
-            special_texture_info_by_obj_mat = (export_data or {}).get('bake_info', {}).get('special_texture_info', {})
-
-            if not special_texture_info_by_obj_mat:
-                logging.info("No special textures to process.")
-                return {'FINISHED'}
-
-            # --- Reorganize the data (No change from previous version) ---
-            # Create a new dictionary keyed ONLY by the original material name.
-            assignments_by_original_mat_name = defaultdict(list)
-            for (obj_name, mat_name), texture_list in special_texture_info_by_obj_mat.items():
-                for texture_data in texture_list:
-                     assignments_by_original_mat_name[mat_name].append(texture_data)
-
-            textures_for_ingest = []
-            ingest_dir_server = addon_prefs.remix_ingest_directory.rstrip('/\\')
-            server_textures_output_dir = os.path.join(ingest_dir_server, "textures").replace('\\', '/')
-
-            SPECIAL_TEXTURE_MAP = {
-                "HEIGHT": "height_texture",
-                "EMISSIVE": "emissive_mask_texture",
-                "ANISOTROPY": "anisotropy_texture",
-                "TRANSMITTANCE": "transmittance_texture",
-                "SINGLE_SCATTERING": "subsurface_color_texture",
-                "MEASUREMENT_DISTANCE": "subsurface_radius_texture"
-            }
-
-            # This loop builds the complete list of files to upload
-            for mat_name, texture_list in assignments_by_original_mat_name.items():
-                for texture_data in texture_list:
-                    local_path, tex_type = texture_data.get('path'), texture_data.get('type')
-                    if not (local_path and tex_type and os.path.exists(local_path)):
-                        continue
-                
-                    # Add to the upload list and update the server path in our assignment dictionary
-                    textures_for_ingest.append([local_path, tex_type.upper()])
-                    base_name = os.path.splitext(os.path.basename(local_path))[0]
-                    server_path = os.path.join(server_textures_output_dir, f"{base_name}.{tex_type[0].lower()}.rtex.dds").replace('\\', '/')
-                    texture_data['server_path'] = server_path # Add the final server path back to the dict
-                    texture_data['usd_input'] = SPECIAL_TEXTURE_MAP.get(tex_type)
-
-            if not textures_for_ingest:
-                logging.warning("No valid special textures found to upload.")
-                return {'FINISHED'}
-
-            base_api_url = addon_prefs.remix_export_url.rstrip('/')
-            base_ingest_payload = { "executor": 1, "name": "Material(s)", "context_plugin": { "name": "TextureImporter", "data": { "allow_empty_input_files_list": True, "channel": "Default", "context_name": "ingestcraft", "cook_mass_template": True, "create_context_if_not_exist": True, "create_output_directory_if_missing": True, "data_flows": [ { "channel": "Default", "name": "InOutData", "push_input_data": True, "push_output_data": False } ], "default_output_endpoint": "/stagecraft/assets/default-directory", "expose_mass_queue_action_ui": False, "expose_mass_ui": True, "global_progress_value": 0, "hide_context_ui": True, "input_files": [], "output_directory": "", "progress": [ 0, "Initializing", True ] } }, "check_plugins": [ { "name": "MaterialShaders", "selector_plugins": [ { "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "select_from_root_layer_only": False }, "name": "AllMaterials" } ], "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "ignore_not_convertable_shaders": False, "progress": [ 0, "Initializing", True ], "save_on_fix_failure": True, "shader_subidentifiers": { "AperturePBR_Opacity": ".*" } }, "stop_if_fix_failed": True, "context_plugin": { "data": { "channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [ 0, "Initializing", True ], "save_on_exit": False }, "name": "CurrentStage" } }, { "name": "ConvertToOctahedral", "selector_plugins": [ { "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "select_from_root_layer_only": False }, "name": "AllShaders" } ], "resultor_plugins": [ { "data": { "channel": "cleanup_files_normal", "cleanup_input": True, "cleanup_output": False, "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ] }, "name": "FileCleanup" } ], "data": { "channel": "Default", "conversion_args": { "inputs:normalmap_texture": { "encoding_attr": "inputs:encoding", "replace_suffix": "_Normal", "suffix": "_OTH_Normal" } }, "cook_mass_template": False, "data_flows": [ { "channel": "cleanup_files_normal", "name": "InOutData", "push_input_data": True, "push_output_data": True } ], "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "replace_udim_textures_by_empty": False, "save_on_fix_failure": True }, "stop_if_fix_failed": True, "context_plugin": { "data": { "channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [ 0, "Initializing", True ], "save_on_exit": False }, "name": "CurrentStage" } }, { "name": "ConvertToDDS", "selector_plugins": [ { "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "select_from_root_layer_only": False }, "name": "AllShaders" } ], "resultor_plugins": [ { "data": { "channel": "cleanup_files", "cleanup_input": True, "cleanup_output": False, "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ] }, "name": "FileCleanup" } ], "data": { "channel": "Default", "conversion_args": { "inputs:diffuse_texture": { "args": [ "--format", "bc7", "--mip-gamma-correct" ] }, "inputs:emissive_mask_texture": { "args": [ "--format", "bc7", "--mip-gamma-correct" ] }, "inputs:height_texture": { "args": [ "--format", "bc4", "--no-mip-gamma-correct", "--mip-filter", "max" ] }, "inputs:metallic_texture": { "args": [ "--format", "bc4", "--no-mip-gamma-correct" ] }, "inputs:normalmap_texture": { "args": [ "--format", "bc5", "--no-mip-gamma-correct" ] }, "inputs:reflectionroughness_texture": { "args": [ "--format", "bc4", "--no-mip-gamma-correct" ] }, "inputs:transmittance_texture": { "args": [ "--format", "bc7", "--mip-gamma-correct" ] }, "inputs:subsurface_color_texture": {"args": ["--format", "bc7", "--mip-gamma-correct"]}, "inputs:subsurface_radius_texture": {"args": ["--format", "bc4", "--no-mip-gamma-correct"]} }, "cook_mass_template": False, "data_flows": [ { "channel": "cleanup_files", "name": "InOutData", "push_input_data": True, "push_output_data": True }, { "channel": "write_metadata", "name": "InOutData", "push_input_data": False, "push_output_data": True }, { "channel": "ingestion_output", "name": "InOutData", "push_input_data": False, "push_output_data": True } ], "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "replace_udim_textures_by_empty": False, "save_on_fix_failure": True, "suffix": ".rtex.dds" }, "stop_if_fix_failed": True, "context_plugin": { "data": { "channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [ 0, "Initializing", True ], "save_on_exit": False }, "name": "CurrentStage" } }, { "name": "MassTexturePreview", "selector_plugins": [ { "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "select_from_root_layer_only": False }, "name": "Nothing" } ], "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": True, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "save_on_fix_failure": True }, "stop_if_fix_failed": True, "context_plugin": { "data": { "channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [ 0, "Initializing", True ], "save_on_exit": False }, "name": "CurrentStage" } } ], "resultor_plugins": [ { "name": "FileMetadataWritter", "data": { "channel": "write_metadata", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ] } } ] }
-            
-            # --- SURGICAL CHANGE START ---
-            import copy
-            
-            BATCH_SIZE = 5
-            total_textures = len(textures_for_ingest)
-            logging.info(f"Ingesting {total_textures} total special textures in batches of {BATCH_SIZE}...")
-            
-            # Loop through the master list in chunks of BATCH_SIZE
-            for i in range(0, total_textures, BATCH_SIZE):
-                batch = textures_for_ingest[i:i + BATCH_SIZE]
-                batch_number = (i // BATCH_SIZE) + 1
-                total_batches = (total_textures + BATCH_SIZE - 1) // BATCH_SIZE
-                
-                logging.info(f"  > Processing Ingest Batch {batch_number}/{total_batches} ({len(batch)} textures)...")
-                
-                # Create a deep copy of the payload for this specific batch
-                ingest_payload = copy.deepcopy(base_ingest_payload)
-                
-                # Set the dynamic data for this batch
-                ingest_payload["context_plugin"]["data"]["input_files"] = batch
-                ingest_payload["context_plugin"]["data"]["output_directory"] = server_textures_output_dir
-
-                # Send the request for the current batch
-                ingest_response = make_request_with_retries(
-                    'POST', 
-                    f"{base_api_url}/material", 
-                    json_payload=ingest_payload, 
-                    verify=addon_prefs.remix_verify_ssl
-                )
-                
-                # If any batch fails, abort the entire operation
-                if not ingest_response or ingest_response.status_code >= 400:
-                    logging.error(f"    - Ingest Batch {batch_number} FAILED. Aborting special texture assignment.")
-                    return {'CANCELLED'}
-            
-            logging.info("All special texture ingest batches completed successfully.")
-            # --- SURGICAL CHANGE END ---
-
-            stagecraft_api_url_base = addon_prefs.remix_server_url.rstrip('/')
-            all_inputs_url = f"{stagecraft_api_url_base}/textures/?selection=true&filter_session_prims=false&exists=true"
-            all_inputs_response = make_request_with_retries('GET', all_inputs_url, headers={'accept': 'application/lightspeed.remix.service+json; version=1.0'}, verify=addon_prefs.remix_verify_ssl)
-            if not all_inputs_response or all_inputs_response.status_code != 200: return {'CANCELLED'}
-
-            server_mat_name_to_prim_map = {}
-            for prim_path, _ in all_inputs_response.json().get("textures", []):
-                try:
-                    if "/Looks/" in prim_path:
-                        base_shader_path, _ = prim_path.rsplit('.inputs:', 1)
-                        material_name_from_server = base_shader_path.rsplit('/Looks/', 1)[-1].split('/')[0]
-                        if material_name_from_server not in server_mat_name_to_prim_map:
-                            server_mat_name_to_prim_map[material_name_from_server] = base_shader_path
-                except ValueError: continue
-        
-            # This final lookup loop is now correct and runs once after all ingests
-            final_put_payload_list = []
-            for original_blender_name, assignments_list in assignments_by_original_mat_name.items():
-                final_exported_name = final_mtl_name_map.get(original_blender_name)
-                if not final_exported_name:
-                    logging.warning(f"  Could not find a temporary name mapping for '{original_blender_name}'.")
-                    continue
-
-                sanitized_name_to_find = final_exported_name.replace('-', '_')
-                server_shader_prim = server_mat_name_to_prim_map.get(sanitized_name_to_find)
-            
-                if server_shader_prim:
-                    logging.info(f"  SUCCESS: Matched Blender material '{original_blender_name}' to server prim '{server_shader_prim}' using sanitized name '{sanitized_name_to_find}'.")
-                    for assignment in assignments_list:
-                        if assignment.get('usd_input') and assignment.get('server_path'):
-                            final_put_payload_list.append([f"{server_shader_prim}.inputs:{assignment['usd_input']}", assignment['server_path']])
-                else:
-                     logging.warning(f"  FAILED: Could not find server prim for sanitized name '{sanitized_name_to_find}'. Available server names: {list(server_mat_name_to_prim_map.keys())}")
-
-            if not final_put_payload_list:
-                logging.warning("Assignment payload is empty after matching. No special textures will be assigned.")
-                return {'FINISHED'}
-
-            update_texture_connection_url = f"{stagecraft_api_url_base}/textures/"
-            put_payload = {"force": False, "textures": final_put_payload_list}
-            put_response = make_request_with_retries('PUT', update_texture_connection_url, json_payload=put_payload, headers={"accept": "application/lightspeed.remix.service+json; version=1.0", "Content-Type": "application/lightspeed.remix.service+json; version=1.0"}, verify=addon_prefs.remix_verify_ssl)
-        
-            if not put_response or put_response.status_code >= 400: return {'CANCELLED'}
-
-            logging.info("--- Finished Special Texture Assignment Successfully ---")
-            return {'FINISHED'}
+        values = {}
+        for prop in addon_prefs.bl_rna.properties:
+            if prop.identifier == 'rna_type' or prop.type in {'POINTER', 'COLLECTION'}:
+                continue
+            value = getattr(addon_prefs, prop.identifier)
+            values[prop.identifier] = tuple(value) if getattr(prop, 'is_array', False) else value
+        prefs = SimpleNamespace(**values)
+        return SimpleNamespace(preferences=SimpleNamespace(addons={__name__: SimpleNamespace(preferences=prefs)}))
 
-        except Exception as e:
-            logging.error(f"A critical error occurred: {e}", exc_info=True)
-            return {'CANCELLED'}
+    def ingest_special_textures(settings, export_data=None):
+        """
+        [DEFINITIVE V20 - SHARED CONCURRENT ADAPTIVE INGEST]
+        Ingests the export's special textures (height, emissive, ...) through
+        remix_server_flows.ingest_special_textures. Special texture information is
+        stored by an (object, material) key; it is reorganized purely by material for
+        the later lookup. Touches no bpy data, so it can run on a thread while the
+        model is ingested; `settings` comes from server_settings_snapshot().
+        Returns {'status', 'assignments', 'failed_count', ...} for handle_special_texture_assignments.
+        """
+        logging.info("--- Starting Special Texture Ingest (Concurrent Batches) ---")
+        special_texture_info_by_obj_mat = (export_data or {}).get('bake_info', {}).get('special_texture_info', {})
+        if not special_texture_info_by_obj_mat:
+            logging.info("No special textures to process.")
+            return {'status': 'FINISHED', 'assignments': {}, 'failed_count': 0}
+
+        # Create a new dictionary keyed ONLY by the original material name.
+        assignments_by_original_mat_name = defaultdict(list)
+        for (obj_name, mat_name), texture_list in special_texture_info_by_obj_mat.items():
+            for texture_data in texture_list:
+                 assignments_by_original_mat_name[mat_name].append(texture_data)
+
+        # --- TIMING START: Special Texture Ingest ---
+        ingest_start_time = time.perf_counter()
+        result = remix_server_flows.ingest_special_textures(settings, assignments_by_original_mat_name, CUSTOM_INGEST_MANIFEST_PATH)
+        logging.info(f"TIMING: Special texture ingest took {time.perf_counter() - ingest_start_time:.4f} seconds "
+                     f"({result['ingested_count']} ingested, {result['reused_count']} reused, {result['duplicate_count']} shared).")
+        # --- TIMING END ---
+        return result
+
+    def handle_special_texture_assignments(self, context, reference_prim, export_data=None, ingest_result=None):
+        """
+        Connects the ingested special textures to the exported materials' shaders with
+        a single texture PUT. Needs the model to be placed in the project already.
+        `ingest_result` comes from ingest_special_textures (run in the background
+        during finalization); without it the ingest runs here first.
+        """
+        addon_prefs = context.preferences.addons[__name__].preferences
+        if ingest_result is None:
+            ingest_result = ingest_special_textures(server_settings_snapshot(context), export_data)
+        if ingest_result['failed_count']:
+            self.report({'WARNING'}, f"{ingest_result['failed_count']} special texture(s) failed to ingest. See console.")
+        if ingest_result['status'] != 'FINISHED' or not ingest_result['assignments']:
+            return {ingest_result['status']}
+
+        final_mtl_name_map = (export_data or {}).get("material_name_map", {})
+        return {remix_server_flows.assign_special_textures(addon_prefs, final_mtl_name_map, ingest_result['assignments'])}
             
     def _stable_repr(value):
         """Creates a stable, repeatable string representation for various data types."""
@@ -2180,49 +2301,15 @@ if IS_BLENDER_CONTEXT:
             total_start_time = time.perf_counter()
 
             try:
-                # --- Step 1: Fetch prim paths from Remix server ---
-                assets_url = f"{addon_prefs.remix_server_url.rstrip('/')}/assets/?selection=true&filter_session_assets=false&exists=true"
-                response = make_request_with_retries('GET', assets_url, headers={'accept': 'application/lightspeed.remix.service+json; version=1.0'}, verify=addon_prefs.remix_verify_ssl)
-                if not response or response.status_code != 200:
+                # --- Steps 1 & 2: Resolve the Remix selection to local USD file paths ---
+                usd_files_to_import, base_dir_for_textures = remix_server_flows.fetch_selected_usd_files(addon_prefs)
+                if usd_files_to_import is None:
                     self.report({'ERROR'}, "Failed to connect to Remix server for asset list.")
                     return {'CANCELLED'}
-
-                data = response.json()
-                prim_paths = data.get("prim_paths", data.get("asset_paths", []))
-                mesh_prim_paths = [path for path in prim_paths if "/meshes/" in path.lower()]
-
-                if not mesh_prim_paths:
+                if base_dir_for_textures is None:
                     self.report({'WARNING'}, "No mesh assets found in Remix server selection.")
                     return {'CANCELLED'}
 
-                # --- Step 2: Resolve prim paths to local USD file paths ---
-                first_mesh_path = mesh_prim_paths[0]
-                segments = first_mesh_path.strip('/').split('/')
-                if len(segments) < 3:
-                    raise RuntimeError(f"Cannot determine reference prim from path: {first_mesh_path}")
-
-                ref_prim_for_path_api = '/' + '/'.join(segments[:3])
-                encoded_ref_prim = urllib.parse.quote(ref_prim_for_path_api, safe='')
-                file_paths_url = f"{addon_prefs.remix_server_url.rstrip('/')}/assets/{encoded_ref_prim}/file-paths"
-
-                response_files = make_request_with_retries('GET', file_paths_url, headers={'accept': 'application/lightspeed.remix.service+json; version=1.0'}, verify=addon_prefs.remix_verify_ssl)
-                if not response_files or response_files.status_code != 200:
-                    raise RuntimeError("Failed to retrieve file paths for selected prims.")
-
-                file_data = response_files.json()
-                try:
-                    base_dir_source = file_data['reference_paths'][0][1][1]
-                    base_dir_for_textures = os.path.dirname(base_dir_source).replace('\\', '/')
-                except (IndexError, KeyError, TypeError):
-                    raise RuntimeError("Could not determine base directory from server response.")
-
-                usd_files_to_import = []
-                for mesh_path in mesh_prim_paths:
-                    mesh_name = mesh_path.strip('/').split('/')[2]
-                    usd_path = os.path.join(base_dir_for_textures, "meshes", f"{mesh_name}.usd").replace('\\', '/')
-                    if os.path.exists(usd_path) and usd_path not in usd_files_to_import:
-                        usd_files_to_import.append(usd_path)
-
                 if not usd_files_to_import:
                     self.report({'INFO'}, "No valid USD files found on disk for the Remix selection.")
                     return {'FINISHED'}
@@ -2368,6 +2455,19 @@ if IS_BLENDER_CONTEXT:
         bl_label = "Export and Ingest (Dynamic Workers)"
         bl_options = {'REGISTER', 'UNDO'}
 
+        resume: BoolProperty(
+            name="Resume",
+            description="Reuse bakes that completed in the last interrupted export of this file and only bake the rest",
+            default=False,
+            options={'SKIP_SAVE'}
+        )
+        headless: BoolProperty(
+            name="Headless",
+            description="Run without a window (background mode): the modal loop is driven in place and idle workers are kept for the next export",
+            default=False,
+            options={'SKIP_SAVE', 'HIDDEN'}
+        )
+
         # --- Operator State Variables ---
         _timer = None
         _op_lock: Lock = None
@@ -2378,8 +2478,54 @@ if IS_BLENDER_CONTEXT:
         _worker_slots: list = []
         _master_task_queue: collections.deque = None
         _comm_threads: list = []
-        _results_queue: Queue = None
         _log_queue: Queue = None
+        # Set by _cleanup so reader threads stop waiting for _op_lock.
+        _shutdown_event: threading.Event = None
+        # A task that hangs or crashes its worker this many times is marked as failed.
+        MAX_TASK_ATTEMPTS: int = 3
+        _hang_timeout_sec: float = remix_ipc.HANG_TIMEOUT_SEC
+        # Worker recycling limits (0 = off) and workers that were asked to quit after
+        # their last task, as (process, quit_time). Reaped by _check_worker_health.
+        _worker_max_rss_bytes: int = 0
+        _worker_max_tasks: int = 0
+        _retiring_workers: list = []
+        # Seconds a recycled worker gets to exit on its own before it is killed.
+        RETIRE_GRACE_SEC: float = 10.0
+
+        # Edge length of the solid textures written for constant channels.
+        CONSTANT_TEXTURE_SIZE: int = 4
+        # Durable record of this export's tasks; see remix_export_journal.
+        _journal = None
+        # Per-phase timings reported by workers with each result; see remix_bake_telemetry.
+        _telemetry = None
+        # Content version of the texture translation map sent to workers once each.
+        _texture_map_version = None
+        # Post-bake compositing: a bounded pool, mat_hash -> (consumed map names, future),
+        # and the per-material countdown that lets a material's job start early.
+        COMPOSITE_WORKERS: int = max(1, min(4, (os.cpu_count() or 2) - 1))
+        _composite_pool = None
+        _composite_futures: dict = {}
+        _material_tasks_remaining: dict = {}
+        _materials_with_failures: set = set()
+        # Remix selection seen by the pre-flight check, and the full prim index fetched
+        # in the background meanwhile; both are reused by replace/append at the end.
+        _selected_prim_paths = None
+        _prim_index_future = None
+        # Background upload started by _finalize_export(background=True); modal() polls it
+        # in the 'UPLOADING' state. Reports from that thread wait in _pending_reports.
+        _upload_future = None
+        # True once _finalize_export gave the scene back for a background upload.
+        _scene_handed_back: bool = False
+        _upload_stage: str = ""
+        _upload_start_time: float = 0.0
+        _pending_reports: list = []
+        # Shared secret sent in the HELLO to remote bake agents (bake_agent_token preference).
+        _bake_agent_token: str = ""
+        # Sleep between emulated timer ticks in headless runs (matches the window timer).
+        HEADLESS_TICK_SEC: float = 0.1
+        # EXR conversion started by execute(); modal() collects it in the 'CONVERTING_EXR' state.
+        _exr_conversion = None
+        _exr_conv_start_time: float = 0.0
         _total_tasks: int = 0
         _finished_tasks: int = 0
         _failed_tasks: int = 0
@@ -2395,6 +2541,9 @@ if IS_BLENDER_CONTEXT:
         # Time in seconds between dynamic scaling decisions. A longer interval reduces sensitivity.
         RESOURCE_CHECK_INTERVAL_SEC: float = 0.5 
         _next_resource_check_time: float = 0.0
+        # Background sampler feeding _get_system_resources(). It samples at the same
+        # cadence as the scaling decisions so every check sees a fresh reading.
+        _resource_sampler: 'SystemResourceSampler' = None
     
         # How many consecutive checks must be "high" before scaling down.
         # 20 checks * 0.5 sec/check = 10 seconds of sustained high usage.
@@ -2417,21 +2566,108 @@ if IS_BLENDER_CONTEXT:
         COOLDOWN_DURATION_SEC: int = 10 # Seconds to wait before making another scaling decision
         # --- SURGICAL CHANGE END ---
     
-        def _communication_thread_target(self, worker_process):
-            """Dedicated thread to read stdout from a single worker."""
+        def _communication_thread_target(self, worker_process, slot_index):
+            """
+            Dedicated thread to read framed messages from a single worker's stdout.
+            Messages are handled right here as they arrive, so a finished worker is
+            handed its next task immediately instead of waiting for the modal timer.
+            Lines that are not protocol frames are Blender's own console output.
+            Messages go to whichever operator currently owns the worker (WORKER_ROUTES):
+            a worker parked by a headless export keeps this thread, and the next
+            export that adopts it receives its messages.
+            """
             if not worker_process or not worker_process.stdout: return
             try:
                 for line in iter(worker_process.stdout.readline, ''):
-                    if line: self._results_queue.put(line.strip())
-            except Exception: pass
+                    message = remix_ipc.decode_frame(line)
+                    if message is None:
+                        continue
+                    owner, slot_index = WORKER_ROUTES.get(worker_process, (None, slot_index))
+                    if owner is None:
+                        continue  # Parked between exports.
+                    # Never block forever on the lock: _cleanup holds it while joining us.
+                    acquired = False
+                    while not owner._shutdown_event.is_set():
+                        if owner._op_lock.acquire(timeout=0.2):
+                            acquired = True
+                            break
+                    if not acquired:
+                        continue
+                    try:
+                        if not owner._shutdown_event.is_set():
+                            owner._handle_worker_message(slot_index, worker_process, message)
+                    finally:
+                        owner._op_lock.release()
+            except Exception as e:
+                logging.error(f"Communication thread for slot {slot_index} failed: {e}", exc_info=True)
 
         def _log_thread_target(self, worker_process):
             """Dedicated thread to read stderr from a single worker for live logging."""
             if not worker_process or not worker_process.stderr: return
             try:
                 for line in iter(worker_process.stderr.readline, ''):
-                    if line: self._log_queue.put(line.strip())
+                    owner, _ = WORKER_ROUTES.get(worker_process, (None, None))
+                    if line and owner is not None: owner._log_queue.put(line.strip())
             except Exception: pass
+
+        def _adopt_parked_worker(self, slot_index):
+            """
+            Gives a worker parked by a previous headless export to this slot. The
+            worker already reported READY, so the slot can take a task right away.
+            Returns False when no live parked worker is available.
+            """
+            slot = self._worker_slots[slot_index]
+            while PARKED_WORKERS:
+                parked = PARKED_WORKERS.pop()
+                worker = parked['process']
+                if worker.poll() is not None:
+                    if worker in ACTIVE_WORKER_PROCESSES:
+                        ACTIVE_WORKER_PROCESSES.remove(worker)
+                    continue
+
+                now = time.monotonic()
+                slot['process'] = worker
+                slot['status'] = 'ready'
+                slot['launch_time'] = now
+                slot['ready_time'] = now
+                slot['last_message_time'] = now
+                slot['current_phase'] = None
+                slot['threads'] = parked['threads']
+                slot['tasks_completed'] = parked.get('tasks_completed', 0)
+                WORKER_ROUTES[worker] = (self, slot_index)
+                self._comm_threads.extend(parked['threads'])
+                if self._resource_sampler is not None:
+                    self._resource_sampler.track_pid(worker.pid)
+                logging.info(f"→ Reusing parked worker (PID: {worker.pid}) for slot {slot_index}.")
+                self._dispatch_to_slot(slot_index)
+                return True
+            return False
+
+        def _park_idle_workers(self):
+            """
+            Headless runs: moves live, idle local workers out of their slots into
+            PARKED_WORKERS instead of terminating them, so the next export in the
+            same session reuses them. Called by _shut_down_workers once the shutdown event
+            is set; an idle worker sends nothing but heartbeats, so no message is lost.
+            """
+            for slot in self._worker_slots:
+                worker = slot.get('process')
+                if slot.get('remote') or worker is None or worker.poll() is not None:
+                    continue
+                if slot['status'] not in ['ready', 'standby'] or slot.get('current_task'):
+                    continue
+                threads = slot.get('threads', [])
+                for thread in threads:
+                    if thread in self._comm_threads:
+                        self._comm_threads.remove(thread)
+                WORKER_ROUTES.pop(worker, None)
+                if self._resource_sampler is not None:
+                    self._resource_sampler.untrack_pid(worker.pid)
+                PARKED_WORKERS.append({'process': worker, 'threads': threads, 'tasks_completed': slot['tasks_completed']})
+                slot['process'] = None
+                slot['status'] = 'idle'
+            if PARKED_WORKERS:
+                logging.info(f"Keeping {len(PARKED_WORKERS)} idle worker(s) alive for the next headless export.")
                        
         
         def _launch_new_worker(self, slot_index):
@@ -2448,6 +2684,13 @@ if IS_BLENDER_CONTEXT:
             
             if slot['process'] is not None and slot['process'].poll() is None: return
 
+            if slot.get('remote'):
+                self._connect_remote_worker(slot_index)
+                return
+
+            if self._adopt_parked_worker(slot_index):
+                return
+
             lib_path = get_persistent_lib_path()
             if not lib_path:
                 logging.error("CRITICAL: Could not get persistent library path. Cannot launch workers.")
@@ -2480,16 +2723,22 @@ if IS_BLENDER_CONTEXT:
                     bufsize=1
                 )
                 ACTIVE_WORKER_PROCESSES.append(worker)
+                if self._resource_sampler is not None:
+                    self._resource_sampler.track_pid(worker.pid)
         
                 slot['process'] = worker
                 slot['status'] = 'launching'
                 slot['launch_time'] = time.monotonic()
 
-                comm_thread = threading.Thread(target=self._communication_thread_target, args=(worker,), daemon=True)
+                slot['last_message_time'] = slot['launch_time']
+                slot['current_phase'] = None
+                WORKER_ROUTES[worker] = (self, slot_index)
+                comm_thread = threading.Thread(target=self._communication_thread_target, args=(worker, slot_index), daemon=True)
                 log_thread = threading.Thread(target=self._log_thread_target, args=(worker,), daemon=True)
                 comm_thread.start()
                 log_thread.start()
-                self._comm_threads.extend([comm_thread, log_thread])
+                slot['threads'] = [comm_thread, log_thread]
+                self._comm_threads.extend(slot['threads'])
 
                 # --- [REMOVED] ---
                 # The initial load command is no longer sent. The worker will start,
@@ -2501,6 +2750,68 @@ if IS_BLENDER_CONTEXT:
                 logging.error(f"Could not launch worker for slot {slot_index}: {e}", exc_info=True)
                 slot['status'] = 'failed'            
         
+        def _connect_remote_worker(self, slot_index):
+            """
+            Opens a worker slot on a remote bake agent. The connection object behaves
+            like the Popen of a local worker, so the same reader threads, dispatch and
+            health checks drive it. The connect and HELLO exchange run on their own
+            thread, without _op_lock, while the slot waits in 'connecting'; an
+            unreachable agent leaves the slot 'failed'. Caller must hold _op_lock.
+            """
+            slot = self._worker_slots[slot_index]
+            host, port = slot['remote']
+            token = self._bake_agent_token
+            slot['status'] = 'connecting'
+            logging.info(f"→ Connecting slot {slot_index} to remote bake agent {host}:{port}...")
+            threading.Thread(
+                target=self._remote_connect_thread_target, args=(slot_index, host, port, token),
+                name=f"RemixAgentConnect-{slot_index}", daemon=True
+            ).start()
+
+        def _remote_connect_thread_target(self, slot_index, host, port, token):
+            try:
+                worker = remix_bake_agent.RemoteAgentProcess(host, port, token=token)
+            except (OSError, ConnectionError) as e:
+                logging.error(f"Could not connect to bake agent {host}:{port} for slot {slot_index}: {e}")
+                worker = None
+
+            # Same wait as the reader threads: _cleanup holds the lock while it shuts down.
+            while not self._shutdown_event.is_set():
+                if self._op_lock.acquire(timeout=0.2):
+                    break
+            else:
+                if worker is not None:
+                    worker.terminate()
+                return
+            try:
+                slot = self._worker_slots[slot_index]
+                if self._shutdown_event.is_set() or slot['status'] != 'connecting':
+                    if worker is not None:
+                        worker.terminate()
+                elif worker is None:
+                    slot['status'] = 'failed'
+                else:
+                    self._install_remote_worker(slot_index, worker)
+            finally:
+                self._op_lock.release()
+
+        def _install_remote_worker(self, slot_index, worker):
+            """Puts a connected agent into its slot. Caller must hold _op_lock."""
+            slot = self._worker_slots[slot_index]
+            ACTIVE_WORKER_PROCESSES.append(worker)
+            slot['process'] = worker
+            slot['status'] = 'launching'
+            slot['launch_time'] = time.monotonic()
+            slot['last_message_time'] = slot['launch_time']
+            slot['current_phase'] = None
+            WORKER_ROUTES[worker] = (self, slot_index)
+            comm_thread = threading.Thread(target=self._communication_thread_target, args=(worker, slot_index), daemon=True)
+            log_thread = threading.Thread(target=self._log_thread_target, args=(worker,), daemon=True)
+            comm_thread.start()
+            log_thread.start()
+            slot['threads'] = [comm_thread, log_thread]
+            self._comm_threads.extend(slot['threads'])
+
         def _terminate_worker(self, slot_index):
             """
             [HYBRID SHUTDOWN V3 - CORRECTED STATUS] Gracefully shuts down a worker
@@ -2517,7 +2828,7 @@ if IS_BLENDER_CONTEXT:
                 logging.info(f"Attempting graceful shutdown for worker in slot {slot_index} (PID: {worker.pid})...")
                 try:
                     # --- Step 1: The Polite Request ---
-                    quit_command = json.dumps({"action": "quit"}) + "\n"
+                    quit_command = remix_ipc.encode_frame({"action": remix_ipc.ACTION_QUIT})
                     worker.stdin.write(quit_command)
                     worker.stdin.flush()
                     worker.stdin.close() # Signal that we're done writing
@@ -2542,6 +2853,8 @@ if IS_BLENDER_CONTEXT:
                     # --- Final Cleanup ---
                     if worker in ACTIVE_WORKER_PROCESSES:
                         ACTIVE_WORKER_PROCESSES.remove(worker)
+                    if self._resource_sampler is not None:
+                        self._resource_sampler.untrack_pid(worker.pid)
                     slot['process'] = None
                     # --- THIS IS THE FIX ---
                     # The slot is now idle and available for a new worker to be launched into it.
@@ -2967,14 +3280,16 @@ if IS_BLENDER_CONTEXT:
             """
             [NEW] Uses Pillow to composite a baked decal RGBA texture over a baked
             base albedo texture, using a baked alpha mask. Overwrites the final_output_path.
+            Runs on the compositing pool; must not touch bpy, self.report or _export_data.
+            Returns (succeeded, temp_files); the caller registers temp_files for cleanup.
             """
             if not PILLOW_INSTALLED:
                 logging.error("Pillow not installed, cannot composite decal.")
-                return False
+                return False, ()
 
             if not all(os.path.exists(p) for p in [base_albedo_path, decal_albedo_path, decal_alpha_path]):
                 logging.error("One or more paths missing for decal composite. Skipping.")
-                return False
+                return False, ()
 
             try:
                 from PIL import Image
@@ -2992,17 +3307,205 @@ if IS_BLENDER_CONTEXT:
 
                 # Composite the decal over the base using the alpha mask
                 composite_img = Image.composite(decal_img, base_img, alpha_mask)
-                composite_img.save(final_output_path, "PNG")
+                composite_img.save(final_output_path, "PNG", compress_level=remix_image_jobs.INTERMEDIATE_COMPRESS_LEVEL)
             
                 logging.info(f"    - Successfully composited decal to '{os.path.basename(final_output_path)}'")
-                # Add the intermediate decal bakes to the cleanup list
-                self._export_data['temp_files_to_clean'].add(decal_albedo_path)
-                self._export_data['temp_files_to_clean'].add(decal_alpha_path)
-                return True
+                # The intermediate decal bakes go to the cleanup list
+                return True, (decal_albedo_path, decal_alpha_path)
 
             except Exception as e:
                 logging.error(f"   - Pillow composite failed: {e}", exc_info=True)
-                return False
+                return False, ()
+
+        def _find_bake_target_socket(self, node_tree, target_socket_name):
+            """
+            Mirrors the worker's _get_socket_to_bake(): walks back from the Material
+            Output through shader inputs (diving into groups) and returns the first
+            input socket named `target_socket_name`, i.e. the socket the EMIT bake
+            would read from.
+            """
+            _, output_node = self._find_bsdf_and_output_nodes(node_tree)
+            if not output_node:
+                return None
+
+            surface = output_node.inputs.get('Surface')
+            if not surface or not surface.is_linked:
+                if target_socket_name == 'Displacement':
+                    return output_node.inputs.get('Displacement')
+                return None
+
+            queue = deque([surface.links[0].from_node])
+            visited = {queue[0]}
+            while queue:
+                current_node = queue.popleft()
+                if target_socket_name in current_node.inputs:
+                    return current_node.inputs[target_socket_name]
+
+                next_nodes = []
+                if current_node.type == 'GROUP' and current_node.node_tree:
+                    group_output = next((n for n in current_node.node_tree.nodes if n.type == 'GROUP_OUTPUT'), None)
+                    if group_output:
+                        shader_input = next((s for s in group_output.inputs if s.type == 'SHADER' and s.is_linked), None)
+                        if shader_input:
+                            next_nodes.append(shader_input.links[0].from_node)
+                next_nodes.extend(inp.links[0].from_node for inp in current_node.inputs if inp.type == 'SHADER' and inp.is_linked)
+
+                for node in next_nodes:
+                    if node not in visited:
+                        visited.add(node)
+                        queue.append(node)
+
+            if target_socket_name == 'Displacement':
+                return output_node.inputs.get('Displacement')
+            return None
+
+        def _resolve_constant_emission(self, socket, is_value_bake):
+            """
+            Returns the linear RGB an EMIT bake of `socket` would emit if it is a
+            constant, otherwise None. Constant means unlinked, or fed (optionally
+            through reroutes) by a Value node, or by an RGB node for color bakes.
+            Unlinked defaults follow the worker: value bakes average vector defaults.
+            """
+            visited = set()
+            via_reroute = False
+            while socket.is_linked:
+                link = socket.links[0]
+                if link.is_muted or not link.is_valid:
+                    return None
+                node = link.from_node
+                if node.mute or node in visited:
+                    return None
+                visited.add(node)
+
+                if node.type == 'REROUTE':
+                    socket, via_reroute = node.inputs[0], True
+                    continue
+                if node.type == 'VALUE':
+                    v = float(link.from_socket.default_value)
+                    return (v, v, v)
+                if node.type == 'RGB' and not is_value_bake:
+                    # Color -> float conversion would be needed for value bakes; leave that to Cycles.
+                    return tuple(link.from_socket.default_value[:3])
+                return None
+
+            if via_reroute:
+                return None
+            default = getattr(socket, 'default_value', None)
+            if default is None:
+                return None
+            is_array = hasattr(default, '__len__')
+            if is_value_bake:
+                v = sum(default[:3]) / 3.0 if is_array else float(default)
+                return (v, v, v)
+            if is_array and len(default) >= 3:
+                return tuple(default[:3])
+            return None
+
+        def _resolve_constant_channel_tasks(self, tasks, bake_info):
+            """
+            Detects bake tasks whose channel is a constant and writes their output as a
+            CONSTANT_TEXTURE_SIZE solid texture at the task's output path. Those tasks
+            are registered as cached textures for their material and removed from the
+            returned list, so no worker is dispatched for them.
+            """
+            if not tasks or not PILLOW_INSTALLED:
+                return tasks
+
+            from PIL import Image
+
+            remaining_tasks = []
+            resolved_count = 0
+            for task in tasks:
+                rgba = None
+                # Normal is a native bake and Displacement is a 16-bit vector bake; decal
+                # composites are multi-pass. None of them are plain constant emissions.
+                if (task.get('bake_type') == 'EMIT' and not task.get('is_decal_composite')
+                        and task['target_socket_name'] not in ('Normal', 'Displacement')):
+                    mat = bpy.data.materials.get(task['material_name'])
+                    socket = self._find_bake_target_socket(mat.node_tree, task['target_socket_name']) if mat and mat.node_tree else None
+                    emitted = self._resolve_constant_emission(socket, task.get('is_value_bake', False)) if socket else None
+                    if emitted is not None:
+                        rgba = remix_array_ops.encode_bake_rgba(emitted, task.get('is_color_data', False))
+
+                if rgba is None:
+                    remaining_tasks.append(task)
+                    continue
+
+                try:
+                    size = self.CONSTANT_TEXTURE_SIZE
+                    Image.new("RGBA", (size, size), tuple(int(c) for c in rgba)).save(task['output_path'], "PNG", compress_level=remix_image_jobs.INTERMEDIATE_COMPRESS_LEVEL)
+                except Exception as e:
+                    logging.warning(f"  - Could not write constant texture for '{task['target_socket_name']}' of '{task['material_name']}', baking instead: {e}")
+                    remaining_tasks.append(task)
+                    continue
+
+                bake_info['cached_materials'].setdefault(task['material_hash'], {})[task['target_socket_name']] = task['output_path']
+                resolved_count += 1
+                logging.info(f"  - Constant channel: '{task['target_socket_name']}' of '{task['material_name']}' = RGBA{tuple(int(c) for c in rgba)}. Skipping bake.")
+
+            if resolved_count:
+                logging.info(f"Resolved {resolved_count} constant channel(s) without baking.")
+            return remaining_tasks
+
+        def _evaluate_node_chain_tasks(self, tasks, bake_info, texture_translation_map):
+            """
+            Evaluates bake tasks whose channel is a simple image-texture chain (see
+            remix_node_eval) on the CPU instead of in Cycles. Plans are built here on
+            the main thread; the pixel work runs in a thread pool. Evaluated tasks are
+            registered as cached textures and removed from the returned list; any
+            task that cannot be evaluated is left for the workers.
+            """
+            if not tasks or not PILLOW_INSTALLED:
+                return tasks
+
+            def resolve_image_path(image):
+                mapped = texture_translation_map.get(image.name)
+                if mapped and mapped != "GHOST_DATA_UNRECOVERABLE":
+                    return mapped
+                return abspath(image.filepath_from_user())
+
+            planned, remaining_tasks = [], []
+            for task in tasks:
+                plan = None
+                if (task.get('bake_type') == 'EMIT' and not task.get('is_decal_composite')
+                        and task['target_socket_name'] not in ('Normal', 'Displacement')):
+                    obj = bpy.data.objects.get(task['object_name'])
+                    mat = bpy.data.materials.get(task['material_name'])
+                    # Unlinked image vectors sample the render-active UV map; the bake
+                    # writes through task['uv_layer']. They must be the same map.
+                    render_uv = next((uv for uv in obj.data.uv_layers if uv.active_render), None) if obj and obj.data else None
+                    if mat and mat.node_tree and render_uv and render_uv.name == task.get('uv_layer'):
+                        socket = self._find_bake_target_socket(mat.node_tree, task['target_socket_name'])
+                        plan = remix_node_eval.build_eval_plan(socket, resolve_image_path) if socket else None
+                if plan:
+                    planned.append((task, plan))
+                else:
+                    remaining_tasks.append(task)
+
+            if not planned:
+                return tasks
+
+            logging.info(f"Evaluating {len(planned)} channel(s) on the CPU instead of baking...")
+            max_workers = min(len(planned), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="remix_node_eval") as executor:
+                futures = [
+                    (task, executor.submit(
+                        remix_node_eval.evaluate_plan, plan, task['output_path'],
+                        task['resolution_x'], task['resolution_y'],
+                        task.get('is_value_bake', False), task.get('is_color_data', False)))
+                    for task, plan in planned
+                ]
+                for task, future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logging.warning(f"  - CPU evaluation failed for '{task['target_socket_name']}' of '{task['material_name']}', baking instead: {e}")
+                        remaining_tasks.append(task)
+                        continue
+                    bake_info['cached_materials'].setdefault(task['material_hash'], {})[task['target_socket_name']] = task['output_path']
+                    logging.info(f"  - CPU-evaluated '{task['target_socket_name']}' of '{task['material_name']}'. Skipping bake.")
+
+            return remaining_tasks
 
         def collect_bake_tasks(self, context, objects_to_process, export_data, exr_to_png_map=None):
             """
@@ -3263,26 +3766,58 @@ if IS_BLENDER_CONTEXT:
                                         })
                                         logging.info(f"    - Simple Material: Cached '{channel_name}' texture for special server handling.")
 
+            # --- Constant-channel short-circuit ---
+            # Channels that resolve to a single color/value are written as tiny solid
+            # textures here and never reach a worker.
+            tasks = self._resolve_constant_channel_tasks(tasks, bake_info)
+            # Channels that are an image texture through a few per-pixel nodes are
+            # computed from the source pixels with NumPy.
+            tasks = self._evaluate_node_chain_tasks(tasks, bake_info, export_data.get('texture_translation_map', {}))
+
             bake_info['tasks'] = tasks
             if tasks: logging.info(f"Generated {len(tasks)} targeted bake tasks.")
             return tasks, bake_info['cached_materials'], bake_dir, bake_info.get('special_texture_info', {})
     
         def _prepare_and_validate_textures(self, context, objects_to_export):
             """
-            [DEFINITIVE V24 - UNIFIED UDIM HANDLING]
+            [DEFINITIVE V25 - BULK PIXEL RECOVERY]
             This version fixes an issue where linked (non-packed) UDIMs were not being
             processed correctly. The logic is now restructured to first check if an
             image is a UDIM set ('TILED'). If it is, it handles both packed and linked
             cases within a dedicated block, ensuring the correct <UDIM> template path
             is always used. All non-UDIM images are handled separately.
+            Packed and generated images are read with foreach_get into NumPy buffers
+            and encoded to PNG on a thread pool. Results are cached by the image's
+            packed data (or pixel) fingerprint, so unchanged images are not re-extracted.
             """
             logging.info("Starting texture preparation (Unified UDIM Handling)...")
 
             bake_dir = CUSTOM_COLLECT_PATH
             os.makedirs(bake_dir, exist_ok=True)
+            os.makedirs(CUSTOM_IMAGE_CACHE_PATH, exist_ok=True)
             texture_translation_map = {}
             has_unrecoverable_textures = False
 
+            # image name -> (map value, [encode futures], UDIM (tile numbers, staging template)
+            # or None); resolved once all images are queued.
+            pending_recoveries = {}
+            recovered_paths = []
+            encode_workers = max(1, min(8, (os.cpu_count() or 2) - 1))
+            encode_pool = ThreadPoolExecutor(max_workers=encode_workers, thread_name_prefix="RemixPngEncode") if PILLOW_INSTALLED else None
+            in_flight = collections.deque()
+
+            def _submit_encode(pixels, width, height, png_path):
+                if encode_pool is None:
+                    future = Future()
+                    future.set_result(self._save_pixels_with_blender(pixels, width, height, png_path))
+                    return future
+                # Bound the pixel buffers held in memory while the pool catches up.
+                while len(in_flight) >= encode_workers * 2:
+                    in_flight.popleft().result()
+                future = encode_pool.submit(remix_image_jobs.encode_png, pixels, width, height, png_path)
+                in_flight.append(future)
+                return future
+
             # Helper to find only images actively used in the material node graph
             def _find_live_images(start_node):
                 live_images_in_tree = set()
@@ -3330,40 +3865,42 @@ if IS_BLENDER_CONTEXT:
                         # Manual unpacking for packed UDIMs
                         logging.info(f"  > Found packed UDIM set: '{image.name}'. Manually unpacking each tile.")
                         safe_name = "".join(c for c in image.name if c.isalnum() or c in ('_', '.', '-')).strip()
-                        temp_udim_dir = os.path.join(bake_dir, f"unpacked_udim_{safe_name}_{uuid.uuid4().hex[:6]}")
-                        os.makedirs(temp_udim_dir, exist_ok=True)
-                        self._export_data['temp_files_to_clean'].add(temp_udim_dir)
-                        unpacked_filepath_template = os.path.join(temp_udim_dir, f"{safe_name}.<UDIM>.png")
-
-                        tiles_saved_successfully = True
-                        original_active_tile = image.tiles.active
-                        try:
-                            for tile in image.tiles:
-                                try:
-                                    image.tiles.active = tile
-                                    if image.size[0] == 0 or len(image.pixels) == 0:
-                                        logging.warning(f"    - Tile {tile.number} for '{image.name}' has no pixel data. Skipping.")
-                                        continue
-                                    temp_tile_image = bpy.data.images.new(name=f"temp_tile_{tile.number}", width=image.size[0], height=image.size[1], alpha=True)
-                                    temp_tile_image.pixels = image.pixels[:]
-                                    tile_output_path = unpacked_filepath_template.replace('<UDIM>', str(tile.number))
-                                    temp_tile_image.filepath_raw = tile_output_path
-                                    temp_tile_image.file_format = 'PNG'
-                                    temp_tile_image.save()
-                                    bpy.data.images.remove(temp_tile_image)
-                                except Exception as e_tile:
-                                    logging.error(f"    - FAILED to unpack tile {tile.number} for '{image.name}': {e_tile}", exc_info=True)
-                                    if 'temp_tile_image' in locals() and temp_tile_image.name in bpy.data.images: bpy.data.images.remove(temp_tile_image)
-                                    tiles_saved_successfully = False
-                                    break
-                            if tiles_saved_successfully:
+                        fingerprint = self._packed_image_fingerprint(image)
+                        if fingerprint is not None:
+                            unpacked_filepath_template = os.path.join(CUSTOM_IMAGE_CACHE_PATH, f"{safe_name}_{fingerprint[:16]}.<UDIM>.png")
+                            cached_paths = remix_image_jobs.cached_udim_tiles(unpacked_filepath_template)
+                            if cached_paths is not None:
+                                for path in cached_paths: remix_image_jobs.touch(path)
+                                recovered_paths.extend(cached_paths)
                                 texture_translation_map[image.name] = unpacked_filepath_template
-                                logging.info(f"    - Successfully unpacked all tiles for '{image.name}' to '{temp_udim_dir}'")
-                            else:
-                                texture_translation_map[image.name] = "GHOST_DATA_UNRECOVERABLE"
-                                has_unrecoverable_textures = True
-                        finally:
-                            if original_active_tile in image.tiles: image.tiles.active = original_active_tile
+                                logging.info(f"    - Reusing cached tiles for '{image.name}'.")
+                                continue
+                            staging_template = None
+                        else:
+                            # Painted since it was packed: the packed bytes are stale, so the live
+                            # tiles are fingerprinted as they stream past. The name depends on that
+                            # fingerprint, so they are encoded under a staging name first.
+                            unpacked_filepath_template = None
+                            staging_template = os.path.join(CUSTOM_IMAGE_CACHE_PATH, f"{safe_name}_{uuid.uuid4().hex[:8]}.staging.<UDIM>.png")
+                            tile_sha = hashlib.sha1()
+
+                        # Tiles are read and handed to the encode pool one at a time, so
+                        # _submit_encode's bound caps the pixel buffers held at once.
+                        tile_futures, tile_numbers = [], []
+                        try:
+                            for number, (pixels, width, height) in self._read_tile_pixels(image):
+                                if staging_template is not None:
+                                    tile_sha.update(f"{number}:{remix_image_jobs.pixel_fingerprint(pixels)};".encode('utf-8'))
+                                tile_output_path = (staging_template or unpacked_filepath_template).replace('<UDIM>', str(number))
+                                tile_futures.append(_submit_encode(pixels, width, height, tile_output_path))
+                                tile_numbers.append(number)
+                            if staging_template is not None:
+                                unpacked_filepath_template = os.path.join(CUSTOM_IMAGE_CACHE_PATH, f"{safe_name}_{tile_sha.hexdigest()[:16]}.<UDIM>.png")
+                            pending_recoveries[image.name] = (unpacked_filepath_template, tile_futures, (tile_numbers, staging_template))
+                        except Exception as e_tile:
+                            logging.error(f"    - FAILED to unpack tiles for '{image.name}': {e_tile}", exc_info=True)
+                            texture_translation_map[image.name] = "GHOST_DATA_UNRECOVERABLE"
+                            has_unrecoverable_textures = True
                     else:
                         # Logic for UDIMs linked from disk
                         logging.info(f"  > Found linked UDIM set: '{image.name}'. Preserving template path.")
@@ -3394,22 +3931,28 @@ if IS_BLENDER_CONTEXT:
 
                 try:
                     if image.size[0] == 0 or image.size[1] == 0: raise RuntimeError("Image has zero dimensions.")
-                    _ = image.pixels[0]
+
+                    # Packed images are fingerprinted from their packed bytes without decoding;
+                    # generated ones, and packed ones painted since (is_dirty), have to be read
+                    # first and are fingerprinted by their pixels.
+                    pixels = None
+                    fingerprint = self._packed_image_fingerprint(image)
+                    if fingerprint is None:
+                        pixels, width, height = self._read_image_pixels(image)
+                        fingerprint = remix_image_jobs.pixel_fingerprint(pixels)
 
                     safe_name = "".join(c for c in image.name if c.isalnum() or c in ('_', '.', '-')).strip()
-                    temp_filename = f"recovered_{safe_name}_{uuid.uuid4().hex[:6]}.png"
-                    new_safe_path = os.path.join(bake_dir, temp_filename)
-
-                    temp_image = bpy.data.images.new(name=f"temp_save_{image.name}", width=image.size[0], height=image.size[1], alpha=True)
-                    temp_image.pixels = image.pixels[:]
-                    temp_image.filepath_raw = new_safe_path
-                    temp_image.file_format = 'PNG'
-                    temp_image.save()
-        
-                    texture_translation_map[image_name_key] = new_safe_path
-                    self._export_data['temp_files_to_clean'].add(new_safe_path)
-                    bpy.data.images.remove(temp_image)
-                    logging.info(f"  > Successfully recovered standard image '{image.name}' to temp file: {new_safe_path}")
+                    new_safe_path = os.path.join(CUSTOM_IMAGE_CACHE_PATH, f"recovered_{safe_name}_{fingerprint[:16]}.png")
+                    if os.path.exists(new_safe_path):
+                        remix_image_jobs.touch(new_safe_path)
+                        recovered_paths.append(new_safe_path)
+                        texture_translation_map[image_name_key] = new_safe_path
+                        logging.info(f"  > Reusing cached recovery of standard image '{image.name}': {new_safe_path}")
+                        continue
+
+                    if pixels is None:
+                        pixels, width, height = self._read_image_pixels(image)
+                    pending_recoveries[image_name_key] = (new_safe_path, [_submit_encode(pixels, width, height, new_safe_path)], None)
 
                 except Exception as e:
                     logging.error(f"  - UNRECOVERABLE: Standard image '{image.name}' has no valid path and no readable pixel data. Reason: {e}")
@@ -3417,18 +3960,126 @@ if IS_BLENDER_CONTEXT:
                     has_unrecoverable_textures = True
             # --- END OF THE RESTRUCTURED FIX ---
 
+            try:
+                for image_name, (map_value, futures, udim) in pending_recoveries.items():
+                    results = [future.result() for future in futures]
+                    errors = [error for _, error in results if error]
+                    if not errors and udim is not None:
+                        try:
+                            results = [(path, None) for path in self._commit_udim_tiles(map_value, *udim)]
+                        except OSError as e:
+                            errors = [e]
+                    if errors:
+                        logging.error(f"  - UNRECOVERABLE: Could not write recovered pixels of '{image_name}': {errors[0]}")
+                        texture_translation_map[image_name] = "GHOST_DATA_UNRECOVERABLE"
+                        has_unrecoverable_textures = True
+                    else:
+                        recovered_paths.extend(path for path, _ in results)
+                        texture_translation_map[image_name] = map_value
+                        logging.info(f"  > Successfully recovered '{image_name}' to: {map_value}")
+            finally:
+                if encode_pool is not None:
+                    encode_pool.shutdown(wait=True)
+            remix_image_jobs.prune_cache(CUSTOM_IMAGE_CACHE_PATH, keep=recovered_paths)
+
             if has_unrecoverable_textures:
                 self.report({'ERROR'}, "Unrecoverable/missing textures found. Export aborted. See System Console.")
                 return None
 
             logging.info("Texture preparation complete. Handing off to workers for baking and final cleanup.")
             return texture_translation_map
+
+        def _read_image_pixels(self, image):
+            """Reads an image's (active tile's) pixels into a float32 NumPy buffer. Returns (pixels, width, height)."""
+            width, height = image.size
+            if width == 0 or height == 0:
+                raise RuntimeError("Image has zero dimensions.")
+            pixels = np.empty(len(image.pixels), dtype=np.float32)
+            image.pixels.foreach_get(pixels)
+            return pixels, width, height
+
+        def _read_tile_pixels(self, image):
+            """
+            Yields (tile number, (pixels, width, height)) for every tile of a UDIM image
+            that has pixel data, reading one tile per step. The active tile is restored
+            when the generator finishes or is closed.
+            """
+            original_active_tile = image.tiles.active
+            try:
+                for tile in image.tiles:
+                    image.tiles.active = tile
+                    if image.size[0] == 0 or len(image.pixels) == 0:
+                        logging.warning(f"    - Tile {tile.number} for '{image.name}' has no pixel data. Skipping.")
+                        continue
+                    yield tile.number, self._read_image_pixels(image)
+            finally:
+                if original_active_tile in image.tiles: image.tiles.active = original_active_tile
+
+        def _commit_udim_tiles(self, template, tile_numbers, staging_template):
+            """
+            Completes a recovered UDIM set once its tiles are encoded: staged tiles move to
+            their fingerprinted names (or are dropped if that set is already cached) and
+            the index of written tiles is recorded. Returns the set's cache paths.
+            """
+            if staging_template is not None:
+                cached_paths = remix_image_jobs.cached_udim_tiles(template)
+                for number in tile_numbers:
+                    staged_path = staging_template.replace('<UDIM>', str(number))
+                    if cached_paths is None:
+                        os.replace(staged_path, template.replace('<UDIM>', str(number)))
+                    else:
+                        os.remove(staged_path)
+                if cached_paths is not None:
+                    for path in cached_paths: remix_image_jobs.touch(path)
+                    return cached_paths
+            return remix_image_jobs.record_udim_tiles(template, tile_numbers)
+
+        def _packed_image_fingerprint(self, image):
+            """
+            SHA-1 over an image's packed file(s) (every tile of a packed UDIM set), or
+            None if it is not packed or was painted since it was packed (is_dirty):
+            then the packed bytes no longer match what the artist sees.
+            """
+            if getattr(image, 'is_dirty', False):
+                return None
+            packed_files = [(getattr(pf, 'tile_number', 0), pf.packed_file) for pf in getattr(image, 'packed_files', [])]
+            if not packed_files and image.packed_file:
+                packed_files = [(0, image.packed_file)]
+            if not packed_files:
+                return None
+            sha = hashlib.sha1()
+            for tile_number, packed_file in sorted(packed_files, key=lambda item: item[0]):
+                sha.update(f"{tile_number}:{packed_file.size}:".encode('utf-8'))
+                sha.update(packed_file.data)
+            return sha.hexdigest()
+
+        def _save_pixels_with_blender(self, pixels, width, height, png_path):
+            """Main-thread PNG save through a temporary image, used when Pillow is not installed."""
+            temp_image = None
+            try:
+                temp_image = bpy.data.images.new(name=f"temp_save_{os.path.basename(png_path)}", width=width, height=height, alpha=True)
+                temp_image.pixels.foreach_set(pixels)
+                temp_image.filepath_raw = png_path
+                temp_image.file_format = 'PNG'
+                temp_image.save()
+                return png_path, None
+            except Exception as e:
+                return png_path, str(e)
+            finally:
+                if temp_image is not None and temp_image.name in bpy.data.images:
+                    bpy.data.images.remove(temp_image)
         
         def modal(self, context, event):
             if event.type != 'TIMER':
                 return {'PASS_THROUGH'}
 
             with self._op_lock:
+                if self._operator_state == 'UPLOADING':
+                    return self._poll_upload(context)
+
+                if self._operator_state == 'CONVERTING_EXR':
+                    return self._poll_exr_conversion(context)
+
                 if self._finished_tasks >= self._total_tasks and self._operator_state not in ['FINISHING', 'CLEANING_UP']:
                     logging.info("All bake tasks are complete. Moving to finalization.")
                     self._operator_state = 'FINISHING'
@@ -3437,7 +4088,12 @@ if IS_BLENDER_CONTEXT:
                             self.report({'ERROR'}, f"{self._failed_tasks} bake task(s) failed. See console.")
                             return self._cleanup(context, {'CANCELLED'})
                         else:
-                            self._finalize_export(context)
+                            self._finalize_export(context, background=True)
+                            if self._upload_future is not None:
+                                # Nothing is left to bake; free the workers' memory while the upload runs.
+                                self._shut_down_workers()
+                                self._operator_state = 'UPLOADING'
+                                return {'PASS_THROUGH'}
                             self.report({'INFO'}, f"Export complete. Baked {self._total_tasks} textures.")
                             return self._cleanup(context, {'FINISHED'})
                     except Exception as e:
@@ -3450,59 +4106,13 @@ if IS_BLENDER_CONTEXT:
                         print(self._log_queue.get_nowait())
                 except Empty: pass
 
-                try:
-                    while not self._results_queue.empty():
-                        result_line = self._results_queue.get_nowait()
-                        try:
-                            result = json.loads(result_line)
-                            worker_pid = result.get("pid")
-                            slot_index = next((i for i, s in enumerate(self._worker_slots) if s.get('process') and s['process'].pid == worker_pid), -1)
-                            if slot_index == -1: continue
-
-                            slot = self._worker_slots[slot_index]
-                            status = result.get("status")
-
-                            if status == "ready":
-                                slot['status'] = 'ready'
-                                slot['ready_time'] = time.monotonic()
-                                logging.info(f"Worker in slot {slot_index} (PID: {worker_pid}) is READY.")
-                
-                            elif status in ["success", "failure"]:
-                                self._finished_tasks += 1
-                                if status == "failure": self._failed_tasks += 1
-                                
-                                if slot['status_before_task'] == 'finishing_for_standby':
-                                    logging.info(f"Worker {slot_index} finished its last task. Moving to STANDBY.")
-                                    slot['status'] = 'standby'
-                                    self._standby_worker_slot_index = slot_index
-                                elif slot['status_before_task'] == 'finishing_for_termination':
-                                    logging.info(f"Worker {slot_index} finished its last task. Gracefully terminating.")
-                                    self._terminate_worker(slot_index)
-                                    slot['status'] = 'idle'
-                                else:
-                                    slot['status'] = 'ready'
-                                
-                                slot['status_before_task'] = 'idle' # Reset the pre-task status
-                                if self._operator_state == 'STABILIZING': self._initial_tasks_finished_count += 1
-                            
-                            elif status == "error":
-                                logging.error(f"Worker in slot {slot_index} reported a critical error: {result.get('details', 'N/A')}")
-                                self._handle_failed_worker(slot_index, requeue_task=True)
-
-                        except (json.JSONDecodeError, KeyError): pass
-                except Empty: pass
+                # Worker messages are handled by the reader threads as they arrive. The
+                # timer tick only dispatches to slots that became ready through scaling
+                # decisions (e.g. a standby worker was reactivated) and watches for hangs.
+                for i in range(len(self._worker_slots)):
+                    self._dispatch_to_slot(i)
 
-                for i, slot in enumerate(self._worker_slots):
-                    if slot['status'] == 'ready' and self._master_task_queue:
-                        task_to_dispatch = self._master_task_queue.popleft()
-                        try:
-                            slot['process'].stdin.write(json.dumps(task_to_dispatch) + "\n")
-                            slot['process'].stdin.flush()
-                            slot['status'] = 'running'
-                            slot['status_before_task'] = 'running'
-                        except (IOError, BrokenPipeError):
-                            self._master_task_queue.appendleft(task_to_dispatch)
-                            self._handle_failed_worker(i, requeue_task=False)
+                self._check_worker_health()
 
                 current_time = time.monotonic()
                 cpu_now, ram_now = self._get_system_resources()
@@ -3510,8 +4120,11 @@ if IS_BLENDER_CONTEXT:
                 if self._operator_state == 'RAMPING_UP':
                     _, self._baseline_ram = self._get_system_resources()
                     bpy.ops.wm.save_mainfile()
-                    num_to_launch = min(len(self._worker_slots), self.INITIAL_WORKER_COUNT, self._total_tasks)
+                    # Workers parked by a previous headless export are already proven; take them all.
+                    num_to_launch = min(len(self._worker_slots), max(self.INITIAL_WORKER_COUNT, len(PARKED_WORKERS)), self._total_tasks)
                     for i in range(num_to_launch): self._launch_new_worker(i)
+                    for i, slot in enumerate(self._worker_slots):
+                        if slot['remote']: self._launch_new_worker(i)
                     self._operator_state = 'STABILIZING'
 
                 elif self._operator_state == 'STABILIZING':
@@ -3527,7 +4140,7 @@ if IS_BLENDER_CONTEXT:
                     if current_time >= self._next_resource_check_time:
                         self._next_resource_check_time = current_time + self.RESOURCE_CHECK_INTERVAL_SEC
                         
-                        running_worker_count = sum(1 for s in self._worker_slots if s['status'] in ['running', 'ready'])
+                        running_worker_count = sum(1 for s in self._worker_slots if s['status'] in ['running', 'ready'] and not s['remote'])
                         
                         # --- SURGICAL CHANGE START: Added 'self.' to all config variables ---
                         if cpu_now > self.CPU_HIGH_THRESHOLD or ram_now > self.RAM_HIGH_THRESHOLD:
@@ -3535,9 +4148,9 @@ if IS_BLENDER_CONTEXT:
                             if self._high_usage_counter >= self.HIGH_USAGE_SUSTAINED_CHECKS and running_worker_count > 1:
                                 logging.warning(f"Sustained high usage for 10s. Scaling down one worker.")
                                 
-                                candidates = [i for i, s in enumerate(self._worker_slots) if s['status'] == 'running']
+                                candidates = [i for i, s in enumerate(self._worker_slots) if s['status'] == 'running' and not s['remote']]
                                 if not candidates:
-                                    candidates = [i for i, s in enumerate(self._worker_slots) if s['status'] == 'ready']
+                                    candidates = [i for i, s in enumerate(self._worker_slots) if s['status'] == 'ready' and not s['remote']]
                                 
                                 if candidates:
                                     candidates.sort(key=lambda i: self._worker_slots[i]['tasks_completed'])
@@ -3562,7 +4175,7 @@ if IS_BLENDER_CONTEXT:
                                 self._worker_slots[self._standby_worker_slot_index]['status'] = 'ready'
                                 self._standby_worker_slot_index = -1
                             else:
-                                idle_slot_index = next((i for i, s in enumerate(self._worker_slots) if s['status'] == 'idle'), -1)
+                                idle_slot_index = next((i for i, s in enumerate(self._worker_slots) if s['status'] == 'idle' and not s['remote']), -1)
                                 if idle_slot_index != -1:
                                     logging.info(f"Low resource usage and an idle slot is available. Launching new worker in slot {idle_slot_index}.")
                                     self._launch_new_worker(idle_slot_index)
@@ -3575,7 +4188,7 @@ if IS_BLENDER_CONTEXT:
                     standby_count = 1 if self._standby_worker_slot_index != -1 else 0
                     status_text = f"Baking... {self._finished_tasks}/{self._total_tasks} | Active: {active_workers} | Standby: {standby_count} | Queued: {len(self._master_task_queue)}"
                     if self._failed_tasks > 0: status_text += f" | FAILED: {self._failed_tasks}"
-                    context.workspace.status_text_set(status_text)
+                    if context.workspace: context.workspace.status_text_set(status_text)
 
                 return {'PASS_THROUGH'}
                 
@@ -3614,19 +4227,23 @@ if IS_BLENDER_CONTEXT:
             
         def _get_system_resources(self):
             """
-            [SURGICALLY CHANGED FOR RELIABILITY]
-            Helper to get current CPU and RAM usage. Adds a small interval to the
-            cpu_percent call to ensure it returns a meaningful, non-zero value
-            instead of relying on a previous call's timing.
+            [NON-BLOCKING] Returns the latest smoothed CPU and RAM usage published by
+            the background SystemResourceSampler. The modal timer calls this every
+            tick, so it must never wait on psutil itself.
             """
-            # --- START OF SURGICAL CHANGE ---
-            if PSUTIL_INSTALLED:
-                import psutil
-                # Adding a small interval makes this a blocking call, but it ensures
-                # we get a reliable reading compared to the last time it was called.
-                return psutil.cpu_percent(interval=0.1), psutil.virtual_memory().percent
-            # --- END OF SURGICAL CHANGE ---
-            return 0, 0            
+            if self._resource_sampler is not None:
+                snapshot = self._resource_sampler.snapshot()
+                return snapshot['cpu'], snapshot['ram']
+            return 0, 0
+
+        def _get_worker_rss(self, slot_index):
+            """Returns the smoothed resident memory (bytes) of a slot's worker, or 0 if unknown."""
+            if self._resource_sampler is None or slot_index >= len(self._worker_slots):
+                return 0
+            worker = self._worker_slots[slot_index].get('process')
+            if worker is None:
+                return 0
+            return self._resource_sampler.snapshot()['worker_rss'].get(worker.pid, 0)
             
         def _sample_and_record_resources(self):
             """
@@ -3765,6 +4382,43 @@ if IS_BLENDER_CONTEXT:
                         visited_trees.add(node.node_tree)
             return False
 
+        def _run_headless(self, context):
+            """
+            Background mode has no window, so no timer events and no modal handler.
+            Drives modal() from a blocking loop with an emulated timer tick until it
+            returns its final result.
+            """
+            timer_event = SimpleNamespace(type='TIMER')
+            while True:
+                result = self.modal(context, timer_event)
+                if 'PASS_THROUGH' not in result and 'RUNNING_MODAL' not in result:
+                    return result
+                time.sleep(self.HEADLESS_TICK_SEC)
+
+        def _open_export_journal(self, tasks):
+            """
+            Starts the export journal for the current .blend file and returns the tasks
+            that still need a worker. When resuming, tasks whose output the previous run
+            completed (same inputs, matching checksum) are dropped from the dispatch list;
+            bake_info['tasks'] keeps them, so _finalize_export still picks their files up.
+            """
+            journal_path = remix_export_journal.journal_path_for(CUSTOM_JOURNAL_PATH, bpy.data.filepath)
+            journal = remix_export_journal.ExportJournal.load(journal_path) if self.resume else None
+            if self.resume and journal is None:
+                logging.warning("Resume requested but no usable export journal was found. Running a full export.")
+            if journal is None:
+                journal = remix_export_journal.ExportJournal.create(journal_path, bpy.data.filepath)
+
+            pending_tasks = tasks
+            if self.resume:
+                pending_tasks = [task for task in tasks if not journal.is_completed(task)]
+                logging.info(f"Resuming export: {len(tasks) - len(pending_tasks)} of {len(tasks)} bake(s) already completed and verified.")
+
+            journal.register_tasks(pending_tasks)
+            journal.set_state(remix_export_journal.STATE_RUNNING)
+            self._journal = journal
+            return pending_tasks
+
         def execute(self, context):
             # --- TIMING: Full Operation Start ---
             self._full_op_start_time = time.perf_counter()
@@ -3794,9 +4448,26 @@ if IS_BLENDER_CONTEXT:
                 "normals_were_flipped": False, "was_mirrored_on_export": False, 
                 "temp_realized_object_names": []
             }
-            self._results_queue = Queue()
             self._log_queue = Queue()
             self._comm_threads = []
+            self._shutdown_event = threading.Event()
+            self._hang_timeout_sec = float(context.preferences.addons[__name__].preferences.bake_worker_hang_timeout)
+            self._worker_max_rss_bytes = context.preferences.addons[__name__].preferences.bake_worker_max_rss_mb * 1024 * 1024
+            self._worker_max_tasks = context.preferences.addons[__name__].preferences.bake_worker_max_tasks
+            self._retiring_workers = []
+            self._telemetry = remix_bake_telemetry.BakeTelemetry(bpy.data.filepath)
+            self._composite_pool = None
+            self._composite_futures = {}
+            self._material_tasks_remaining = {}
+            self._materials_with_failures = set()
+            self._journal_writes = collections.defaultdict(list)
+            self._selected_prim_paths = None
+            self._prim_index_future = None
+            self._exr_conversion = None
+            self._upload_future = None
+            self._scene_handed_back = False
+            self._upload_stage = ""
+            self._pending_reports = []
             self._finished_tasks = 0
             self._failed_tasks = 0
             
@@ -3809,12 +4480,14 @@ if IS_BLENDER_CONTEXT:
             self._cooldown_end_time = 0.0
             self._running_average_task_cpu = 15.0
             self._running_average_task_ram = 5.0
+            self._resource_sampler = None
+            self._journal = None
             # --- SURGICAL CHANGE END ---
             
             try:
                 # --- SURGICAL CHANGE START: This is the corrected pre-flight check ---
                 logging.info("--- Starting Pre-flight Remix Selection Check ---")
-                selection_check_url = f"{addon_prefs.remix_server_url.rstrip('/')}/assets/?selection=true&filter_session_prims=false&exists=true"
+                selection_check_url = remix_prim_index.assets_url(addon_prefs.remix_server_url, selection=True)
                 headers = {'accept': 'application/lightspeed.remix.service+json; version=1.0'}
                 
                 response = make_request_with_retries('GET', selection_check_url, headers=headers, verify=addon_prefs.remix_verify_ssl)
@@ -3826,7 +4499,7 @@ if IS_BLENDER_CONTEXT:
                     return self._cleanup(context, {'CANCELLED'})
 
                 data = response.json()
-                prim_paths = data.get("prim_paths", data.get("asset_paths", []))
+                prim_paths = remix_prim_index.prim_paths_from_response(data)
 
                 if not prim_paths:
                     bpy.ops.object.show_popup('INVOKE_DEFAULT', message="Nothing is selected in Remix.", success=False)
@@ -3834,6 +4507,13 @@ if IS_BLENDER_CONTEXT:
                     return self._cleanup(context, {'CANCELLED'})
                 
                 logging.info(f"--- Pre-flight check PASSED. Found {len(prim_paths)} selected prim(s) in Remix. ---")
+                self._selected_prim_paths = prim_paths
+                # The full listing can be large; fetch and index it while the export bakes.
+                index_fetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RemixPrimIndex")
+                self._prim_index_future = index_fetcher.submit(
+                    remix_prim_index.RemixPrimIndex.fetch, addon_prefs.remix_server_url, addon_prefs.remix_verify_ssl
+                )
+                index_fetcher.shutdown(wait=False)
                 # --- SURGICAL CHANGE END ---
 
                 if not is_blend_file_saved():
@@ -3914,8 +4594,6 @@ if IS_BLENDER_CONTEXT:
                             if self._material_uses_exr(mat):
                                 objects_requiring_exr_conversion.add(obj)
         
-                exr_to_png_map = {}
-
                 if all_materials_cached:
                     logging.info("All materials are fully cached. Skipping texture preparation and conversion.")
                     self._export_data['texture_translation_map'] = {}
@@ -3934,112 +4612,193 @@ if IS_BLENDER_CONTEXT:
                     if objects_requiring_exr_conversion:
                         logging.info(f"Running non-destructive EXR conversion for {len(objects_requiring_exr_conversion)} object(s).")
                 
-                        # --- TIMING START: EXR to PNG Conversion ---
-                        exr_conv_start_time = time.perf_counter()
-                        success, exr_to_png_map = convert_exr_textures_to_png(
+                        # --- TIMING START: EXR to PNG Conversion (ends in _poll_exr_conversion) ---
+                        self._exr_conv_start_time = time.perf_counter()
+                        self._exr_conversion = start_exr_texture_conversion(
                             context, 
-                            list(objects_requiring_exr_conversion), 
-                            self._export_data['temp_files_to_clean']
+                            list(objects_requiring_exr_conversion)
                         )
-                        exr_conv_end_time = time.perf_counter()
-                        logging.info(f"TIMING: Non-destructive EXR to PNG conversion took {exr_conv_end_time - exr_conv_start_time:.4f} seconds.")
-                        # --- TIMING END ---
-                        if not success:
+                        if self._exr_conversion is None:
                             raise RuntimeError("Failed to convert EXR textures to PNG.")
-
-                        if exr_to_png_map:
-                            logging.info(f"Merging {len(exr_to_png_map)} EXR->PNG conversions into the main texture map for workers...")
-                            main_texture_map = self._export_data['texture_translation_map']
-                            updated_main_map = {}
-                            for img_name, original_path in main_texture_map.items():
-                                if original_path in exr_to_png_map:
-                                    updated_main_map[img_name] = exr_to_png_map[original_path]
-                                else:
-                                    updated_main_map[img_name] = original_path
-                            self._export_data['texture_translation_map'] = updated_main_map
                     else:
                         logging.info("No uncached materials use EXR textures. Skipping EXR conversion.")
 
-                # --- TIMING START: Bake Task Collection ---
-                task_collect_start_time = time.perf_counter()
-                all_tasks, _, _, _ = self.collect_bake_tasks(
-                    context, 
-                    self._export_data["objects_for_export"], 
-                    self._export_data,
-                    exr_to_png_map
-                )
-                task_collect_end_time = time.perf_counter()
-                logging.info(f"TIMING: Bake task collection and material analysis took {task_collect_end_time - task_collect_start_time:.4f} seconds.")
-                # --- TIMING END ---
+                if self._exr_conversion is not None:
+                    # The conversions run in a process pool; modal() collects them and
+                    # carries on with _setup_bake_tasks from there.
+                    self._operator_state = 'CONVERTING_EXR'
+                    return self._enter_modal(context)
 
-                if all_tasks:
-                    logging.info(f"Preparing {len(all_tasks)} isolated .blend files for workers...")
-                    # --- TIMING START: Isolated .blend File Writing ---
-                    blend_write_start_time = time.perf_counter()
-                    task_blend_dir = os.path.join(self._export_data['bake_info']['bake_dir'], 'task_files')
-                    os.makedirs(task_blend_dir, exist_ok=True)
-                    self._export_data['temp_files_to_clean'].add(task_blend_dir)
-
-                    for i, task in enumerate(all_tasks):
-                        obj = bpy.data.objects.get(task['object_name'])
-                        mat = bpy.data.materials.get(task['material_name'])
-                        if not obj or not mat:
-                            logging.error(f"Could not find object or material for task {i}. Skipping file creation.")
-                            continue
-                
-                        datablocks_to_save = set()
-                        datablocks_to_save.add(obj)
-                        if obj.data:
-                            datablocks_to_save.add(obj.data)
+                result = self._setup_bake_tasks(context, {})
+                if result is not None:
+                    return result
+                return self._enter_modal(context)
 
-                        self._collect_material_dependencies(mat, datablocks_to_save)
-                
-                        temp_blend_path = os.path.join(task_blend_dir, f"remix_task_{i:04d}.blend")
+            except Exception as e:
+                logging.error(f"Export failed during setup: {e}", exc_info=True)
+                self.report({'ERROR'}, f"Export setup failed: {e}")
+                return self._cleanup(context, {'CANCELLED'})
 
-                        try:
-                            bpy.data.libraries.write(temp_blend_path, datablocks_to_save, fake_user=True)
-                            task['task_blend_file'] = temp_blend_path
-                            task['texture_translation_map'] = self._export_data['texture_translation_map']
-                        except Exception as e:
-                            logging.critical(f"FATAL: Could not write isolated blend file for task {i}. Aborting export. Error: {e}", exc_info=True)
-                            raise RuntimeError("Failed to create isolated worker blend file.")
-                    blend_write_end_time = time.perf_counter()
-                    logging.info(f"TIMING: Writing {len(all_tasks)} isolated .blend files took {blend_write_end_time - blend_write_start_time:.4f} seconds.")
-                    # --- TIMING END ---
+        def _setup_bake_tasks(self, context, exr_to_png_map):
+            """
+            Second half of the export setup, run by execute() or, when EXR textures had
+            to be converted, by _poll_exr_conversion once they are. Collects the bake
+            tasks and prepares the worker slots. Returns the operator's final result if
+            the export ended here, or None once baking can start ('RAMPING_UP').
+            """
+            addon_prefs = context.preferences.addons[__name__].preferences
+            if exr_to_png_map:
+                logging.info(f"Merging {len(exr_to_png_map)} EXR->PNG conversions into the main texture map for workers...")
+                main_texture_map = self._export_data['texture_translation_map']
+                updated_main_map = {}
+                for img_name, original_path in main_texture_map.items():
+                    if original_path in exr_to_png_map:
+                        updated_main_map[img_name] = exr_to_png_map[original_path]
+                    else:
+                        updated_main_map[img_name] = original_path
+                self._export_data['texture_translation_map'] = updated_main_map
+
+            # --- TIMING START: Bake Task Collection ---
+            task_collect_start_time = time.perf_counter()
+            all_tasks, _, _, _ = self.collect_bake_tasks(
+                context, 
+                self._export_data["objects_for_export"], 
+                self._export_data,
+                exr_to_png_map
+            )
+            task_collect_end_time = time.perf_counter()
+            logging.info(f"TIMING: Bake task collection and material analysis took {task_collect_end_time - task_collect_start_time:.4f} seconds.")
+            # --- TIMING END ---
+
+            all_tasks = self._open_export_journal(all_tasks)
+
+            if all_tasks:
+                logging.info(f"Preparing {len(all_tasks)} isolated .blend files for workers...")
+                # --- TIMING START: Isolated .blend File Writing ---
+                blend_write_start_time = time.perf_counter()
+                task_blend_dir = os.path.join(self._export_data['bake_info']['bake_dir'], 'task_files')
+                os.makedirs(task_blend_dir, exist_ok=True)
+                self._export_data['temp_files_to_clean'].add(task_blend_dir)
 
-                self._total_tasks = len(all_tasks)
                 for i, task in enumerate(all_tasks):
-                    task['global_task_number'] = i + 1
-                    task['total_tasks'] = self._total_tasks
+                    obj = bpy.data.objects.get(task['object_name'])
+                    mat = bpy.data.materials.get(task['material_name'])
+                    if not obj or not mat:
+                        logging.error(f"Could not find object or material for task {i}. Skipping file creation.")
+                        continue
+            
+                    datablocks_to_save = set()
+                    datablocks_to_save.add(obj)
+                    if obj.data:
+                        datablocks_to_save.add(obj.data)
 
-                if not all_tasks:
-                    logging.info("No bake tasks required. Finalizing export directly.")
-                    self._finalize_export(context)
-                    return self._cleanup(context, {'FINISHED'})
-    
-                logging.info(f"Found {self._total_tasks} bake tasks. Initializing dynamic worker pool.")
-                self._master_task_queue = collections.deque(all_tasks)
-    
-                num_potential_slots = min(self._total_tasks, self.MAX_POTENTIAL_WORKERS)
-                self._worker_slots = [{
-                    'status': 'idle', 'process': None, 'current_task': None, 
+                    self._collect_material_dependencies(mat, datablocks_to_save)
+            
+                    temp_blend_path = os.path.join(task_blend_dir, f"remix_task_{i:04d}.blend")
+
+                    try:
+                        bpy.data.libraries.write(temp_blend_path, datablocks_to_save, fake_user=True)
+                        task['task_blend_file'] = temp_blend_path
+                        # Only the images this material uses; the map itself is sent once per worker.
+                        task['texture_images'] = sorted(
+                            db.name for db in datablocks_to_save
+                            if isinstance(db, bpy.types.Image) and db.name in self._export_data['texture_translation_map']
+                        )
+                    except Exception as e:
+                        logging.critical(f"FATAL: Could not write isolated blend file for task {i}. Aborting export. Error: {e}", exc_info=True)
+                        raise RuntimeError("Failed to create isolated worker blend file.")
+                blend_write_end_time = time.perf_counter()
+                logging.info(f"TIMING: Writing {len(all_tasks)} isolated .blend files took {blend_write_end_time - blend_write_start_time:.4f} seconds.")
+                # --- TIMING END ---
+
+            self._total_tasks = len(all_tasks)
+            self._material_tasks_remaining = collections.Counter(t.get('material_hash') for t in all_tasks)
+            self._texture_map_version = remix_ipc.texture_map_version(self._export_data['texture_translation_map'])
+            for i, task in enumerate(all_tasks):
+                task['action'] = remix_ipc.ACTION_BAKE
+                task['texture_map_version'] = self._texture_map_version
+                task['task_id'] = f"task_{i:04d}"
+                task['attempts'] = 0
+                task['global_task_number'] = i + 1
+                task['total_tasks'] = self._total_tasks
+
+            if not all_tasks:
+                logging.info("No bake tasks required. Finalizing export directly.")
+                self._finalize_export(context)
+                return self._cleanup(context, {'FINISHED'})
+
+            logging.info(f"Found {self._total_tasks} bake tasks. Initializing dynamic worker pool.")
+            self._master_task_queue = collections.deque(all_tasks)
+
+            num_potential_slots = min(self._total_tasks, self.MAX_POTENTIAL_WORKERS)
+            self._worker_slots = [{
+                'status': 'idle', 'process': None, 'current_task': None, 
+                'launch_time': 0, 'ready_time': 0,
+                'task_cpu_readings': [], 
+                'task_ram_readings': [], 
+                'tasks_completed': 0,
+                'task_start_time': 0,
+                'status_before_task': 'idle',
+                'last_message_time': 0,
+                'current_phase': None,
+                'remote': None
+            } for _ in range(num_potential_slots)]
+
+            # Remote bake agents add slots on top of the local pool. They are not
+            # governed by local CPU/RAM scaling: all of them connect at ramp-up.
+            remote_slots = remix_bake_agent.parse_agent_list(addon_prefs.bake_agents)
+            # Read here: slots may (re)connect from reader threads, which must not touch bpy.
+            self._bake_agent_token = addon_prefs.bake_agent_token
+            for address in remote_slots[:self._total_tasks]:
+                self._worker_slots.append({
+                    'status': 'idle', 'process': None, 'current_task': None,
                     'launch_time': 0, 'ready_time': 0,
-                    'task_cpu_readings': [], 
-                    'task_ram_readings': [], 
+                    'task_cpu_readings': [],
+                    'task_ram_readings': [],
                     'tasks_completed': 0,
-                    'task_start_time': 0
-                } for _ in range(num_potential_slots)]
-    
-                self._operator_state = 'RAMPING_UP'
-                self._timer = context.window_manager.event_timer_add(0.1, window=context.window)
-                context.window_manager.modal_handler_add(self)
-                return {'RUNNING_MODAL'}
+                    'task_start_time': 0,
+                    'status_before_task': 'idle',
+                    'last_message_time': 0,
+                    'current_phase': None,
+                    'remote': address
+                })
+            if remote_slots:
+                logging.info(f"Using {len(self._worker_slots) - num_potential_slots} remote bake agent slot(s).")
+
+            # Start sampling before the first tick so RAMPING_UP already has a RAM baseline.
+            self._resource_sampler = SystemResourceSampler(interval=self.RESOURCE_CHECK_INTERVAL_SEC)
+            self._resource_sampler.start()
+
+            self._operator_state = 'RAMPING_UP'
+            return None
+
+        def _enter_modal(self, context):
+            if self.headless:
+                return self._run_headless(context)
+            self._timer = context.window_manager.event_timer_add(0.1, window=context.window)
+            context.window_manager.modal_handler_add(self)
+            return {'RUNNING_MODAL'}
 
+        def _poll_exr_conversion(self, context):
+            """Timer tick in the 'CONVERTING_EXR' state: finishes the setup once the pool is done."""
+            pending = self._exr_conversion['pending']
+            if pending is not None and not pending.ready():
+                if context.workspace: context.workspace.status_text_set(f"Converting {len(self._exr_conversion['jobs'])} EXR texture(s)...")
+                return {'PASS_THROUGH'}
+            try:
+                conversion, self._exr_conversion = self._exr_conversion, None
+                success, exr_to_png_map = finish_exr_texture_conversion(context, conversion)
+                logging.info(f"TIMING: Non-destructive EXR to PNG conversion took {time.perf_counter() - self._exr_conv_start_time:.4f} seconds.")
+                # --- TIMING END ---
+                if not success:
+                    raise RuntimeError("Failed to convert EXR textures to PNG.")
+                result = self._setup_bake_tasks(context, exr_to_png_map)
+                return result if result is not None else {'PASS_THROUGH'}
             except Exception as e:
                 logging.error(f"Export failed during setup: {e}", exc_info=True)
                 self.report({'ERROR'}, f"Export setup failed: {e}")
                 return self._cleanup(context, {'CANCELLED'})
-                
+
         def _handle_failed_worker(self, slot_index, requeue_task=True):
             """
             Manages a worker that has stopped, either by crashing or by being
@@ -4048,30 +4807,264 @@ if IS_BLENDER_CONTEXT:
             if slot_index >= len(self._worker_slots): return
     
             slot = self._worker_slots[slot_index]
+            requeued = False
     
             # If requested, put the task it was working on back at the front of the queue.
             if requeue_task and 'current_task' in slot and slot['current_task']:
                 task = slot['current_task']
-                self._master_task_queue.appendleft(task)
-                logging.warning(f"Requeueing task for material '{task.get('material_name')}' from failed worker {slot_index}.")
+                if task.get('attempts', 0) >= self.MAX_TASK_ATTEMPTS:
+                    logging.error(f"Task {task.get('task_id')} for material '{task.get('material_name')}' failed {task.get('attempts')} time(s). Giving up on it.")
+                    self._finished_tasks += 1
+                    self._failed_tasks += 1
+                    if self._journal is not None:
+                        self._journal_writes[task.get('material_hash')].append(self._journal.record_failed(task))
+                    # Counts the material down like a failure result does, so it is never composited.
+                    self._on_material_task_finished(task, False)
+                else:
+                    self._master_task_queue.appendleft(task)
+                    requeued = True
+                    logging.warning(f"Requeueing task {task.get('task_id')} for material '{task.get('material_name')}' from failed worker {slot_index}.")
     
             slot['current_task'] = None
             slot['flagged_for_termination'] = False # Reset flag
             self._terminate_worker(slot_index) # This will terminate the process and set status to 'suspended'
 
+            # _terminate_worker only resets slots whose process was still alive.
+            worker = slot.get('process')
+            if worker is not None:
+                if worker in ACTIVE_WORKER_PROCESSES:
+                    ACTIVE_WORKER_PROCESSES.remove(worker)
+                if self._resource_sampler is not None:
+                    self._resource_sampler.untrack_pid(worker.pid)
+                slot['process'] = None
+            slot['status'] = 'idle'
+            slot['status_before_task'] = 'idle'
+            if self._standby_worker_slot_index == slot_index:
+                self._standby_worker_slot_index = -1
+
+            # Replace the worker so the requeued task does not wait for the next scaling decision.
+            if requeued and self._operator_state not in ['FINISHING', 'CLEANING_UP']:
+                self._launch_new_worker(slot_index)
+
+        def _handle_worker_message(self, slot_index, worker_process, message):
+            """
+            Applies one framed message from a worker to its slot. Called from the
+            slot's reader thread with _op_lock held.
+            """
+            if slot_index >= len(self._worker_slots): return
+            slot = self._worker_slots[slot_index]
+            if slot.get('process') is not worker_process:
+                return  # Late message from a process this slot has already replaced.
+
+            slot['last_message_time'] = time.monotonic()
+            msg_type = message.get('type')
+
+            if msg_type == remix_ipc.MSG_HEARTBEAT:
+                return
+
+            if msg_type == remix_ipc.MSG_PROGRESS:
+                slot['current_phase'] = message.get('phase')
+                return
+
+            if msg_type == remix_ipc.MSG_READY:
+                slot['status'] = 'ready'
+                slot['ready_time'] = time.monotonic()
+                logging.info(f"Worker in slot {slot_index} (PID: {worker_process.pid}) is READY.")
+                self._dispatch_to_slot(slot_index)
+
+            elif msg_type == remix_ipc.MSG_RESULT:
+                task = slot.get('current_task')
+                if task is None or message.get('task_id') != task.get('task_id'):
+                    logging.warning(f"Worker {slot_index} reported a result for unexpected task '{message.get('task_id')}'. Ignoring.")
+                    return
+
+                status = message.get('status')
+                if self._telemetry is not None:
+                    self._telemetry.record(task, status, message.get('timings'), peak_rss=message.get('peak_rss'),
+                                           worker_pid=message.get('pid'), remote=bool(slot.get('remote')))
+                if status in ["success", "failure"]:
+                    self._finished_tasks += 1
+                    if status == "failure": self._failed_tasks += 1
+                    # The checksum and the journal rewrite run on the journal's writer thread, not
+                    # under _op_lock. It must cover the bake as the worker wrote it, so compositing
+                    # jobs wait for their material's writes before rewriting Base Color in place.
+                    if self._journal is not None:
+                        record = self._journal.record_done if status == "success" else self._journal.record_failed
+                        self._journal_writes[task.get('material_hash')].append(record(task))
+                    self._on_material_task_finished(task, status == "success")
+                    slot['current_task'] = None
+                    slot['current_phase'] = None
+                    slot['tasks_completed'] += 1
+                    
+                    worker_rss = self._get_worker_rss(slot_index)
+                    slot['peak_rss'] = max(slot.get('peak_rss', 0), worker_rss)
+                    
+                    if slot['status_before_task'] == 'finishing_for_standby':
+                        logging.info(f"Worker {slot_index} finished its last task. Moving to STANDBY.")
+                        slot['status'] = 'standby'
+                        self._standby_worker_slot_index = slot_index
+                    elif slot['status_before_task'] == 'finishing_for_termination':
+                        logging.info(f"Worker {slot_index} finished its last task. Gracefully terminating.")
+                        self._terminate_worker(slot_index)
+                        slot['status'] = 'idle'
+                    else:
+                        slot['status'] = 'ready'
+                        recycle_reason = self._worker_recycle_reason(slot_index, worker_rss)
+                        if recycle_reason and self._master_task_queue:
+                            self._recycle_worker(slot_index, recycle_reason)
+                    
+                    slot['status_before_task'] = 'idle' # Reset the pre-task status
+                    if self._operator_state == 'STABILIZING': self._initial_tasks_finished_count += 1
+                    self._dispatch_to_slot(slot_index)
+                
+                elif status == "error":
+                    logging.error(f"Worker in slot {slot_index} reported a critical error: {message.get('details', 'N/A')}")
+                    self._handle_failed_worker(slot_index, requeue_task=True)
+
+            elif msg_type == remix_ipc.MSG_ERROR:
+                logging.error(f"Worker in slot {slot_index} failed: {message.get('details', 'N/A')}")
+                self._handle_failed_worker(slot_index, requeue_task=True)
+
+        def _write_telemetry_report(self, return_value):
+            """Saves the export's per-phase bake timings as JSON next to the addon log and logs a summary."""
+            report_path = os.path.join(os.path.dirname(log_file_path) or CUSTOM_COLLECT_PATH, "bake_timings.json")
+            worker_peaks = {f"slot_{i}": slot.get('peak_rss', 0) for i, slot in enumerate(self._worker_slots)}
+            if self._telemetry.write(report_path, result=next(iter(return_value), None), sampled_worker_peak_rss=worker_peaks):
+                logging.info(f"Bake timing report for {len(self._telemetry)} task(s) written to {report_path}:")
+                for line in self._telemetry.summary_lines():
+                    logging.info(f"  {line}")
+
+        def _worker_recycle_reason(self, slot_index, worker_rss):
+            """Returns why a local worker should be restarted before its next task, or None."""
+            slot = self._worker_slots[slot_index]
+            if slot.get('remote'):
+                return None
+            if self._worker_max_tasks > 0 and slot['tasks_completed'] >= self._worker_max_tasks:
+                return f"reached {slot['tasks_completed']} task(s)"
+            if self._worker_max_rss_bytes > 0 and worker_rss > self._worker_max_rss_bytes:
+                return f"resident memory {worker_rss / 2**20:.0f} MB exceeds {self._worker_max_rss_bytes / 2**20:.0f} MB"
+            return None
+
+        def _recycle_worker(self, slot_index, reason):
+            """
+            Replaces an idle worker with a fresh process without blocking: the old one
+            is sent the quit command and left to exit on its own (see
+            _check_worker_health), while a new worker launches in the same slot.
+            Caller must hold _op_lock.
+            """
+            slot = self._worker_slots[slot_index]
+            worker = slot['process']
+            logging.info(f"Recycling worker in slot {slot_index} (PID: {worker.pid}): {reason}.")
+
+            WORKER_ROUTES.pop(worker, None)
+            if self._resource_sampler is not None:
+                self._resource_sampler.untrack_pid(worker.pid)
+            try:
+                worker.stdin.write(remix_ipc.encode_frame({"action": remix_ipc.ACTION_QUIT}))
+                worker.stdin.flush()
+                worker.stdin.close()
+            except (OSError, ValueError):
+                pass
+            self._retiring_workers.append((worker, time.monotonic()))
+
+            slot['process'] = None
+            slot['status'] = 'idle'
+            slot['tasks_completed'] = 0
+            slot['peak_rss'] = 0
+            self._launch_new_worker(slot_index)
+
+        def _reap_retiring_workers(self, force=False):
+            """Forgets recycled workers that exited; kills those past the grace period (or all, with force)."""
+            now = time.monotonic()
+            still_retiring = []
+            for worker, quit_time in self._retiring_workers:
+                if worker.poll() is None and (force or now - quit_time > self.RETIRE_GRACE_SEC):
+                    logging.warning(f"Recycled worker (PID: {worker.pid}) did not exit. Killing it.")
+                    worker.kill()
+                if worker.poll() is None:
+                    still_retiring.append((worker, quit_time))
+                elif worker in ACTIVE_WORKER_PROCESSES:
+                    ACTIVE_WORKER_PROCESSES.remove(worker)
+            self._retiring_workers = still_retiring
+
+        def _dispatch_to_slot(self, slot_index):
+            """Sends the next queued task to a 'ready' slot. Caller must hold _op_lock."""
+            slot = self._worker_slots[slot_index]
+            if slot['status'] != 'ready' or not self._master_task_queue:
+                return False
+
+            task_to_dispatch = self._master_task_queue.popleft()
+            try:
+                worker = slot['process']
+                if WORKER_TEXTURE_MAP_VERSIONS.get(worker) != self._texture_map_version:
+                    worker.stdin.write(remix_ipc.encode_frame({
+                        "action": remix_ipc.ACTION_SET_TEXTURE_MAP,
+                        "version": self._texture_map_version,
+                        "texture_map": self._export_data['texture_translation_map'],
+                    }))
+                    WORKER_TEXTURE_MAP_VERSIONS[worker] = self._texture_map_version
+                worker.stdin.write(remix_ipc.encode_frame(task_to_dispatch))
+                worker.stdin.flush()
+            except (IOError, BrokenPipeError, ValueError, AttributeError):
+                self._master_task_queue.appendleft(task_to_dispatch)
+                self._handle_failed_worker(slot_index, requeue_task=False)
+                return False
+
+            now = time.monotonic()
+            task_to_dispatch['attempts'] = task_to_dispatch.get('attempts', 0) + 1
+            slot['current_task'] = task_to_dispatch
+            slot['current_phase'] = 'dispatched'
+            slot['task_start_time'] = now
+            slot['last_message_time'] = now
+            slot['status'] = 'running'
+            slot['status_before_task'] = 'running'
+            return True
+
+        def _check_worker_health(self):
+            """
+            Detects workers that exited unexpectedly or went silent (no heartbeat) for
+            longer than the hang timeout. Their task is requeued and the slot relaunched.
+            Also reaps workers retired by recycling.
+            """
+            if self._retiring_workers:
+                self._reap_retiring_workers()
+            now = time.monotonic()
+            for i, slot in enumerate(self._worker_slots):
+                worker = slot.get('process')
+                if worker is None or slot['status'] not in ['launching', 'ready', 'running']:
+                    continue
+
+                if worker.poll() is not None:
+                    logging.error(f"Worker in slot {i} (PID: {worker.pid}) exited unexpectedly with code {worker.returncode}.")
+                    self._handle_failed_worker(i, requeue_task=True)
+                    continue
+
+                if self._hang_timeout_sec <= 0 or slot['status'] == 'ready':
+                    continue
+                silent_for = now - slot.get('last_message_time', now)
+                if silent_for > self._hang_timeout_sec:
+                    task = slot.get('current_task') or {}
+                    logging.error(
+                        f"Worker in slot {i} (PID: {worker.pid}) has been silent for {silent_for:.0f}s "
+                        f"(phase: {slot.get('current_phase')}, task: {task.get('task_id')}). Treating it as hung."
+                    )
+                    self._handle_failed_worker(i, requeue_task=True)
+
         def _combine_color_and_alpha(self, color_map_path, alpha_mask_path):
             """
             Loads an RGB color map and a grayscale alpha mask, combines them into a
             single RGBA image, and overwrites the original color map path.
+            Runs on the compositing pool; must not touch bpy, self.report or _export_data.
+            Returns (succeeded, temp_files), succeeded False only if the combination was
+            attempted and failed; the caller registers temp_files for cleanup.
             """
             if not PILLOW_INSTALLED:
                 logging.error("Pillow library is not installed. Cannot combine baked textures.")
-                self.report({'ERROR'}, "Pillow dependency not found. Cannot create transparency.")
-                return
+                return False, ()
 
             if not os.path.exists(color_map_path) or not os.path.exists(alpha_mask_path):
                 logging.warning(f"Skipping texture combination: one or both maps missing. Color: '{os.path.exists(color_map_path)}', Alpha: '{os.path.exists(alpha_mask_path)}'")
-                return
+                return True, ()
 
             logging.info(f"  > Combining '{os.path.basename(color_map_path)}' with alpha from '{os.path.basename(alpha_mask_path)}'")
 
@@ -4084,30 +5077,172 @@ if IS_BLENDER_CONTEXT:
                 alpha_img = Image.open(alpha_mask_path).convert("L")
 
                 if color_img.size != alpha_img.size:
-                    logging.warning(f"    - Color and alpha maps have different sizes. Resizing alpha mask to {color_img.size}.")
-                    alpha_img = alpha_img.resize(color_img.size, Image.Resampling.LANCZOS)
+                    # Constant channels are stored as tiny solid textures, so scale up to
+                    # whichever map carries the detail instead of always shrinking alpha.
+                    target_size = max(color_img.size, alpha_img.size, key=lambda size: size[0] * size[1])
+                    logging.warning(f"    - Color and alpha maps have different sizes. Resizing both to {target_size}.")
+                    color_img = color_img.resize(target_size, Image.Resampling.LANCZOS)
+                    alpha_img = alpha_img.resize(target_size, Image.Resampling.LANCZOS)
 
                 # Put the grayscale mask into the alpha channel of the color image
                 color_img.putalpha(alpha_img)
 
                 # Save the combined RGBA image, overwriting the original color map
-                color_img.save(color_map_path, "PNG")
+                color_img.save(color_map_path, "PNG", compress_level=remix_image_jobs.INTERMEDIATE_COMPRESS_LEVEL)
                 logging.info(f"    - Successfully created final RGBA texture at: {os.path.basename(color_map_path)}")
 
-                # Add the temporary alpha mask file to the cleanup list
-                self._export_data['temp_files_to_clean'].add(alpha_mask_path)
+                # The temporary alpha mask file goes to the cleanup list
+                return True, (alpha_mask_path,)
 
             except Exception as e:
                 logging.error(f"Failed during texture combination for '{color_map_path}': {e}", exc_info=True)
-                self.report({'WARNING'}, "Failed to combine baked textures.")
+                return False, ()
           
             
-        def _finalize_export(self, context):
+        def _material_texture_maps(self, mat_hash):
+            """The texture maps _finalize_export will see for one material, built the same way."""
+            bake_info = self._export_data.get('bake_info', {})
+            texture_maps = dict(global_material_hash_cache.get(mat_hash, {}))
+            texture_maps.update(bake_info.get('cached_materials', {}).get(mat_hash, {}))
+            for task in bake_info.get('tasks', []):
+                if task.get('material_hash') == mat_hash and task.get('target_socket_name') and os.path.exists(task.get('output_path', '')):
+                    texture_maps[task['target_socket_name']] = task['output_path']
+            return texture_maps
+
+        def _submit_compositing_job(self, mat_hash, texture_maps):
             """
-            [DEFINITIVE V12 - CACHE POPULATION FIX]
-            This version fixes the caching logic by ensuring that the results of all bakes
-            are correctly added to the `global_material_hash_cache` after processing.
-            It builds a local cache keyed by material_hash and then merges it.
+            Starts the post-bake compositing a material needs (decal over albedo, or
+            alpha into the color map) on the compositing pool. Caller must hold _op_lock.
+            """
+            if "Base Color" in texture_maps and "Decal Color" in texture_maps and "Decal Alpha" in texture_maps:
+                consumed_maps = ("Decal Color", "Decal Alpha")
+                job = (self._composite_decal_over_albedo, texture_maps["Base Color"], texture_maps["Decal Color"],
+                       texture_maps["Decal Alpha"], texture_maps["Base Color"])
+            elif "Base Color" in texture_maps and "Alpha" in texture_maps:
+                consumed_maps = ("Alpha",)
+                job = (self._combine_color_and_alpha, texture_maps["Base Color"], texture_maps["Alpha"])
+            else:
+                return
+            if self._composite_pool is None:
+                self._composite_pool = ThreadPoolExecutor(max_workers=self.COMPOSITE_WORKERS, thread_name_prefix="RemixComposite")
+            journal_writes = self._journal_writes.pop(mat_hash, [])
+            self._composite_futures[mat_hash] = (consumed_maps, self._composite_pool.submit(self._after_journal_writes, journal_writes, *job))
+
+        @staticmethod
+        def _after_journal_writes(journal_writes, job, *args):
+            """Runs a compositing job once the journal has checksummed the bakes it rewrites."""
+            concurrent.futures.wait(journal_writes)
+            return job(*args)
+
+        def _on_material_task_finished(self, task, succeeded):
+            """
+            Counts down a material's outstanding bakes. Once the last one succeeds, its
+            compositing starts right away instead of waiting for the whole queue.
+            Caller must hold _op_lock.
+            """
+            mat_hash = task.get('material_hash')
+            if mat_hash is None or mat_hash not in self._material_tasks_remaining:
+                return
+            if not succeeded:
+                self._materials_with_failures.add(mat_hash)
+            self._material_tasks_remaining[mat_hash] -= 1
+            if self._material_tasks_remaining[mat_hash] > 0 or mat_hash in self._materials_with_failures:
+                return
+            if mat_hash not in self._composite_futures:
+                self._submit_compositing_job(mat_hash, self._material_texture_maps(mat_hash))
+
+        def _upload_and_place(self, ctx, exported_obj_path, ingest_dir, base_name_to_search, special_ingest_future):
+            """
+            Network half of finalization: model ingest, replace/append, and the special
+            texture assignment once the background texture ingest has settled. Reads no
+            bpy data (`ctx` is a detached_context), so it can run on a worker thread;
+            reports are queued for the main thread. Raises on failure.
+            """
+            # --- TIMING START: API Upload ---
+            self._upload_stage = "Ingesting model"
+            api_upload_start_time = time.perf_counter()
+            ingested_usd = upload_to_api(exported_obj_path, ingest_dir, ctx)
+            api_upload_end_time = time.perf_counter()
+            logging.info(f"TIMING: API upload and ingest took {api_upload_end_time - api_upload_start_time:.4f} seconds.")
+            # --- TIMING END ---
+            if not ingested_usd:
+                raise RuntimeError(ingest_error_message or "API upload failed.")
+
+            # --- TIMING START: Server Replace/Append ---
+            self._upload_stage = "Placing asset in Remix"
+            server_op_start_time = time.perf_counter()
+            final_reference_prim = self._replace_or_append_on_server(ctx, ingested_usd, base_name_to_search)
+            server_op_end_time = time.perf_counter()
+            logging.info(f"TIMING: Server replace/append operation took {server_op_end_time - server_op_start_time:.4f} seconds.")
+            # --- TIMING END ---
+            if not final_reference_prim:
+                raise RuntimeError("Server replace/append operation failed.")
+
+            if special_ingest_future is not None:
+                # --- TIMING START: Special Texture Join ---
+                self._upload_stage = "Ingesting special textures"
+                join_start_time = time.perf_counter()
+                ingest_result = special_ingest_future.result()
+                logging.info(f"TIMING: Waited {time.perf_counter() - join_start_time:.4f} seconds for the background special texture ingest.")
+                # --- TIMING END ---
+                self._upload_stage = "Assigning special textures"
+                reporter = SimpleNamespace(report=self._queue_report)
+                handle_special_texture_assignments(reporter, ctx, final_reference_prim, export_data=self._export_data, ingest_result=ingest_result)
+
+        def _queue_report(self, level, message):
+            """self.report for background threads; _flush_upload_reports replays it on the main thread."""
+            self._pending_reports.append((level, message))
+
+        def _flush_upload_reports(self):
+            while self._pending_reports:
+                level, message = self._pending_reports.pop(0)
+                self.report(level, message)
+
+        def _poll_upload(self, context):
+            """modal() step while the background upload runs. Caller must hold _op_lock."""
+            if not self._upload_future.done():
+                if context.workspace:
+                    elapsed = time.perf_counter() - self._upload_start_time
+                    context.workspace.status_text_set(f"Uploading to Remix... {self._upload_stage} ({elapsed:.0f}s) | You can keep working.")
+                return {'PASS_THROUGH'}
+
+            upload_future, self._upload_future = self._upload_future, None
+            self._flush_upload_reports()
+            logging.info(f"TIMING: Background upload took {time.perf_counter() - self._upload_start_time:.4f} seconds.")
+            try:
+                upload_future.result()
+            except Exception as e:
+                logging.error(f"Uploading to Remix failed: {e}", exc_info=True)
+                self.report({'ERROR'}, f"Finalization failed: {e}")
+                return self._cleanup(context, {'CANCELLED'})
+            self.report({'INFO'}, f"Export complete. Baked {self._total_tasks} textures.")
+            return self._cleanup(context, {'FINISHED'})
+
+        def _asset_base_name(self, context):
+            """Base name an existing version of this asset would have on the server."""
+            addon_prefs = context.preferences.addons[__name__].preferences
+            if addon_prefs.remix_use_custom_name and addon_prefs.remix_base_obj_name:
+                return addon_prefs.remix_base_obj_name
+            return extract_base_name(get_blend_filename())
+
+        def _intermediate_texture_paths(self, texture_cache):
+            """PNGs in a texture cache that the addon wrote itself (user textures are never rewritten)."""
+            roots = tuple(os.path.join(os.path.normcase(os.path.abspath(d)), '') for d in (CUSTOM_COLLECT_PATH, CUSTOM_IMAGE_CACHE_PATH))
+            paths = set()
+            for texture_maps in texture_cache.values():
+                for path in texture_maps.values():
+                    if isinstance(path, str) and path.lower().endswith('.png') and os.path.normcase(os.path.abspath(path)).startswith(roots):
+                        paths.add(path)
+            return sorted(paths)
+
+        def _finalize_export(self, context, background=False):
+            """
+            [DEFINITIVE V13 - BACKGROUND UPLOAD]
+            Ensures the results of all bakes are added to the `global_material_hash_cache`
+            (a local cache keyed by material_hash is built, then merged), prepares the
+            materials and exports the OBJ on the main thread. The network half
+            (_upload_and_place) runs inline, or with `background=True` on a thread that
+            modal() polls, after the scene has been handed back to the artist.
             """
             # --- TIMING START: Full Finalization ---
             finalize_start_time = time.perf_counter()
@@ -4144,25 +5279,63 @@ if IS_BLENDER_CONTEXT:
 
                 logging.info("Processing final texture cache for compositing jobs...")
                 # --- TIMING START: Texture Compositing ---
+                # Jobs for materials whose bakes finished early are already running on the
+                # compositing pool (see _on_material_task_finished); the rest start here.
                 compositing_start_time = time.perf_counter()
-                for mat_hash, texture_maps in list(final_texture_cache.items()): 
-                    if "Base Color" in texture_maps and "Decal Color" in texture_maps and "Decal Alpha" in texture_maps:
-                        self._composite_decal_over_albedo(
-                            base_albedo_path=texture_maps["Base Color"],
-                            decal_albedo_path=texture_maps["Decal Color"],
-                            decal_alpha_path=texture_maps["Decal Alpha"],
-                            final_output_path=texture_maps["Base Color"]
-                        )
-                        del final_texture_cache[mat_hash]["Decal Color"]
-                        del final_texture_cache[mat_hash]["Decal Alpha"]
-
-                    elif "Base Color" in texture_maps and "Alpha" in texture_maps:
-                        self._combine_color_and_alpha(texture_maps["Base Color"], texture_maps["Alpha"])
-                        del final_texture_cache[mat_hash]["Alpha"]
+                # Called with _op_lock held (or before any worker exists), like the submits from the result handler.
+                for mat_hash, texture_maps in final_texture_cache.items():
+                    if mat_hash not in self._composite_futures:
+                        self._submit_compositing_job(mat_hash, texture_maps)
+                composite_jobs = dict(self._composite_futures)
+
+                failed_composites = 0
+                for mat_hash, (consumed_maps, future) in composite_jobs.items():
+                    succeeded, temp_files = future.result()
+                    # Registered here, on the main thread: _cleanup iterates this set.
+                    self._export_data['temp_files_to_clean'].update(temp_files)
+                    if not succeeded:
+                        failed_composites += 1
+                    # The intermediate maps are folded into Base Color either way.
+                    for consumed_map in consumed_maps:
+                        final_texture_cache.get(mat_hash, {}).pop(consumed_map, None)
+                if failed_composites:
+                    self.report({'WARNING'}, f"Failed to composite {failed_composites} baked texture(s). See console.")
                 compositing_end_time = time.perf_counter()
                 logging.info(f"TIMING: Texture compositing (decals, alpha channels) took {compositing_end_time - compositing_start_time:.4f} seconds.")
                 # --- TIMING END ---
 
+                # --- TIMING START: Final PNG Encoding ---
+                # Bakes and composites are written uncompressed so compositing decodes them
+                # cheaply; the textures this export uses are compressed once, here, in parallel.
+                encode_start_time = time.perf_counter()
+                if self._journal is not None:
+                    # Queued results must be checksummed before the files are recompressed.
+                    self._journal.flush()
+                intermediate_paths = self._intermediate_texture_paths(final_texture_cache)
+                encoded_count, encode_errors = remix_image_jobs.finalize_pngs(intermediate_paths, max_workers=self.COMPOSITE_WORKERS)
+                for path, error in encode_errors:
+                    logging.warning(f"  - Could not compress '{os.path.basename(path)}', exporting it uncompressed: {error}")
+                if self._journal is not None:
+                    # Recompression keeps the pixels, so the journal follows the new bytes and a
+                    # resume after a failed upload still skips these bakes. Composited Base Color
+                    # maps are left stale on purpose: they no longer hold what the worker baked.
+                    composited = {os.path.normpath(texture_maps["Base Color"]) for mat_hash, texture_maps in final_texture_cache.items()
+                                  if mat_hash in composite_jobs and "Base Color" in texture_maps}
+                    self._journal.refresh_outputs(p for p in intermediate_paths if os.path.normpath(p) not in composited)
+                logging.info(f"TIMING: Final PNG encoding of {encoded_count} texture(s) took {time.perf_counter() - encode_start_time:.4f} seconds.")
+                # --- TIMING END ---
+
+                # Special textures only need their files on disk, so their ingest runs in the
+                # background through material preparation, OBJ export, model ingest and
+                # replace/append. Only the final texture PUT waits for both.
+                special_ingest_future = None
+                if bake_info.get('special_texture_info'):
+                    special_ingest_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RemixSpecialIngest")
+                    special_ingest_future = special_ingest_pool.submit(
+                        ingest_special_textures, server_settings_snapshot(context), self._export_data
+                    )
+                    special_ingest_pool.shutdown(wait=False)
+
                 if final_texture_cache:
                     logging.info(f"Updating global cache with results from {len(final_texture_cache)} materials for next run.")
                     global_material_hash_cache.update(dict(final_texture_cache))
@@ -4260,26 +5433,24 @@ if IS_BLENDER_CONTEXT:
 
                 logging.info(f"Exported to temporary OBJ: {exported_obj_path}")
 
-                # --- TIMING START: API Upload ---
-                api_upload_start_time = time.perf_counter()
-                ingested_usd = upload_to_api(exported_obj_path, addon_prefs.remix_ingest_directory, context)
-                api_upload_end_time = time.perf_counter()
-                logging.info(f"TIMING: API upload and ingest took {api_upload_end_time - api_upload_start_time:.4f} seconds.")
-                # --- TIMING END ---
-                if not ingested_usd:
-                    raise RuntimeError("API upload failed.")
-
-                # --- TIMING START: Server Replace/Append ---
-                server_op_start_time = time.perf_counter()
-                final_reference_prim = self._replace_or_append_on_server(context, ingested_usd)
-                server_op_end_time = time.perf_counter()
-                logging.info(f"TIMING: Server replace/append operation took {server_op_end_time - server_op_start_time:.4f} seconds.")
-                # --- TIMING END ---
-                if not final_reference_prim:
-                    raise RuntimeError("Server replace/append operation failed.")
-
-                if bake_info.get('special_texture_info'):
-                    handle_special_texture_assignments(self, context, final_reference_prim, export_data=self._export_data)
+                upload_args = (
+                    detached_context(context), exported_obj_path, addon_prefs.remix_ingest_directory,
+                    self._asset_base_name(context), special_ingest_future,
+                )
+                if background:
+                    # Everything left is network traffic. Give the scene back to the artist
+                    # now and let modal() poll the upload.
+                    self._restore_scene_state(context)
+                    self._scene_handed_back = True
+                    self._upload_start_time = time.perf_counter()
+                    upload_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RemixUpload")
+                    self._upload_future = upload_pool.submit(self._upload_and_place, *upload_args)
+                    upload_pool.shutdown(wait=False)
+                else:
+                    try:
+                        self._upload_and_place(*upload_args)
+                    finally:
+                        self._flush_upload_reports()
 
             except Exception as e:
                 logging.error(f"Export finalization failed: {e}", exc_info=True)
@@ -4336,10 +5507,12 @@ if IS_BLENDER_CONTEXT:
           
         def _bake_udim_material_to_atlas(self, context, mat, objects_using_mat, bake_dir):
             """
-            [DEFINITIVE V5 - CORRECTED SPECIAL TEXTURE LOGGING]
+            [DEFINITIVE V6 - PARALLEL, CACHED STITCHING]
             Stitches UDIM tiles and creates a new material. This version now correctly logs
             any stitched special textures (like Displacement) against the ORIGINAL material
             name, ensuring they are found and assigned to the server.
+            Tiles are decoded in parallel and streamed into the atlas by
+            remix_image_jobs.stitch_atlas; atlases are cached by their tiles' fingerprints.
             """
             if not PILLOW_INSTALLED:
                 self.report({'ERROR'}, "Pillow dependency not installed, cannot stitch UDIMs.")
@@ -4408,24 +5581,37 @@ if IS_BLENDER_CONTEXT:
                     logging.error(f"Could not determine tile size for '{image.name}'. Skipping this set.")
                     continue
 
-                atlas_width = tile_width * len(tiles)
-                atlas_height = tile_height
-                atlas_pil_image = Image.new('RGBA', (atlas_width, atlas_height))
-
-                for i, tile in enumerate(tiles):
-                    tile_path = abspath(image.filepath_raw.replace('<UDIM>', str(tile.number)))
-                    if not os.path.exists(tile_path): continue
-        
-                    with Image.open(tile_path) as tile_pil_image:
-                        if tile_pil_image.size != (tile_width, tile_height):
-                            tile_pil_image = tile_pil_image.resize((tile_width, tile_height), Image.Resampling.LANCZOS)
-                        atlas_pil_image.paste(tile_pil_image, (i * tile_width, 0))
+                # Near-square grid, in the same order _transform_uvs_for_atlas assumes.
+                columns, rows = remix_array_ops.compute_atlas_grid(len(tiles))
+                max_dimension = context.preferences.addons[__name__].preferences.udim_atlas_max_dimension
+                source_tile_size = (tile_width, tile_height)
+                tile_width, tile_height = remix_array_ops.atlas_tile_size(tile_width, tile_height, columns, rows, max_dimension)
+                if (tile_width, tile_height) != source_tile_size:
+                    logging.info(f"Scaling {source_tile_size[0]}x{source_tile_size[1]} tiles to {tile_width}x{tile_height} "
+                                 f"to fit the {columns}x{rows} atlas within {max_dimension}px.")
+                tile_paths = [abspath(image.filepath_raw.replace('<UDIM>', str(tile.number))) for tile in tiles]
+                bands = [tile_paths[row * columns:(row + 1) * columns] for row in range(rows)]
 
                 safe_mat_name = "".join(c for c in mat.name if c.isalnum())
                 safe_img_name = "".join(c for c in image.name if c.isalnum())
                 atlas_filename = f"{safe_mat_name}_{safe_img_name}_atlas.png"
                 atlas_filepath = os.path.join(bake_dir, atlas_filename)
-                atlas_pil_image.save(atlas_filepath)
+
+                fingerprint = remix_image_jobs.atlas_fingerprint(bands, (tile_width, tile_height))
+                cached_atlas_path = os.path.join(CUSTOM_IMAGE_CACHE_PATH, f"atlas_{fingerprint[:24]}.png")
+                if os.path.exists(cached_atlas_path):
+                    logging.info(f"Reusing cached atlas for '{image.name}' (tiles unchanged).")
+                    remix_image_jobs.touch(cached_atlas_path)
+                else:
+                    os.makedirs(CUSTOM_IMAGE_CACHE_PATH, exist_ok=True)
+                    _, error = remix_image_jobs.stitch_atlas(
+                        bands, (tile_width, tile_height), cached_atlas_path,
+                        max_workers=max(1, min(len(tiles), (os.cpu_count() or 2) - 1))
+                    )
+                    if error:
+                        logging.error(f"Could not stitch atlas for '{image.name}': {error}. Skipping this set.")
+                        continue
+                shutil.copyfile(cached_atlas_path, atlas_filepath)
 
                 atlas_tex_node = nt.nodes.new('ShaderNodeTexImage')
                 atlas_tex_node.image = bpy.data.images.load(atlas_filepath)
@@ -4469,8 +5655,9 @@ if IS_BLENDER_CONTEXT:
             num_tiles = len(processed_tiles)
             if num_tiles == 0: return
     
-            logging.info(f"Transforming UVs for {len(objects_to_process)} object(s) to fit {num_tiles}-tile atlas.")
-            tile_number_to_atlas_index = {tile.number: i for i, tile in enumerate(processed_tiles)}
+            columns, rows = remix_array_ops.compute_atlas_grid(num_tiles)
+            logging.info(f"Transforming UVs for {len(objects_to_process)} object(s) to fit {num_tiles}-tile atlas ({columns}x{rows} grid).")
+            tile_numbers = [tile.number for tile in processed_tiles]
     
             for obj in objects_to_process:
                 if not obj.data or not obj.data.uv_layers: continue
@@ -4490,6 +5677,10 @@ if IS_BLENDER_CONTEXT:
                         continue
                 # --- SURGICAL CHANGE END ---
 
+                # Read the source UVs before adding a layer, which can reallocate layer storage.
+                source_uvs = np.empty(len(source_uv_layer.data) * 2, dtype=np.float32)
+                source_uv_layer.data.foreach_get("uv", source_uvs)
+
                 atlas_uv_map_name = "remix_atlas_uv"
                 if atlas_uv_map_name in obj.data.uv_layers:
                     atlas_uv_layer = obj.data.uv_layers[atlas_uv_map_name]
@@ -4498,19 +5689,9 @@ if IS_BLENDER_CONTEXT:
 
                 obj.data.uv_layers.active = atlas_uv_layer
 
-                for loop_index in range(len(source_uv_layer.data)):
-                    u_original, v_original = source_uv_layer.data[loop_index].uv
-                    tile_u_offset = math.floor(u_original)
-                    udim_number = 1001 + tile_u_offset
-                    atlas_index = tile_number_to_atlas_index.get(udim_number)
-            
-                    if atlas_index is not None:
-                        u_fractional = u_original - tile_u_offset
-                        u_new = (u_fractional + atlas_index) / num_tiles
-                        atlas_uv_layer.data[loop_index].uv = (u_new, v_original)
-                    else:
-                        # If a UV coord points to a tile that doesn't exist, collapse it to zero.
-                        atlas_uv_layer.data[loop_index].uv = (0.0, 0.0)
+                # UDIM tile -> atlas index lookup and remap for every loop at once. UVs
+                # pointing at a tile that doesn't exist collapse to zero.
+                atlas_uv_layer.data.foreach_set("uv", remix_array_ops.remap_udim_uvs_to_atlas(source_uvs, tile_numbers, columns, rows))
 
         
         def _prepare_materials_for_export(self, context, objects_to_process, texture_cache, baked_material_uuids):
@@ -4655,7 +5836,7 @@ if IS_BLENDER_CONTEXT:
     
             return mat
 
-        def _replace_or_append_on_server(self, context, ingested_usd):
+        def _replace_or_append_on_server(self, context, ingested_usd, base_name_to_search=None):
             """
             Smarter workflow handler. Automatically detects if an asset with the same
             base name exists to perform a replace, otherwise appends a new asset.
@@ -4664,106 +5845,28 @@ if IS_BLENDER_CONTEXT:
             """
             addon_prefs = context.preferences.addons[__name__].preferences
 
-            # 1. Determine the base name of the asset being exported to search for it on the server.
-            if addon_prefs.remix_use_custom_name and addon_prefs.remix_base_obj_name:
-                base_name_to_search = addon_prefs.remix_base_obj_name
-            else:
-                blend_name = get_blend_filename()
-                base_name_to_search = extract_base_name(blend_name)
-
-            logging.info(f"Searching for existing asset on server with base name: '{base_name_to_search}'")
-            prim_path_on_server, _ = check_blend_file_in_prims(base_name_to_search, context)
-
-            # 3. DECISION: Enter REPLACE mode if an existing version is found OR if the user manually checks the box.
-            if prim_path_on_server or addon_prefs.remix_replace_stock_mesh:
-    
-                prim_to_replace = prim_path_on_server
-    
-                if not prim_to_replace:
-                    logging.info("No match found by name, but 'Replace' is checked. Replacing current selection.")
-                    selected_prims = fetch_selected_mesh_prim_paths()
-                    if not selected_prims:
-                        raise RuntimeError("The 'Replace Stock Mesh' option is ticked, but no mesh is selected in Remix.")
-        
-                    prim_to_replace = next((p for p in selected_prims if "/meshes/" in p.lower()), None)
-                    if not prim_to_replace:
-                            raise RuntimeError("'Replace Stock Mesh' is ticked, but the selection is not a mesh prim.")
-
-                logging.info(f"Entering REPLACE workflow. Target prim: {prim_to_replace}")
-                success, new_ref = replace_mesh_with_put_request(prim_to_replace, ingested_usd, context=context)
-                if not success:
-                    raise RuntimeError(f"Failed to replace mesh for prim: {prim_to_replace}")
-    
-                select_mesh_prim_in_remix(new_ref, context)
-                return new_ref
-
-            # 4. If no existing version was found and the box is unchecked, enter APPEND mode.
-            else:
-                logging.info("Entering APPEND workflow (no existing asset found by name).")
-        
-                selected_prims = fetch_selected_mesh_prim_paths()
-        
-                if selected_prims:
-                    valid_parent_prims = [p for p in selected_prims if "/Looks/" not in p]
-
-                    if valid_parent_prims:
-                        full_path = valid_parent_prims[0]
-                
-                        # --- START OF THE REFINED FIX ---
-                        # Trim the full prim path back to the asset's root container.
-                        # The expected structure is /RootNode/meshes/mesh_...
-                        segments = full_path.strip('/').split('/')
-                        if len(segments) >= 3 and segments[1] == 'meshes':
-                            # Reconstruct the path to be the container, e.g., /RootNode/meshes/mesh_...
-                            target_prim_for_append = '/' + '/'.join(segments[:3])
-                            logging.info(f"Selected prim path '{full_path}' was trimmed to '{target_prim_for_append}' for append operation.")
-                        else:
-                            # If the path structure is unexpected, fall back to the selected prim path.
-                            target_prim_for_append = full_path
-                            logging.warning(f"Could not determine asset root from '{full_path}'. Using full path as parent.")
-                        # --- END OF THE REFINED FIX ---
+            # Determine the base name of the asset being exported to search for it on the server.
+            # Background uploads pass it in, as they must not read bpy data.
+            if base_name_to_search is None:
+                base_name_to_search = self._asset_base_name(context)
 
-                    else:
-                        target_prim_for_append = "/RootNode/meshes"
-                        logging.warning(f"Selection contained no valid parent prims. Appending to default location: {target_prim_for_append}")
-                else:
-                    target_prim_for_append = "/RootNode/meshes"
-                    logging.info(f"No prim selected in Remix. Appending to default location: {target_prim_for_append}")
-    
-                success, new_ref = append_mesh_with_post_request(target_prim_for_append, ingested_usd, context)
-                if not success:
-                    raise RuntimeError(f"Failed to append mesh under prim: {target_prim_for_append}")
-
-                select_mesh_prim_in_remix(new_ref, context)
-                return new_ref
+            return remix_server_flows.place_asset(
+                addon_prefs, ingested_usd, base_name_to_search,
+                prim_index_future=self._prim_index_future,
+                selected_mesh_prims=fetch_selected_mesh_prim_paths(self._selected_prim_paths),
+                replace_selected=addon_prefs.remix_replace_stock_mesh,
+            )
 
-        def _cleanup(self, context, return_value):
+        def _restore_scene_state(self, context):
             """
-            [SIMPLIFIED FIX] Handles all post-operation cleanup. No longer needs
-            to revert EXR conversions as the process is now non-destructive.
+            Undoes the export's changes to the scene (mirroring, flipped normals, material
+            and UV swaps, temporary materials and objects). Runs once: right after the OBJ
+            export when the upload goes to the background, otherwise from _cleanup.
             """
-            global export_lock
-
-            # --- 1. SHUTDOWN EXTERNAL PROCESSES ---
-            if hasattr(self, '_worker_slots') and self._worker_slots:
-                logging.info(f"Shutting down {len(self._worker_slots)} worker process(es)...")
-                for slot in self._worker_slots:
-                    worker = slot.get('process')
-                    if worker and worker.poll() is None:
-                        try: worker.terminate()
-                        except Exception: pass
-        
-                for slot in self._worker_slots:
-                    worker = slot.get('process')
-                    if worker and worker.poll() is None:
-                        try: worker.wait(timeout=2)
-                        except subprocess.TimeoutExpired: worker.kill()
+            if self._export_data.get("scene_restored"):
+                return
+            self._export_data["scene_restored"] = True
 
-            if hasattr(self, '_comm_threads'):
-                for thread in self._comm_threads:
-                    if thread.is_alive(): thread.join(timeout=1)
-                self._comm_threads.clear()
-    
             # --- 2. RESTORE BLENDER SCENE STATE ---
             if self._export_data.get("was_mirrored_on_export"):
                 objects_that_were_mirrored = self._export_data.get("objects_for_export", [])
@@ -4821,8 +5924,89 @@ if IS_BLENDER_CONTEXT:
                         if mesh_data and mesh_data.users == 0:
                             bpy.data.meshes.remove(mesh_data)
                     except Exception: pass
-            
+
+        def _shut_down_workers(self):
+            """
+            Stops the bake workers and their reader threads (headless runs park the
+            idle ones instead). Safe to call twice: modal() calls it before the
+            background upload, _cleanup calls it again.
+            """
+            if getattr(self, '_shutdown_event', None) is not None:
+                self._shutdown_event.set()
+
+            if self.headless and self._worker_slots:
+                self._park_idle_workers()
+
+            if hasattr(self, '_worker_slots') and self._worker_slots:
+                live_workers = [slot['process'] for slot in self._worker_slots if slot.get('process') and slot['process'].poll() is None]
+                if live_workers:
+                    logging.info(f"Shutting down {len(live_workers)} worker process(es)...")
+                for worker in live_workers:
+                    try: worker.terminate()
+                    except Exception: pass
+
+                for slot in self._worker_slots:
+                    worker = slot.get('process')
+                    if worker and worker.poll() is None:
+                        try: worker.wait(timeout=2)
+                        except subprocess.TimeoutExpired: worker.kill()
+                    WORKER_ROUTES.pop(worker, None)
+
+            if self._retiring_workers:
+                self._reap_retiring_workers(force=True)
+
+            if hasattr(self, '_comm_threads'):
+                for thread in self._comm_threads:
+                    if thread.is_alive(): thread.join(timeout=1)
+                self._comm_threads.clear()
+
+        def _cleanup(self, context, return_value):
+            """
+            [SIMPLIFIED FIX] Handles all post-operation cleanup. No longer needs
+            to revert EXR conversions as the process is now non-destructive.
+            """
+            global export_lock
+
+            # --- 1. SHUTDOWN EXTERNAL PROCESSES ---
+            self._shut_down_workers()
+
+            if self._exr_conversion is not None:
+                abort_exr_texture_conversion(self._exr_conversion)
+                self._exr_conversion = None
+
+            if self._composite_pool is not None:
+                self._composite_pool.shutdown(wait=True, cancel_futures=True)
+                self._composite_pool = None
+            self._composite_futures = {}
+
+            if getattr(self, '_resource_sampler', None) is not None:
+                self._resource_sampler.stop()
+                self._resource_sampler = None
+
+            # A finished export no longer needs its journal; anything else keeps it for "Resume".
+            if self._journal is not None:
+                self._journal.close()
+                self._journal_writes.clear()
+                done, total = self._journal.counts()
+                if return_value == {'FINISHED'} or total == 0:
+                    self._journal.discard()
+                else:
+                    self._journal.set_state(remix_export_journal.STATE_INTERRUPTED)
+                    logging.info(f"Export journal kept for resuming: {done}/{total} bake(s) completed ({self._journal.path}).")
+                self._journal = None
+
+            if self._telemetry is not None and len(self._telemetry) > 0:
+                self._write_telemetry_report(return_value)
+            self._telemetry = None
+    
+            # --- 2 & 3. RESTORE BLENDER SCENE STATE, DELETE TEMPORARY BLENDER DATA ---
+            self._restore_scene_state(context)
+
             # --- 4. CLEANUP DISK AND UI ---
+            if self._upload_future is not None and not self._upload_future.done():
+                # The server may still be reading the exported files; the startup sweep removes them later.
+                logging.warning("Export ended while the upload to Remix was still running. Leaving its files in place.")
+                self._export_data.get("temp_files_to_clean", set()).clear()
             for path_to_clean in self._export_data.get("temp_files_to_clean", set()):
                 if os.path.normpath(path_to_clean) == os.path.normpath(CUSTOM_COLLECT_PATH):
                     continue
@@ -4837,10 +6021,20 @@ if IS_BLENDER_CONTEXT:
             if self._timer:
                 context.window_manager.event_timer_remove(self._timer)
             self._timer = None
-            context.workspace.status_text_set(None)
+            if context.workspace: context.workspace.status_text_set(None)
+
+            LAST_EXPORT_STATS.clear()
+            LAST_EXPORT_STATS.update({
+                'result': next(iter(return_value), 'CANCELLED'),
+                'total_tasks': self._total_tasks,
+                'failed_tasks': self._failed_tasks,
+                'duration_sec': time.perf_counter() - getattr(self, '_full_op_start_time', time.perf_counter()),
+            })
 
             # --- 5. FINAL SAVE & LOCK RELEASE ---
-            if return_value == {'FINISHED'}:
+            # After a background upload the artist has had the scene back and may have
+            # edited it; saving now would write their changes without asking.
+            if return_value == {'FINISHED'} and not self._scene_handed_back:
                 try:
                     bpy.ops.wm.save_mainfile()
                 except Exception: pass
@@ -4850,7 +6044,7 @@ if IS_BLENDER_CONTEXT:
 
         def cancel(self, context):
             # The main cleanup function now handles worker shutdown
-            if self._export_data.get("normals_were_flipped"):
+            if self._export_data.get("normals_were_flipped") and not self._export_data.get("scene_restored"):
                 logging.info("Operation cancelled, flipping normals back to original state.")
                 batch_flip_normals_optimized(self._export_data["mesh_objects_to_export"], context)
         
@@ -4862,348 +6056,23 @@ if IS_BLENDER_CONTEXT:
     ingest_error_message = ""
 
     def upload_to_api(obj_path, ingest_dir, context):
+        """Ingests the exported OBJ (see remix_server_flows.upload_model). Returns the USD path or None."""
+        global ingest_error_message
         addon_prefs = context.preferences.addons[__name__].preferences
-        try:
-            url = addon_prefs.remix_export_url.rstrip('/') + "/model"
-            abs_obj_path = os.path.abspath(obj_path).replace('\\', '/')
-            meshes_subdir = os.path.join(ingest_dir, "meshes").replace('\\', '/')
-
-            # This is the correct, full payload structure the server expects.
-            # The dynamic values for input/output paths will be inserted into it.
-            payload = {
-                "executor": 1,
-                "name": "Model(s)",
-                "context_plugin": {
-                    "name": "AssetImporter",
-                    "data": {
-                        "allow_empty_input_files_list": True, "bake_material": False, "baking_scales": False,
-                        "channel": "Default", "close_stage_on_exit": True, "context_name": "ingestcraft",
-                        "convert_fbx_to_y_up": False, "convert_fbx_to_z_up": False, "convert_stage_up_y": False,
-                        "convert_stage_up_z": False, "cook_mass_template": True, "create_context_if_not_exist": True,
-                        "create_output_directory_if_missing": True, "create_world_as_default_root_prim": True,
-                        "data_flows": [
-                            {"channel": "write_metadata", "name": "InOutData", "push_input_data": True, "push_output_data": True},
-                            {"channel": "ingestion_output", "name": "InOutData", "push_input_data": False, "push_output_data": True}
-                        ],
-                        "default_output_endpoint": "/stagecraft/assets/default-directory", "disabling_instancing": False,
-                        "embed_mdl_in_usd": True, "embed_textures": True, "export_hidden_props": False,
-                        "export_mdl_gltf_extension": False, "export_preview_surface": False, "export_separate_gltf": False,
-                        "expose_mass_queue_action_ui": True, "expose_mass_ui": True, "full_path_keep": False,
-                        "global_progress_value": 0, "hide_context_ui": True, "ignore_animations": False,
-                        "ignore_camera": False, "ignore_flip_rotations": False, "ignore_light": False,
-                        "ignore_materials": False, "ignore_pivots": False, "ignore_unbound_bones": False,
-                        "input_files": [], "keep_all_materials": False, "merge_all_meshes": False,
-                        "output_directory": "", "output_usd_extension": "usd", "progress": [0, "Initializing", True],
-                        "single_mesh": False, "smooth_normals": True, "support_point_instancer": False,
-                        "use_double_precision_to_usd_transform_op": False, "use_meter_as_world_unit": False
-                    }
-                },
-                "check_plugins": [
-                    {"name": "ClearUnassignedMaterial", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "include_geom_subset": True, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllMeshes"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
-                    {"name": "DefaultMaterial", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "include_geom_subset": False, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllMeshes"}], "data": {"channel": "Default", "context_name": "", "cook_mass_template": False, "default_material_mdl_name": "OmniPBR", "default_material_mdl_url": "OmniPBR.mdl", "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
-                    {"name": "MaterialShaders", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllMaterials"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "ignore_not_convertable_shaders": False, "progress": [0, "Initializing", True], "save_on_fix_failure": True, "shader_subidentifiers": {"AperturePBR_Opacity": ".*", "AperturePBR_Translucent": "translucent|glass|trans"}}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
-                    {"name": "ValueMapping", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllShaders"}], "data": {"attributes": {"inputs:emissive_intensity": [{"input_value": 10000, "operator": "=", "output_value": 1}]}, "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True}, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
-                    {"name": "ConvertToOctahedral", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllShaders"}], "data": {"channel": "Default", "conversion_args": {"inputs:normalmap_texture": {"encoding_attr": "inputs:encoding", "replace_suffix": "_Normal", "suffix": "_OTH_Normal"}}, "cook_mass_template": False, "data_flows": [{"channel": "cleanup_files", "name": "InOutData", "push_input_data": True, "push_output_data": True}], "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "replace_udim_textures_by_empty": True, "save_on_fix_failure": True}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
-                    {"name": "ConvertToDDS", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllShaders"}], "data": {"channel": "Default", "conversion_args": {"inputs:diffuse_texture": {"args": ["--format", "bc7", "--mip-gamma-correct"]}, "inputs:emissive_mask_texture": {"args": ["--format", "bc7", "--mip-gamma-correct"]}, "inputs:height_texture": {"args": ["--format", "bc4", "--no-mip-gamma-correct", "--mip-filter", "max"]}, "inputs:metallic_texture": {"args": ["--format", "bc4", "--no-mip-gamma-correct"]}, "inputs:normalmap_texture": {"args": ["--format", "bc5", "--no-mip-gamma-correct"]}, "inputs:reflectionroughness_texture": {"args": ["--format", "bc4", "--no-mip-gamma-correct"]}, "inputs:transmittance_texture": {"args": ["--format", "bc7", "--mip-gamma-correct"]}}, "cook_mass_template": False, "data_flows": [{"channel": "cleanup_files", "name": "InOutData", "push_input_data": True, "push_output_data": True}, {"channel": "write_metadata", "name": "InOutData", "push_input_data": False, "push_output_data": True}], "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "replace_udim_textures_by_empty": True, "save_on_fix_failure": True, "suffix": ".rtex.dds"}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
-                    {"name": "RelativeAssetPaths", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllPrims"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
-                    {"name": "RelativeReferences", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllPrims"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
-                    {"name": "WrapRootPrims", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "Nothing"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True, "set_default_prim": True, "wrap_prim_name": "XForms"}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_on_exit": True}, "name": "CurrentStage"}},
-                    {"name": "ApplyUnitScale", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False, "select_session_layer_prims": False}, "name": "RootPrims"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": True, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True, "scale_target": 1}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_on_exit": True}, "name": "CurrentStage"}},
-                    {"name": "WrapRootPrims", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "Nothing"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True, "set_default_prim": True, "wrap_prim_name": "ReferenceTarget"}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_on_exit": True}, "name": "CurrentStage"}}
-                ],
-                "resultor_plugins": [
-                    {"name": "FileCleanup", "data": {"channel": "cleanup_files", "cleanup_input": True, "cleanup_output": False, "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True]}},
-                    {"name": "FileMetadataWritter", "data": {"channel": "write_metadata", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True]}}
-                ]
-            }
-
-            # --- Inject dynamic values into the correct payload ---
-            payload["context_plugin"]["data"]["input_files"] = [abs_obj_path]
-            payload["context_plugin"]["data"]["output_directory"] = meshes_subdir
-
-            logging.info(f"Uploading OBJ to {url}")
-            # Using the previously corrected make_request_with_retries to get detailed errors
-            response = make_request_with_retries('POST', url, json_payload=payload, verify=addon_prefs.remix_verify_ssl, retries=1)
-
-            if response is None or response.status_code not in [200, 201, 204]:
-                error_detail = "No response from server (network error)."
-                status_code = "N/A"
-                if response is not None:
-                    status_code = response.status_code
-                    try:
-                        error_detail = response.json().get("detail", response.text)
-                    except json.JSONDecodeError:
-                        error_detail = response.text
-            
-                logging.error(f"Failed to upload OBJ. Status: {status_code}, Response: {error_detail}")
-                if status_code == 500 and "validation did not complete successfully" in error_detail:
-                    error_msg = "Ingestion failed: The server validation failed. Check server logs and ensure Ingest Directory is a valid project path."
-                    bpy.ops.object.show_popup('INVOKE_DEFAULT', message=error_msg, success=False)
-                return None
-
-            # Success path
-            response_data = response.json()
-            completed_schemas = response_data.get("completed_schemas", [])
-            if not completed_schemas:
-                logging.error("No completed schemas found in successful response.")
-                return None
-
-            # Extract the final USD path from the complex response
-            # This logic is based on the structure of the provided payload
-            final_usd_path = None
-            try:
-                data_flows = completed_schemas[0].get("context_plugin", {}).get("data", {}).get("data_flows", [])
-                for flow in data_flows:
-                    if flow.get("channel") == "ingestion_output" and flow.get("output_data"):
-                        final_usd_path = flow["output_data"][0].replace('\\', '/')
-                        break
-                if final_usd_path:
-                     logging.info(f"Successfully ingested. Server returned USD Path: {final_usd_path}")
-                     return final_usd_path
-                else:
-                    logging.error("Could not find final USD path in server response's 'ingestion_output' data flow.")
-                    return None
-            except (IndexError, KeyError) as e_parse:
-                logging.error(f"Error parsing successful response for USD path: {e_parse}", exc_info=True)
-                return None
-
-        except Exception as e_general:
-            logging.error(f"An unexpected error occurred in upload_to_api: {e_general}", exc_info=True)
-            return None
+        final_usd_path, error_msg = remix_server_flows.upload_model(addon_prefs, obj_path, ingest_dir)
+        ingest_error_message = error_msg or ""
+        # Background uploads surface the message through the operator report instead.
+        if error_msg and threading.current_thread() is threading.main_thread():
+            bpy.ops.object.show_popup('INVOKE_DEFAULT', message=error_msg, success=False)
+        return final_usd_path
 
     
-    def check_blend_file_in_prims(blend_name, context):
-        """
-        [DEFINITIVE V3 - PRECISE PATTERN MATCHING] Finds a prim on the server that
-        matches the asset's base name followed by a version number. It no longer strips
-        parts of names and instead uses a precise regex pattern to prevent incorrectly
-        matching assets like 'Test_55' with 'Test6_16'.
-        """
-        addon_prefs = context.preferences.addons[__name__].preferences
-        try:
-            server_url = addon_prefs.remix_server_url.rstrip('/')
-            get_url = f"{server_url}/assets/?selection=false&filter_session_assets=false&exists=true"
-            headers = {'accept': 'application/lightspeed.remix.service+json; version=1.0'}
-
-            logging.info(f"Fetching prims from: {get_url}")
-            response = make_request_with_retries('GET', get_url, headers=headers, verify=addon_prefs.remix_verify_ssl)
-
-            if not response or response.status_code != 200:
-                logging.error(f"Failed to fetch prims. Status: {response.status_code if response else 'No Response'}")
-                return None, None
-
-            data = response.json()
-            asset_or_prim_paths = data.get("prim_paths", data.get("asset_paths", []))
-        
-            # This is the CONCEPTUAL base name (e.g., "Test", or "Test6").
-            if addon_prefs.remix_use_custom_name and addon_prefs.remix_use_selection_only and addon_prefs.remix_base_obj_name:
-                base_name_to_search = addon_prefs.remix_base_obj_name
-            else:
-                # We use the blend_name directly as the base, without stripping anything.
-                base_name_to_search = blend_name
-
-            logging.debug(f"Searching for prims with base name pattern: '{base_name_to_search}_<version>'")
-        
-            # --- THIS IS THE CRITICAL FIX ---
-            # We build a precise regex pattern. It means:
-            # ^                  - Must start with
-            # (base_name)        - Our exact base name (e.g., "Test" or "Test6")
-            # _                  - Followed by an underscore
-            # \d+                - Followed by one or more numbers
-            # $                  - And nothing else after it.
-            # re.IGNORECASE makes the match case-insensitive.
-            match_pattern = re.compile(f"^{re.escape(base_name_to_search)}_\\d+$", re.IGNORECASE)
-
-            for path in asset_or_prim_paths:
-                segments = path.strip('/').split('/')
-            
-                # Check every part of the server path.
-                for segment in segments:
-                    # Does the server prim name (e.g., "Test_55" or "Test6_16") match our precise pattern?
-                    if match_pattern.fullmatch(segment):
-                    
-                        logging.info(f"PRECISE MATCH FOUND: Local base '{base_name_to_search}' matches server asset '{segment}' in path '{path}'")
-                    
-                        # We found the correct asset. Now find its reference prim.
-                        reference_prim_path = None
-                        for i, ref_segment in enumerate(segments):
-                            if ref_segment.lower().startswith('ref_'):
-                                reference_prim_path = '/' + '/'.join(segments[:i + 1])
-                                break
-                    
-                        if reference_prim_path:
-                            logging.info(f"Reference prim identified: {reference_prim_path} for matched path {path}")
-                            # Return the full path of the asset we found and its reference prim.
-                            return path, reference_prim_path
-                        else:
-                            logging.warning(f"Found matching asset name '{segment}' but no 'ref_' prim in path '{path}'.")
-                            break # Stop checking segments in this path
-
-            logging.info(f"No asset matching the precise pattern '{base_name_to_search}_<version>' was found on the server.")
-            return None, None
-
-        except Exception as e:
-            logging.error(f"Error checking prims: {e}", exc_info=True)
-            return None, None
-
     def extract_base_name(blend_name):
         match = re.match(r"^(.*?)(?:_\d+)?$", blend_name)
         if match:
             return match.group(1)
         return blend_name
     
-    def replace_mesh_with_put_request(prim_path, new_usd, existing_path='', existing_layer='', context=None):
-        addon_prefs = context.preferences.addons[__name__].preferences
-        try:
-            segments = prim_path.strip('/').split('/')
-            ref_index = None
-            for i, segment in enumerate(segments):
-                if segment.lower().startswith('ref_'):
-                    ref_index = i
-                    break
-
-            if ref_index is not None:
-                trimmed_segments = segments[:ref_index + 1]
-                trimmed_prim_path = '/' + '/'.join(trimmed_segments)
-            else:
-                if len(segments) >= 3:
-                    trimmed_prim_path = '/' + '/'.join(segments[:3])
-                else:
-                    logging.error(f"Invalid prim path: {prim_path}")
-                    return False, None
-
-            logging.debug(f"Trimmed prim path to '{trimmed_prim_path}'")
-            print(f"Trimmed prim path to '{trimmed_prim_path}'")
-
-            encoded_path = urllib.parse.quote(trimmed_prim_path, safe='')
-            logging.debug(f"Encoded trimmed prim path: {encoded_path}")
-            print(f"Encoded trimmed prim path: {encoded_path}")
-
-            url = f"{addon_prefs.remix_server_url.rstrip('/')}/assets/{encoded_path}/file-paths"
-            logging.debug(f"Constructed PUT URL: {url}")
-            print(f"Constructed PUT URL: {url}")
-
-            payload = {
-                "asset_file_path": new_usd.replace('/', '\\'),
-                "force": False
-            }
-            logging.debug(f"PUT Payload: {payload}")
-            print(f"PUT Payload: {payload}")
-
-            headers_put = {
-                'Content-Type': 'application/lightspeed.remix.service+json; version=1.0'
-            }
-
-            logging.info(f"Replacing mesh via PUT request to: {url} with payload: {payload}")
-            print(f"Replacing mesh via PUT request to: {url} with payload: {payload}")
-
-            response_put = make_request_with_retries(
-                method='PUT',
-                url=url,
-                headers=headers_put,
-                json_payload=payload,
-                verify=addon_prefs.remix_verify_ssl
-            )
-
-            if response_put and response_put.status_code in [200, 204]:
-                logging.info(f"Mesh replaced successfully via PUT request for prim: {trimmed_prim_path}")
-                print(f"Mesh replaced successfully via PUT request for prim: {trimmed_prim_path}")
-
-                try:
-                    response_json = response_put.json()
-                    new_reference_paths = response_json.get("reference_paths", [])
-                    if new_reference_paths and len(new_reference_paths[0]) > 0:
-                        new_reference_path = new_reference_paths[0][0]
-                        logging.info(f"New Reference Path: {new_reference_path}")
-                        print(f"New Reference Path: {new_reference_path}")
-                        return True, new_reference_path
-                    else:
-                        logging.error("No new reference paths found in the PUT response.")
-                        print("No new reference paths found in the PUT response.")
-                        return False, None
-                except ValueError:
-                    logging.error("Failed to parse JSON response from PUT request.")
-                    print("Failed to parse JSON response from PUT request.")
-                    return False, None
-            else:
-                status = response_put.status_code if response_put else 'No Response'
-                response_text = response_put.text if response_put else 'No Response'
-                logging.error(f"Failed to replace mesh via PUT. Status: {status}, Response: {response_text}")
-                print(f"Failed to replace mesh via PUT. Status: {status}, Response: {response_text}")
-                return False, None
-        finally:
-            pass
-    
-
-    def append_mesh_with_post_request(reference_path, ingested_usd, context):
-        addon_prefs = context.preferences.addons[__name__].preferences
-        try:
-            if reference_path is None:
-                parent_prim = "/RootNode/meshes"
-                logging.debug(f"No reference path provided. Using default parent prim path: {parent_prim}")
-                print(f"No reference path provided. Using default parent prim path: {parent_prim}")
-            else:
-                parent_prim = reference_path
-                logging.debug(f"Using provided reference path as parent prim: {parent_prim}")
-                print(f"Using provided reference path as parent prim: {parent_prim}")
-
-            encoded_parent_prim = urllib.parse.quote(parent_prim, safe='')
-            logging.debug(f"Encoded parent prim path: {encoded_parent_prim}")
-            print(f"Encoded parent prim path: {encoded_parent_prim}")
-
-            base_url = addon_prefs.remix_server_url.rstrip('/')
-            if base_url.endswith('/stagecraft'):
-                append_url = f"{base_url}/assets/{encoded_parent_prim}/file-paths"
-            else:
-                append_url = f"{base_url}/stagecraft/assets/{encoded_parent_prim}/file-paths"
-            logging.debug(f"Constructed append URL: {append_url}")
-            print(f"Constructed append URL: {append_url}")
-
-            payload = {
-                "asset_file_path": ingested_usd.replace('\\', '/'),
-                "force": False
-            }
-
-            headers = {
-                'accept': 'application/lightspeed.remix.service+json; version=1.0',
-                'Content-Type': 'application/lightspeed.remix.service+json; version=1.0'
-            }
-
-            logging.info(f"Appending mesh via POST to: {append_url} with payload: {payload}")
-            print(f"Appending mesh via POST to: {append_url} with payload: {payload}")
-
-            response = make_request_with_retries(
-                method='POST',
-                url=append_url,
-                json_payload=payload,
-                headers=headers,
-                verify=addon_prefs.remix_verify_ssl
-            )
-
-            if not response or response.status_code not in [200, 201, 204]:
-                status = response.status_code if response else 'No Response'
-                response_text = response.text if response else 'No Response'
-                logging.error(f"Failed to append mesh via POST. Status: {status}, Response: {response_text}")
-                print(f"Failed to append mesh via POST. Status: {status}, Response: {response_text}")
-                return False, None
-
-            response_data = response.json()
-            reference_paths = response_data.get("reference_paths", [])
-            if not reference_paths or not reference_paths[0]:
-                logging.error("No reference paths returned in response.")
-                print("No reference paths returned in response.")
-                return False, None
-
-            reference_path_returned = reference_paths[0][0]
-            logging.info(f"Mesh appended successfully via POST request. Reference path: {reference_path_returned}")
-            print(f"Mesh appended successfully via POST request. Reference path: {reference_path_returned}")
-            return True, reference_path_returned
-
-        except Exception as e:
-            logging.error(f"Error appending mesh via POST request: {e}")
-            print(f"Error appending mesh via POST request: {e}")
-            return False, None
-         
     class OBJECT_OT_show_popup(Operator):
         bl_idname = "object.show_popup"
         bl_label = "Popup Message"
@@ -5224,6 +6093,10 @@ if IS_BLENDER_CONTEXT:
             return {'FINISHED'}
 
         def invoke(self, context, event):
+            if bpy.app.background:
+                # No window to show a dialog in (headless batch export).
+                (logging.info if self.success else logging.error)(self.message)
+                return {'FINISHED'}
             return context.window_manager.invoke_props_dialog(self, width=400)
 
 
@@ -5381,6 +6254,8 @@ if IS_BLENDER_CONTEXT:
     
             export_box.prop(addon_prefs, "remix_export_scale", text="Export Scale")
             export_box.operator("object.export_and_ingest", text="Export and Ingest", icon='PLAY')
+            if bpy.data.filepath and os.path.exists(remix_export_journal.journal_path_for(CUSTOM_JOURNAL_PATH, bpy.data.filepath)):
+                export_box.operator("object.export_and_ingest", text="Resume Last Export", icon='RECOVER_LAST').resume = True
 
             import_box = layout.box()
             import_box.label(text="USD Import", icon='IMPORT')
@@ -5473,6 +6348,7 @@ if IS_BLENDER_CONTEXT:
     def unregister():
         log = logging.getLogger(__name__)
         _kill_all_active_workers()
+        remix_http.close_sessions()
 
         try:
             if hasattr(atexit, 'unregister'):
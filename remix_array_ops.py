@@ -0,0 +1,154 @@
+"""
+Whole-array NumPy kernels shared by the Remix addon and its bake worker.
+
+Blender hands pixel and UV data over through foreach_get/foreach_set as flat
+float32 buffers; these functions operate on those buffers directly. Keep this
+module free of bpy so it can be imported by the worker script, by pool
+processes and by the benchmarks.
+"""
+
+import math
+
+import numpy as np
+
+# Bounds the float64 scratch memory used by the blend kernels (pixels per chunk).
+BLEND_CHUNK_PIXELS = 1 << 20
+
+
+def mirror_rgba_horizontally(pixels, width, height, channels=4):
+    """
+    Returns a copy of a flat pixel buffer with every row reversed (mirrored on X).
+    Equivalent to moving pixel (x, y) to (width - 1 - x, y).
+    """
+    view = np.asarray(pixels, dtype=np.float32).reshape(height, width, channels)
+    return np.ascontiguousarray(view[:, ::-1, :]).reshape(-1)
+
+
+def blend_decal_over_base(base_pixels, decal_pixels, alpha_mask_pixels, chunk_pixels=BLEND_CHUNK_PIXELS):
+    """
+    Composites a decal over a base albedo in place, using the R channel of the
+    alpha mask as coverage:
+
+        base.rgb  = base.rgb * (1 - a) + decal.rgb * a
+        base.a    = 1.0
+        decal.a   = a
+
+    All three arguments are flat RGBA float32 buffers of equal length. The math
+    runs in float64 and is rounded to float32 once, exactly like assigning
+    Python floats to Image.pixels, so the result is bit-identical to the
+    original per-pixel Python loop.
+    """
+    base = base_pixels.reshape(-1, 4)
+    decal = decal_pixels.reshape(-1, 4)
+    mask = alpha_mask_pixels.reshape(-1, 4)
+
+    for start in range(0, base.shape[0], chunk_pixels):
+        end = start + chunk_pixels
+        alpha = mask[start:end, 0].astype(np.float64)[:, None]
+        base_rgb = base[start:end, :3].astype(np.float64)
+        decal_rgb = decal[start:end, :3].astype(np.float64)
+        base[start:end, :3] = base_rgb * (1.0 - alpha) + decal_rgb * alpha
+        decal[start:end, 3] = mask[start:end, 0]
+
+    base[:, 3] = 1.0
+    return base_pixels, decal_pixels
+
+
+def flip_uvs_horizontally(uvs):
+    """Returns flat (u, v, u, v, ...) float32 UVs with every U replaced by 1 - U."""
+    flipped = np.array(uvs, dtype=np.float32).reshape(-1, 2)
+    flipped[:, 0] = 1.0 - flipped[:, 0].astype(np.float64)
+    return flipped.reshape(-1)
+
+
+def compute_atlas_grid(num_tiles):
+    """
+    Columns x rows for a near-square atlas of `num_tiles` equal tiles, filled row
+    by row from the top-left. Depends on the tile count only, so the UV remap can
+    be computed before any tile is read.
+    """
+    if num_tiles <= 0:
+        return 0, 0
+    columns = int(math.ceil(math.sqrt(num_tiles)))
+    rows = int(math.ceil(num_tiles / columns))
+    return columns, rows
+
+
+def atlas_tile_size(tile_width, tile_height, columns, rows, max_dimension):
+    """
+    Size each tile is stored at in the atlas so neither atlas side exceeds
+    `max_dimension` (0 = no limit). Tiles are only ever scaled down.
+    """
+    if max_dimension <= 0 or columns <= 0 or rows <= 0:
+        return tile_width, tile_height
+    scale = min(1.0, max_dimension / (tile_width * columns), max_dimension / (tile_height * rows))
+    return max(1, int(tile_width * scale)), max(1, int(tile_height * scale))
+
+
+def remap_udim_uvs_to_atlas(uvs, tile_numbers, columns=None, rows=1):
+    """
+    Remaps flat (u, v, ...) float32 UVs from UDIM tile space into an atlas grid
+    of `columns` x `rows` holding `tile_numbers` in order, row by row from the
+    top-left (the default is a single horizontal strip). A loop in tile
+    1001 + floor(u) at atlas index k moves to column k % columns and row
+    k // columns: u = (frac(u) + column) / columns, v = (v + rows - 1 - row) / rows.
+    Loops that land on a tile missing from the atlas collapse to (0, 0).
+    """
+    uv = np.asarray(uvs, dtype=np.float32).reshape(-1, 2)
+    num_tiles = len(tile_numbers)
+    if columns is None:
+        columns, rows = num_tiles, 1
+    remapped = np.zeros(uv.shape, dtype=np.float64)
+    if num_tiles == 0 or uv.shape[0] == 0:
+        return remapped.astype(np.float32).reshape(-1)
+
+    u = uv[:, 0].astype(np.float64)
+    tile_u_offset = np.floor(u)
+    udim_numbers = 1001.0 + tile_u_offset
+
+    # Vectorized tile_number -> atlas_index lookup. Later duplicates win, like a dict.
+    tile_array = np.asarray(tile_numbers, dtype=np.float64)
+    order = np.argsort(tile_array, kind='stable')
+    sorted_tiles = tile_array[order]
+    last_of_each = np.r_[sorted_tiles[1:] != sorted_tiles[:-1], True]
+    sorted_tiles, order = sorted_tiles[last_of_each], order[last_of_each]
+
+    positions = np.searchsorted(sorted_tiles, udim_numbers)
+    positions_clipped = np.minimum(positions, len(sorted_tiles) - 1)
+    found = (positions < len(sorted_tiles)) & (sorted_tiles[positions_clipped] == udim_numbers)
+    atlas_index = order[positions_clipped[found]]
+
+    column, row = atlas_index % columns, atlas_index // columns
+    remapped[found, 0] = ((u[found] - tile_u_offset[found]) + column) / columns
+    remapped[found, 1] = (uv[found, 1] + (rows - 1 - row)) / rows
+    return remapped.astype(np.float32).reshape(-1)
+
+
+def linear_to_srgb(values):
+    """Element-wise scene-linear -> sRGB transfer function (float64 result)."""
+    v = np.maximum(np.asarray(values, dtype=np.float64), 0.0)
+    return np.where(v < 0.0031308, v * 12.92, 1.055 * np.power(np.maximum(v, 0.0031308), 1.0 / 2.4) - 0.055)
+
+
+def srgb_to_linear(values):
+    """Element-wise sRGB -> scene-linear transfer function (float64 result)."""
+    v = np.maximum(np.asarray(values, dtype=np.float64), 0.0)
+    return np.where(v < 0.04045, v / 12.92, np.power((np.maximum(v, 0.04045) + 0.055) / 1.055, 2.4))
+
+
+def float_to_byte(values):
+    """Quantizes unit floats to uint8 the way Blender does (clamp, then round half up)."""
+    v = np.asarray(values, dtype=np.float64)
+    return np.clip(np.floor(v * 255.0 + 0.5), 0, 255).astype(np.uint8)
+
+
+def encode_bake_rgba(linear_rgb, is_color_data):
+    """
+    Returns the 8-bit RGBA pixel an EMIT bake stores for a constant emission of
+    `linear_rgb`: sRGB-encoded for color targets, raw for Non-Color targets,
+    with opaque alpha.
+    """
+    rgb = np.asarray(linear_rgb, dtype=np.float64)[:3]
+    if is_color_data:
+        rgb = linear_to_srgb(rgb)
+    return np.append(float_to_byte(rgb), np.uint8(255))
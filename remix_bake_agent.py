@@ -0,0 +1,602 @@
+"""
+Network bake agent: runs persistent bake workers on behalf of a remote Remix addon.
+
+    python remix_bake_agent.py --blender /path/to/blender --token <secret> [--host 127.0.0.1]
+                               [--port 47820] [--max-workers 4] [--store ~/.remix_agent_store]
+
+Each TCP connection from the addon is one remote worker slot: the agent starts a
+local remix_bake_worker.py for it and relays the worker's frames back. Task
+inputs (the isolated .blend and the source textures) are transferred
+content-addressed: before each task the addon announces the SHA-256 digests it
+needs, the agent replies with the ones it does not store yet, and only those
+files are sent. Textures shared between tasks therefore cross the network once
+per agent. Baked files travel back as MSG_OUTPUT payloads ahead of the task's
+MSG_RESULT.
+
+The agent opens and runs any .blend it is sent, so it only listens on localhost
+unless --host says otherwise, and every connection must present the agent's
+shared token (--token or REMIX_AGENT_TOKEN; a random one is generated and
+logged when neither is set) in its HELLO. Digests and file names received from
+the addon are validated before they touch the filesystem.
+
+Several agents can run on one machine (different --port and --store) to test a
+multi-agent setup on localhost.
+
+RemoteAgentProcess is the addon side. It mimics the part of subprocess.Popen the
+export operator's worker slots use (stdin/stdout/stderr, poll, wait, terminate,
+kill), so a remote agent plugs into the same slot machinery as a local worker.
+This module must stay free of bpy.
+"""
+
+import argparse
+import glob
+import hashlib
+import hmac
+import logging
+import os
+import queue
+import re
+import secrets
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+
+try:
+    from . import remix_ipc
+except ImportError:  # Run as a script on the agent machine.
+    import remix_ipc
+
+UDIM_TOKEN = "<UDIM>"
+CONNECT_TIMEOUT_SEC = 5.0
+MISSING_REPLY_TIMEOUT_SEC = 60.0
+TOKEN_ENV_VAR = "REMIX_AGENT_TOKEN"
+# A SHA-256 hex digest, exactly as file_digest() writes it.
+_DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+def file_digest(path, chunk_size=1 << 20):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def validate_digest(digest):
+    """Returns `digest` if it is a lowercase SHA-256 hex digest, otherwise raises ValueError."""
+    if not isinstance(digest, str) or not _DIGEST_PATTERN.match(digest):
+        raise ValueError(f"Invalid blob digest {str(digest)[:80]!r}.")
+    return digest
+
+
+def safe_child_path(directory, name):
+    """
+    `directory`/`name` for a plain file or directory name received over the
+    network. Raises ValueError if the result would not be directly inside
+    `directory` (separators, '..', absolute paths, drive letters).
+    """
+    if not isinstance(name, str) or name in ('', '.', '..') or os.path.basename(name) != name or '/' in name or '\\' in name:
+        raise ValueError(f"Invalid file name {str(name)[:80]!r}.")
+    path = os.path.join(directory, name)
+    if os.path.dirname(os.path.abspath(path)) != os.path.abspath(directory):
+        raise ValueError(f"File name {name!r} escapes '{directory}'.")
+    return path
+
+
+def parse_agent_list(text):
+    """
+    Parses the 'bake_agents' preference: comma-separated host:port entries, each
+    optionally suffixed with *N to open N worker slots on that agent.
+    Returns a list of (host, port), one per slot. Invalid entries are logged and skipped.
+    """
+    slots = []
+    for entry in (text or "").split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        address, _, count = entry.partition('*')
+        host, _, port = address.strip().rpartition(':')
+        try:
+            port = int(port) if host else remix_ipc.AGENT_DEFAULT_PORT
+            count = int(count) if count else 1
+        except ValueError:
+            logging.warning(f"Ignoring invalid bake agent entry '{entry}'.")
+            continue
+        slots.extend([(host or address.strip(), port)] * max(0, count))
+    return slots
+
+
+# --- Addon side ---
+
+_digest_cache = {}
+_digest_cache_lock = threading.Lock()
+
+
+def _cached_file_digest(path):
+    """Digests are cached per (path, size, mtime) so shared textures are hashed once per session."""
+    stat = os.stat(path)
+    key = (os.path.normcase(os.path.abspath(path)), stat.st_size, stat.st_mtime_ns)
+    with _digest_cache_lock:
+        digest = _digest_cache.get(key)
+    if digest is None:
+        digest = file_digest(path)
+        with _digest_cache_lock:
+            _digest_cache[key] = digest
+    return digest
+
+
+class _LineQueue:
+    """Read side of a pipe: readline() blocks until a line arrives and returns '' at EOF."""
+
+    def __init__(self):
+        self._lines = queue.Queue()
+
+    def put(self, line):
+        self._lines.put(line)
+
+    def close(self):
+        self._lines.put('')
+
+    def readline(self):
+        return self._lines.get()
+
+
+class _FrameInput:
+    """Write side of a pipe: every frame written is handed to the agent sender thread."""
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    def write(self, text):
+        if self._owner.returncode is not None:
+            raise BrokenPipeError("Remote bake agent connection is closed.")
+        for line in text.splitlines():
+            message = remix_ipc.decode_frame(line)
+            if message is not None:
+                self._owner._outbox.put(message)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self._owner._outbox.put(None)
+
+
+class RemoteAgentProcess:
+    """A worker slot backed by a remote bake agent instead of a local Blender process."""
+
+    def __init__(self, host, port, token="", connect_timeout=CONNECT_TIMEOUT_SEC):
+        self.host, self.port = host, port
+        # Shown wherever the operator logs a local worker's PID.
+        self.pid = f"{host}:{port}"
+        self.returncode = None
+        self.stdin = _FrameInput(self)
+        self.stdout = _LineQueue()
+        self.stderr = _LineQueue()
+
+        self._outbox = queue.Queue()
+        self._missing_replies = queue.Queue()
+        self._output_dirs = {}
+        self._texture_map = {}
+        self._send_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._quit_sent = False
+
+        self._sock = socket.create_connection((host, port), timeout=connect_timeout)
+        try:
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            remix_ipc.send_socket_message(self._sock, {'type': remix_ipc.MSG_HELLO, 'version': remix_ipc.PROTOCOL_VERSION, 'token': token or ""})
+            reply, _ = remix_ipc.recv_socket_message(self._sock)
+            if not reply or reply.get('type') != remix_ipc.MSG_HELLO:
+                raise ConnectionError((reply or {}).get('details', "Agent refused the connection."))
+            self._sock.settimeout(None)
+        except Exception:
+            self._sock.close()
+            raise
+
+        threading.Thread(target=self._reader_loop, name=f"RemixAgentReader-{self.pid}", daemon=True).start()
+        threading.Thread(target=self._sender_loop, name=f"RemixAgentSender-{self.pid}", daemon=True).start()
+
+    # --- Popen-compatible surface ---
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if not self._closed.wait(timeout):
+            raise subprocess.TimeoutExpired(f"bake agent {self.pid}", timeout)
+        return self.returncode
+
+    def terminate(self):
+        self._close(0)
+
+    kill = terminate
+
+    # --- Transport ---
+
+    def _send(self, message, payload=b""):
+        with self._send_lock:
+            remix_ipc.send_socket_message(self._sock, message, payload)
+
+    def _close(self, returncode):
+        if self._closed.is_set():
+            return
+        self.returncode = returncode
+        self._closed.set()
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        self._outbox.put(None)
+        self.stdout.close()
+        self.stderr.close()
+
+    def _reader_loop(self):
+        try:
+            while True:
+                message, payload = remix_ipc.recv_socket_message(self._sock)
+                if message is None:
+                    break
+                msg_type = message.get('type')
+                if msg_type == remix_ipc.MSG_MISSING:
+                    self._missing_replies.put(message.get('digests', []))
+                elif msg_type == remix_ipc.MSG_OUTPUT:
+                    self._store_output(message, payload)
+                elif msg_type == remix_ipc.MSG_LOG:
+                    self.stderr.put(f"[agent {self.pid}] {message.get('line', '')}")
+                else:
+                    if msg_type == remix_ipc.MSG_RESULT:
+                        self._output_dirs.pop(message.get('task_id'), None)
+                    self.stdout.put(remix_ipc.encode_frame(message))
+        except (OSError, ValueError) as e:
+            if not self._closed.is_set():
+                logging.error(f"Lost connection to bake agent {self.pid}: {e}")
+        self._close(0 if self._quit_sent else 1)
+
+    def _store_output(self, message, payload):
+        output_dir = self._output_dirs.get(message.get('task_id'))
+        name = os.path.basename(message.get('name', ''))
+        if not output_dir or not name:
+            logging.warning(f"Bake agent {self.pid} sent an unexpected output '{name}'. Ignoring.")
+            return
+        final_path = os.path.join(output_dir, name)
+        temp_path = f"{final_path}.part"
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_path, final_path)
+
+    def _sender_loop(self):
+        while True:
+            message = self._outbox.get()
+            if message is None or self._closed.is_set():
+                return
+            try:
+                if message.get('action') == remix_ipc.ACTION_BAKE:
+                    self._send_task(message)
+                elif message.get('action') == remix_ipc.ACTION_SET_TEXTURE_MAP:
+                    # Kept here; each task is sent with just the images it uses.
+                    self._texture_map = message.get('texture_map') or {}
+                else:
+                    self._quit_sent = message.get('action') == remix_ipc.ACTION_QUIT
+                    self._send(message)
+            except Exception as e:
+                logging.error(f"Could not send task to bake agent {self.pid}: {e}")
+                self._close(1)
+                return
+
+    def _send_task(self, task):
+        portable_task, inputs = _make_portable_task(task, self._texture_map)
+        digests = sorted({digest for files in inputs.values() for _, digest, _ in files})
+
+        self._send({'type': remix_ipc.MSG_HAVE, 'digests': digests})
+        missing = set(self._missing_replies.get(timeout=MISSING_REPLY_TIMEOUT_SEC))
+        for files in inputs.values():
+            for _, digest, path in files:
+                if digest in missing:
+                    with open(path, 'rb') as f:
+                        self._send({'type': remix_ipc.MSG_BLOB, 'digest': digest}, f.read())
+                    missing.discard(digest)
+
+        portable_task['inputs'] = {group: [[name, digest] for name, digest, _ in files] for group, files in inputs.items()}
+        self._output_dirs[task.get('task_id')] = os.path.dirname(task['output_path'])
+        self._send(portable_task)
+
+
+def _input_files(path):
+    if UDIM_TOKEN in path:
+        pattern = glob.escape(path).replace(glob.escape(UDIM_TOKEN), "[0-9][0-9][0-9][0-9]")
+        return sorted(glob.glob(pattern))
+    return [path] if os.path.isfile(path) else []
+
+
+def _make_portable_task(task, texture_map=None):
+    """
+    Replaces every local input path in a task with a {'$input': group, 'name': ...}
+    placeholder and returns (portable_task, inputs), where inputs maps each group
+    to its files as (name, digest, local_path). UDIM templates become one group
+    holding every tile. Output paths are reduced to file names. The images the
+    task names are resolved against `texture_map` (the map the addon sent with
+    ACTION_SET_TEXTURE_MAP), so the remote task carries its own small map.
+    """
+    inputs = {}
+    portable = dict(task)
+    texture_map = texture_map or {}
+    task_texture_map = task.get('texture_translation_map')
+    if task_texture_map is None:
+        task_texture_map = {name: texture_map[name] for name in task.get('texture_images', ()) if name in texture_map}
+    portable.pop('texture_images', None)
+    portable.pop('texture_map_version', None)
+
+    def placeholder(group, path):
+        files = _input_files(path)
+        if not files:
+            return path  # Left as-is; the worker reports it like any missing texture.
+        inputs[group] = [(os.path.basename(f), _cached_file_digest(f), f) for f in files]
+        return {'$input': group, 'name': os.path.basename(path)}
+
+    portable['task_blend_file'] = placeholder('blend', task['task_blend_file'])
+    if task.get('original_base_color_path'):
+        portable['original_base_color_path'] = placeholder('base_color', task['original_base_color_path'])
+    portable['texture_translation_map'] = {
+        image_name: placeholder(f"tex{i}", path)
+        for i, (image_name, path) in enumerate(task_texture_map.items())
+    }
+    portable['output_path'] = os.path.basename(task['output_path'])
+    portable.pop('bake_dir', None)
+    return portable, inputs
+
+
+# --- Agent side ---
+
+class BlobStore:
+    """Content-addressed file store: every blob lives at <root>/<digest[:2]>/<digest>."""
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, digest):
+        validate_digest(digest)
+        return os.path.join(self.root, digest[:2], digest)
+
+    def has(self, digest):
+        return os.path.isfile(self.path(digest))
+
+    def put(self, digest, data):
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Blob content does not match digest {digest[:12]}.")
+        final_path = self.path(digest)
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        temp_path = f"{final_path}.{threading.get_ident()}.part"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, final_path)
+
+    def materialize(self, digest, directory, name):
+        """Places a blob as `directory`/`name`, hard-linking where the filesystem allows."""
+        source, destination = self.path(digest), safe_child_path(directory, name)
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copyfile(source, destination)
+        return destination
+
+
+class AgentSession:
+    """One addon connection, served by one local persistent bake worker."""
+
+    def __init__(self, agent, conn, address):
+        self.agent = agent
+        self.conn = conn
+        self.name = f"{address[0]}:{address[1]}"
+        self.worker = None
+        self.session_dir = tempfile.mkdtemp(prefix="remix_agent_session_", dir=agent.work_dir)
+        self._send_lock = threading.Lock()
+        self._task_dirs = {}
+
+    def send(self, message, payload=b""):
+        with self._send_lock:
+            remix_ipc.send_socket_message(self.conn, message, payload)
+
+    def run(self):
+        try:
+            hello, _ = remix_ipc.recv_socket_message(self.conn)
+            if not hello or hello.get('version') != remix_ipc.PROTOCOL_VERSION:
+                self.send({'type': remix_ipc.MSG_ERROR, 'details': f"Agent speaks protocol {remix_ipc.PROTOCOL_VERSION}."})
+                return
+            if not hmac.compare_digest(str(hello.get('token') or "").encode('utf-8'), self.agent.token.encode('utf-8')):
+                logging.warning(f"[{self.name}] Rejected: wrong or missing agent token.")
+                self.send({'type': remix_ipc.MSG_ERROR, 'details': "Invalid bake agent token."})
+                return
+            self.send({'type': remix_ipc.MSG_HELLO, 'version': remix_ipc.PROTOCOL_VERSION, 'agent': socket.gethostname()})
+
+            self.worker = self.agent.launch_worker()
+            threading.Thread(target=self._relay_worker_stdout, daemon=True).start()
+            threading.Thread(target=self._relay_worker_stderr, daemon=True).start()
+            logging.info(f"[{self.name}] Connected. Worker PID {self.worker.pid}.")
+
+            while True:
+                message, payload = remix_ipc.recv_socket_message(self.conn)
+                if message is None:
+                    break
+                if message.get('type') == remix_ipc.MSG_HAVE:
+                    missing = [d for d in message.get('digests', []) if not self.agent.store.has(d)]
+                    self.send({'type': remix_ipc.MSG_MISSING, 'digests': missing})
+                elif message.get('type') == remix_ipc.MSG_BLOB:
+                    self.agent.store.put(message['digest'], payload)
+                elif message.get('action') == remix_ipc.ACTION_BAKE:
+                    self._forward_task(message)
+                elif message.get('action') == remix_ipc.ACTION_QUIT:
+                    self._write_to_worker(message)
+                    break
+        except (OSError, ValueError) as e:
+            logging.warning(f"[{self.name}] Connection error: {e}")
+        finally:
+            self._shutdown()
+
+    def _write_to_worker(self, message):
+        self.worker.stdin.write(remix_ipc.encode_frame(message))
+        self.worker.stdin.flush()
+
+    def _forward_task(self, task):
+        task_id = task.get('task_id') or "task"
+        task_dir = safe_child_path(self.session_dir, task_id)
+        shutil.rmtree(task_dir, ignore_errors=True)
+        output_dir = os.path.join(task_dir, "output")
+        os.makedirs(output_dir)
+
+        input_dirs = {}
+        for index, (group, files) in enumerate(task.pop('inputs', {}).items()):
+            group_dir = os.path.join(task_dir, "input", str(index))
+            os.makedirs(group_dir)
+            for name, digest in files:
+                self.agent.store.materialize(digest, group_dir, name)
+            input_dirs[group] = group_dir
+
+        def localize(value):
+            if isinstance(value, dict) and '$input' in value:
+                return safe_child_path(input_dirs[value['$input']], value['name'])
+            return value
+
+        task['task_blend_file'] = localize(task['task_blend_file'])
+        if 'original_base_color_path' in task:
+            task['original_base_color_path'] = localize(task['original_base_color_path'])
+        task['texture_translation_map'] = {k: localize(v) for k, v in task.get('texture_translation_map', {}).items()}
+        task['output_path'] = safe_child_path(output_dir, task['output_path'])
+        task['bake_dir'] = task_dir
+        self._task_dirs[task_id] = task_dir
+        self._write_to_worker(task)
+
+    def _relay_worker_stdout(self):
+        try:
+            for line in iter(self.worker.stdout.readline, ''):
+                message = remix_ipc.decode_frame(line)
+                if message is None:
+                    continue
+                if message.get('type') == remix_ipc.MSG_RESULT:
+                    self._send_outputs(message.get('task_id'))
+                self.send(message)
+        except OSError:
+            pass
+
+    def _send_outputs(self, task_id):
+        task_dir = self._task_dirs.pop(task_id, None)
+        if not task_dir:
+            return
+        output_dir = os.path.join(task_dir, "output")
+        for name in sorted(os.listdir(output_dir)):
+            with open(os.path.join(output_dir, name), 'rb') as f:
+                self.send({'type': remix_ipc.MSG_OUTPUT, 'task_id': task_id, 'name': name}, f.read())
+        shutil.rmtree(task_dir, ignore_errors=True)
+
+    def _relay_worker_stderr(self):
+        try:
+            for line in iter(self.worker.stderr.readline, ''):
+                if self.agent.forward_logs:
+                    self.send({'type': remix_ipc.MSG_LOG, 'line': line.rstrip()})
+        except OSError:
+            pass
+
+    def _shutdown(self):
+        if self.worker and self.worker.poll() is None:
+            try:
+                self.worker.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.worker.kill()
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        shutil.rmtree(self.session_dir, ignore_errors=True)
+        self.agent.release_slot()
+        logging.info(f"[{self.name}] Disconnected.")
+
+
+class BakeAgent:
+    def __init__(self, blender, worker_script, store_dir, work_dir, max_workers, token, lib_path=None, forward_logs=True):
+        if not token:
+            raise ValueError("A bake agent needs a non-empty token.")
+        self.blender = blender
+        self.token = token
+        self.worker_script = worker_script
+        self.store = BlobStore(store_dir)
+        self.work_dir = work_dir
+        self.lib_path = lib_path
+        self.forward_logs = forward_logs
+        self._slots = threading.BoundedSemaphore(max_workers)
+        os.makedirs(work_dir, exist_ok=True)
+
+    def launch_worker(self):
+        cmd = [self.blender, "--factory-startup", "--background", "--python", self.worker_script, "--", "--persistent"]
+        if self.lib_path:
+            cmd += ["--lib-path", self.lib_path]
+        return subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                text=True, encoding='utf-8', bufsize=1)
+
+    def release_slot(self):
+        self._slots.release()
+
+    @staticmethod
+    def _reject_busy(conn):
+        """Answers a connection's hello with a busy error, giving up on clients that stay silent."""
+        try:
+            conn.settimeout(CONNECT_TIMEOUT_SEC)
+            remix_ipc.recv_socket_message(conn)
+            remix_ipc.send_socket_message(conn, {'type': remix_ipc.MSG_ERROR, 'details': "All worker slots on this agent are busy."})
+        except (OSError, ValueError):
+            pass
+        finally:
+            conn.close()
+
+    def serve(self, host, port):
+        with socket.create_server((host, port)) as server:
+            logging.info(f"Bake agent listening on {host}:{port} (store: {self.store.root}).")
+            while True:
+                conn, address = server.accept()
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if not self._slots.acquire(blocking=False):
+                    # Off the accept loop, so a client that never sends its hello cannot stall the agent.
+                    threading.Thread(target=self._reject_busy, args=(conn,), name="RemixAgentReject", daemon=True).start()
+                    continue
+                session = AgentSession(self, conn, address)
+                threading.Thread(target=session.run, name=f"RemixAgentSession-{session.name}", daemon=True).start()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Remote bake agent for the Remix ingestor addon.")
+    parser.add_argument("--blender", required=True, help="Path to the Blender executable used for bake workers.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Interface to listen on. Use 0.0.0.0 only on a trusted network: the agent runs any .blend it is sent.")
+    parser.add_argument("--port", type=int, default=remix_ipc.AGENT_DEFAULT_PORT)
+    parser.add_argument("--max-workers", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="Maximum concurrent connections (one Blender worker each).")
+    parser.add_argument("--store", default=os.path.join(os.path.expanduser("~"), ".remix_agent_store"),
+                        help="Content-addressed input store, kept between runs.")
+    parser.add_argument("--work-dir", default=os.path.join(tempfile.gettempdir(), "remix_agent_work"))
+    parser.add_argument("--worker-script", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "remix_bake_worker.py"))
+    parser.add_argument("--lib-path", default=None, help="Extra site-packages directory passed to the workers.")
+    parser.add_argument("--token", default=os.environ.get(TOKEN_ENV_VAR, ""),
+                        help=f"Shared secret every addon connection must present (default: ${TOKEN_ENV_VAR}, else a generated one).")
+    parser.add_argument("--no-forward-logs", action="store_true", help="Do not stream worker console output to the addon.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [remix-agent] %(message)s")
+    token = args.token
+    if not token:
+        token = secrets.token_urlsafe(24)
+        logging.info(f"No --token given; generated agent token: {token} (enter it as the addon's Bake Agent Token).")
+    agent = BakeAgent(args.blender, args.worker_script, args.store, args.work_dir, args.max_workers, token,
+                      lib_path=args.lib_path, forward_logs=not args.no_forward_logs)
+    try:
+        agent.serve(args.host, args.port)
+    except KeyboardInterrupt:
+        logging.info("Bake agent stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
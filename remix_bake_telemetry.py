@@ -0,0 +1,114 @@
+"""
+Aggregates the per-phase timings that bake workers attach to each task result.
+
+A worker reports, with every result, how many seconds the task spent in each
+phase (file load, render engine setup, texture repath, material copy, each
+Cycles bake pass, compositing, PNG save) and the worker's peak resident
+memory. BakeTelemetry collects those records over one export and writes a
+JSON report with per-task rows and per-phase totals. This module must stay
+free of bpy.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+REPORT_VERSION = 1
+
+# Phases in the order a task goes through them; unknown phases sort after these.
+PHASE_ORDER = (
+    'load_file', 'setup_render_engine', 'repath_textures', 'prepare_bake', 'copy_material',
+    'bake', 'bake_base_albedo', 'bake_decal_albedo', 'bake_decal_alpha',
+    'composite_decal', 'save_png',
+)
+
+
+def _phase_sort_key(phase):
+    return (PHASE_ORDER.index(phase), phase) if phase in PHASE_ORDER else (len(PHASE_ORDER), phase)
+
+
+class BakeTelemetry:
+    def __init__(self, blend_file=""):
+        self.blend_file = blend_file
+        self.started = datetime.now().isoformat(timespec='seconds')
+        self._tasks = []
+        self._lock = threading.Lock()
+
+    def record(self, task, status, timings, peak_rss=None, worker_pid=None, remote=False):
+        """Adds one task result. `timings` maps phase name to seconds."""
+        row = {
+            'task_id': task.get('task_id'),
+            'material_name': task.get('material_name'),
+            'object_name': task.get('object_name'),
+            'channel': task.get('target_socket_name'),
+            'resolution': [task.get('resolution_x'), task.get('resolution_y')],
+            'status': status,
+            'worker_pid': worker_pid,
+            'remote': remote,
+            'timings': {phase: float(sec) for phase, sec in (timings or {}).items()},
+            'peak_rss': peak_rss,
+        }
+        row['total_sec'] = sum(row['timings'].values())
+        with self._lock:
+            self._tasks.append(row)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._tasks)
+
+    def phase_totals(self):
+        """Returns {phase: {'total_sec', 'mean_sec', 'max_sec', 'count', 'share'}} ordered by pipeline position."""
+        with self._lock:
+            rows = list(self._tasks)
+        totals = {}
+        for row in rows:
+            for phase, sec in row['timings'].items():
+                entry = totals.setdefault(phase, {'total_sec': 0.0, 'max_sec': 0.0, 'count': 0})
+                entry['total_sec'] += sec
+                entry['max_sec'] = max(entry['max_sec'], sec)
+                entry['count'] += 1
+        grand_total = sum(e['total_sec'] for e in totals.values())
+        ordered = {}
+        for phase in sorted(totals, key=_phase_sort_key):
+            entry = totals[phase]
+            entry['mean_sec'] = entry['total_sec'] / entry['count']
+            entry['share'] = entry['total_sec'] / grand_total if grand_total > 0 else 0.0
+            ordered[phase] = entry
+        return ordered
+
+    def summary_lines(self):
+        """Short human-readable breakdown for the log."""
+        lines = []
+        for phase, entry in self.phase_totals().items():
+            lines.append(f"{phase:<20} {entry['total_sec']:9.1f}s total  {entry['mean_sec']:7.2f}s mean  "
+                         f"{entry['max_sec']:7.2f}s max  {entry['share'] * 100:5.1f}%")
+        return lines
+
+    def write(self, path, **extra):
+        """Writes the report as JSON. Returns True on success."""
+        with self._lock:
+            rows = list(self._tasks)
+        peak_values = [r['peak_rss'] for r in rows if r.get('peak_rss')]
+        report = {
+            'version': REPORT_VERSION,
+            'blend_file': self.blend_file,
+            'started': self.started,
+            'finished': datetime.now().isoformat(timespec='seconds'),
+            'task_count': len(rows),
+            'failed_count': sum(1 for r in rows if r['status'] != 'success'),
+            'bake_time_sec': sum(r['total_sec'] for r in rows),
+            'max_worker_peak_rss': max(peak_values) if peak_values else None,
+            'phases': self.phase_totals(),
+            'tasks': rows,
+        }
+        report.update(extra)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=1)
+            return True
+        except OSError as e:
+            logging.error(f"Could not write bake timing report '{path}': {e}")
+            return False
@@ -1,7 +1,6 @@
 import bpy
 import os
 import sys
-import json
 import argparse
 import traceback
 from datetime import datetime
@@ -11,10 +10,21 @@ import re
 import tempfile # <-- ADD THIS LINE
 import uuid     # <-- ADD THIS LINE
 import collections
+import threading
 from threading import Lock, RLock
 from collections import defaultdict
 from collections import deque
 
+# The worker is launched as a standalone script, so make its own directory
+# importable to reach the bpy-free helpers shipped next to it.
+_WORKER_DIR = os.path.dirname(os.path.abspath(__file__))
+if _WORKER_DIR not in sys.path:
+    sys.path.insert(0, _WORKER_DIR)
+
+import numpy as np
+import remix_ipc
+from remix_array_ops import mirror_rgba_horizontally, blend_decal_over_base, flip_uvs_horizontally
+
 # --- Worker-Specific Globals & Functions ---
 
 class Counter:
@@ -46,6 +56,88 @@ def log(msg, *a):
     progress_str = task_counter.get_progress_str()
     print(f"[BakeWorker-{worker_pid}] {t} | {progress_str} | {msg % a if a else msg}", file=sys.stderr, flush=True)
 
+# --- IPC: framed messages, task phases and heartbeats ---
+# stdout is written from both the main loop and the heartbeat thread.
+_send_lock = Lock()
+_task_state_lock = Lock()
+_current_task_state = {'task_id': None, 'phase': 'idle', 'phase_start': time.monotonic(), 'timings': {}}
+# Bookkeeping states that are not part of a task's timing breakdown.
+_UNTIMED_PHASES = ('idle', 'received', 'cleanup')
+
+def send_message(msg_type, **fields):
+    payload = {'type': msg_type, 'pid': worker_pid}
+    payload.update(fields)
+    frame = remix_ipc.encode_frame(payload)
+    with _send_lock:
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+
+def report_phase(phase):
+    """Marks the start of a new phase of the current task and tells the addon about it."""
+    with _task_state_lock:
+        _close_current_phase()
+        _current_task_state['phase'] = phase
+        _current_task_state['phase_start'] = time.monotonic()
+        task_id = _current_task_state['task_id']
+    if task_id is not None:
+        send_message(remix_ipc.MSG_PROGRESS, task_id=task_id, phase=phase)
+
+def _close_current_phase():
+    """Adds the running phase's elapsed time to the task timings. Caller holds _task_state_lock."""
+    phase = _current_task_state['phase']
+    if phase not in _UNTIMED_PHASES:
+        timings = _current_task_state['timings']
+        timings[phase] = timings.get(phase, 0.0) + time.monotonic() - _current_task_state['phase_start']
+
+def _set_current_task(task_id):
+    with _task_state_lock:
+        _current_task_state['task_id'] = task_id
+        _current_task_state['phase'] = 'idle' if task_id is None else 'received'
+        _current_task_state['phase_start'] = time.monotonic()
+        _current_task_state['timings'] = {}
+
+def _collect_task_timings():
+    """Closes the running phase and returns {phase: seconds} for the current task."""
+    with _task_state_lock:
+        _close_current_phase()
+        _current_task_state['phase'] = 'received'
+        _current_task_state['phase_start'] = time.monotonic()
+        return {phase: round(sec, 4) for phase, sec in _current_task_state['timings'].items()}
+
+def _peak_rss_bytes():
+    """Peak resident memory of this worker process so far, in bytes, or None if unavailable."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes.
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        memory_info = psutil.Process(worker_pid).memory_info()
+        return getattr(memory_info, 'peak_wset', memory_info.rss)
+    except Exception:
+        return None
+
+def _heartbeat_loop(stop_event):
+    """
+    Sends a heartbeat every HEARTBEAT_INTERVAL_SEC, including the current phase and
+    how long it has been running. Blender releases the GIL while an operator runs,
+    so heartbeats keep flowing during long bakes and only stop when the process
+    is truly stuck.
+    """
+    while not stop_event.wait(remix_ipc.HEARTBEAT_INTERVAL_SEC):
+        with _task_state_lock:
+            task_id = _current_task_state['task_id']
+            phase = _current_task_state['phase']
+            phase_elapsed = time.monotonic() - _current_task_state['phase_start']
+        try:
+            send_message(remix_ipc.MSG_HEARTBEAT, task_id=task_id, phase=phase, phase_elapsed=round(phase_elapsed, 2))
+        except (OSError, ValueError):
+            # The pipe is gone; the main loop will notice and exit.
+            return
+
 def setup_render_engine():
     log("Setting up render engine...")
     try:
@@ -68,17 +160,39 @@ def setup_render_engine():
         log(f" > ERROR setting up render engine: {e}. Defaulting to CPU.")
         bpy.context.scene.cycles.device = 'CPU'
          
+# The export's texture translation map, received once via ACTION_SET_TEXTURE_MAP.
+_texture_map_state = {'version': None, 'map': {}}
+
+def _set_texture_map(message):
+    _texture_map_state['version'] = message.get('version')
+    _texture_map_state['map'] = message.get('texture_map') or {}
+    log(f"Received texture translation map v{_texture_map_state['version']} ({len(_texture_map_state['map'])} image(s)).")
+
+def _texture_map_for_task(task):
+    """
+    The part of the texture translation map this task needs. Tasks relayed by a
+    remote bake agent still carry their own map; local tasks name the images
+    their material uses and the map version they were built against.
+    """
+    if 'texture_translation_map' in task:
+        return task['texture_translation_map'] or {}
+    if task.get('texture_map_version') != _texture_map_state['version']:
+        log(f" > WARNING: Task expects texture map v{task.get('texture_map_version')}, "
+            f"worker holds v{_texture_map_state['version']}. Repathing with what is available.")
+    texture_map = _texture_map_state['map']
+    return {name: texture_map[name] for name in task.get('texture_images', ()) if name in texture_map}
+
 def _apply_texture_translation_map(task):
     """
-    [DEFINITIVE V3 - Corrected for Worker Script]
-    Reads the texture translation map from a task and forces the repathing
-    of any corresponding image datablocks in the worker's current context.
+    [DEFINITIVE V4 - Per-task image list]
+    Forces the repathing of the image datablocks this task's material uses,
+    as listed in the task and resolved against the worker's texture map.
     It correctly handles paths containing the <UDIM> token and gets the base
     bake directory directly from the task data.
     """
     from bpy.path import abspath
 
-    texture_map = task.get('texture_translation_map', {})
+    texture_map = _texture_map_for_task(task)
     bake_dir = task.get('bake_dir') # Get bake_dir from the task data
     if not texture_map or not bake_dir:
         log(" > No texture translation map found in task, skipping repath.")
@@ -291,8 +405,10 @@ def _setup_bake_environment(task, obj, original_mat):
         'original_mat_slot_index': -1,
     }
 
+    report_phase("copy_material")
     with COPY_BAKE_GLOBAL_LOCK:
         mat_for_bake = original_mat.copy()
+    report_phase("prepare_bake")
 
     nt = mat_for_bake.node_tree
     if not nt:
@@ -322,7 +438,8 @@ def _setup_bake_environment(task, obj, original_mat):
     image_settings.file_format = 'PNG'
     is_high_precision = task['bake_type'] == 'NORMAL' or task['target_socket_name'] == 'Displacement'
     image_settings.color_depth = '16' if is_high_precision else '8'
-    image_settings.compression = 0 if is_high_precision else 15
+    # Written uncompressed: the addon composites these and compresses the final textures once.
+    image_settings.compression = 0
 
     if not task.get('is_color_data', False):
         img.colorspace_settings.name = 'Non-Color'
@@ -455,9 +572,10 @@ def _flip_uvs_horizontally(obj):
         return
 
     log("   - Flipping UVs horizontally via direct data access...")
-    for uv_data in uv_layer.data:
-        # Flip the U coordinate (the first component of the uv vector)
-        uv_data.uv[0] = 1.0 - uv_data.uv[0]
+    uvs = np.empty(len(uv_layer.data) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    # Flip the U coordinate (the first component of every uv vector)
+    uv_layer.data.foreach_set("uv", flip_uvs_horizontally(uvs))
     log("   - UV flip complete.")
 
 
@@ -579,58 +697,39 @@ def _bake_decal_alpha_mask_pass(setup_data, task, decal_alpha_mask_path, final_m
     return decal_alpha_img
 
 def _composite_decal_bakes(img, decal_albedo_img, decal_alpha_img):
-    """Composites the baked decal layers into the final albedo."""
+    """
+    Composites the baked decal layers into the final albedo. Pixels are moved in
+    bulk with foreach_get/foreach_set and processed by the NumPy kernels in
+    remix_array_ops; the result is identical to the former per-pixel loops.
+    """
     try:
         log("   - Compositing decal over base albedo with corrected alpha...")
 
-        # Manually flip the decal albedo image horizontally.
-        log("     - Flipping decal albedo bake horizontally...")
         width, height = decal_albedo_img.size
-        pixels = list(decal_albedo_img.pixels)
-        flipped_pixels = [0.0] * len(pixels)
-        components = 4 # RGBA
+        buffer_len = width * height * 4 # RGBA
 
-        for y in range(height):
-            for x in range(width):
-                source_idx = (y * width + x) * components
-                dest_idx = (y * width + (width - 1 - x)) * components
-                flipped_pixels[dest_idx:dest_idx + components] = pixels[source_idx:source_idx + components]
-
-        decal_albedo_img.pixels[:] = flipped_pixels
+        # Manually flip the decal albedo image horizontally.
+        log("     - Flipping decal albedo bake horizontally...")
+        decal_pixels = np.empty(buffer_len, dtype=np.float32)
+        decal_albedo_img.pixels.foreach_get(decal_pixels)
+        decal_pixels = mirror_rgba_horizontally(decal_pixels, width, height)
+        decal_albedo_img.pixels.foreach_set(decal_pixels)
         log("     - Flip complete.")
 
-        # Ensure pixel caches are up-to-date before proceeding
-        img.pixels[0]
-        decal_albedo_img.pixels[0]
-        decal_alpha_img.pixels[0]
+        base_pixels = np.empty(buffer_len, dtype=np.float32)
+        alpha_mask_pixels = np.empty(buffer_len, dtype=np.float32)
+        img.pixels.foreach_get(base_pixels)
+        decal_alpha_img.pixels.foreach_get(alpha_mask_pixels)
 
-        total_pixels = width * height
-        
-        base_pixels = list(img.pixels)
-        decal_pixels = list(decal_albedo_img.pixels)
-        alpha_mask_pixels = list(decal_alpha_img.pixels) 
-        
-        final_decal_pixels = list(decal_pixels)
-
-        for i in range(total_pixels):
-            rgba_idx = i * 4
-            mask_idx = i * 4 
-            final_alpha = alpha_mask_pixels[mask_idx]
-
-            for c in range(3):
-                base_val = base_pixels[rgba_idx + c]
-                decal_val = decal_pixels[rgba_idx + c]
-                base_pixels[rgba_idx + c] = base_val * (1.0 - final_alpha) + decal_val * final_alpha
-            
-            base_pixels[rgba_idx + 3] = 1.0
-            final_decal_pixels[rgba_idx + 3] = final_alpha
+        blend_decal_over_base(base_pixels, decal_pixels, alpha_mask_pixels)
 
+        report_phase("save_png")
         log("     - Saving final composite albedo: %s", os.path.basename(img.filepath_raw))
-        img.pixels[:] = base_pixels
+        img.pixels.foreach_set(base_pixels)
         img.save()
         
         log("     - Saving decal albedo with correct alpha: %s", os.path.basename(decal_albedo_img.filepath_raw))
-        decal_albedo_img.pixels[:] = final_decal_pixels
+        decal_albedo_img.pixels.foreach_set(decal_pixels)
         decal_albedo_img.save()
         
         log("     - Saving decal alpha mask: %s", os.path.basename(decal_alpha_img.filepath_raw))
@@ -640,6 +739,7 @@ def _composite_decal_bakes(img, decal_albedo_img, decal_alpha_img):
     except Exception as e:
         log(f"!!! ERROR during corrected compositing: {e}")
         log(traceback.format_exc())
+        report_phase("save_png")
         img.save()
         decal_albedo_img.save()
         decal_alpha_img.save()
@@ -704,6 +804,7 @@ def _perform_simple_bake(setup_data, task, active_output_node):
             bpy.context.view_layer.objects.active = obj
             
             bpy.ops.object.bake(type='EMIT', use_clear=True, margin=16)
+            report_phase("save_png")
             img.save()
 
         finally:
@@ -719,6 +820,7 @@ def _perform_simple_bake(setup_data, task, active_output_node):
         obj.select_set(True)
         bpy.context.view_layer.objects.active = obj
         bpy.ops.object.bake(type=bake_type, use_clear=True, margin=16)
+        report_phase("save_png")
         img.save()
         
 def perform_single_bake_operation(obj, original_mat, task):
@@ -731,6 +833,7 @@ def perform_single_bake_operation(obj, original_mat, task):
     decal_alpha_img = None
 
     try:
+        report_phase("prepare_bake")
         setup_data = _setup_bake_environment(task, obj, original_mat)
         nt = setup_data['nt']
 
@@ -760,8 +863,11 @@ def perform_single_bake_operation(obj, original_mat, task):
                 raise RuntimeError("Material Output has no input link for bake.")
 
             # --- Execute 3-Pass Bake ---
+            report_phase("bake_base_albedo")
             _bake_base_albedo_pass(setup_data, task, final_mix_shader_original, active_output_node, main_shader_link_from, group_node_instance)
+            report_phase("bake_decal_albedo")
             decal_albedo_img = _bake_decal_albedo_pass(setup_data, task, decal_albedo_path, final_mix_shader_original, active_output_node, main_shader_link_from, group_node_instance)
+            report_phase("bake_decal_alpha")
             decal_alpha_img = _bake_decal_alpha_mask_pass(setup_data, task, decal_alpha_mask_path, final_mix_shader_original, active_output_node, main_shader_link_from, group_node_instance)
 
             # --- Restore original main shader link ---
@@ -771,9 +877,11 @@ def perform_single_bake_operation(obj, original_mat, task):
                     nt.links.remove(active_output_node.inputs['Surface'].links[0])
                 nt.links.new(main_shader_link_from, main_shader_link_to)
             
+            report_phase("composite_decal")
             _composite_decal_bakes(setup_data['img'], decal_albedo_img, decal_alpha_img)
 
         else:
+            report_phase("bake")
             _perform_simple_bake(setup_data, task, active_output_node)
 
         log(" > Bake successful.")
@@ -820,20 +928,21 @@ def persistent_worker_loop():
     [CORRECTED TASK COUNTING & ROBUST MATERIAL LOOKUP V2] Main loop for the worker.
     It now finds the material to bake by checking the object's actual material slots
     against the UUID/name from the task, ensuring the correct datablock is used.
+    Communication uses remix_ipc frames: every task result echoes the task id, phases
+    are reported as they start, and a heartbeat thread proves the worker is alive.
     """
-    
-    def send_json_message(payload):
-        payload['pid'] = worker_pid
-        print(json.dumps(payload), flush=True)
+    heartbeat_stop = threading.Event()
 
     try:
         log("Persistent worker started. Initializing...")
-        send_json_message({"status": "ready"})
+        threading.Thread(target=_heartbeat_loop, args=(heartbeat_stop,), name="RemixHeartbeat", daemon=True).start()
+        send_message(remix_ipc.MSG_READY, protocol=remix_ipc.PROTOCOL_VERSION)
         log("Worker is READY. Awaiting bake tasks...")
 
     except Exception as e:
         log(f"!!! FATAL: Could not initialize worker environment: {e}")
-        send_json_message({"status": "error", "details": f"Initialization failed: {e}"})
+        send_message(remix_ipc.MSG_ERROR, details=f"Initialization failed: {e}")
+        heartbeat_stop.set()
         return
 
     # --- Main task processing loop ---
@@ -842,23 +951,33 @@ def persistent_worker_loop():
         if not line:
             log("Input stream closed. Exiting.")
             break
-            
-        result_payload = {}
+
+        task = remix_ipc.decode_frame(line)
+        if task is None:
+            log(f"Ignoring unframed input line: {line.strip()[:200]}")
+            continue
+        if task.get("action") == remix_ipc.ACTION_QUIT:
+            log("Quit command received. Shutting down gracefully.")
+            break
+        if task.get("action") == remix_ipc.ACTION_SET_TEXTURE_MAP:
+            _set_texture_map(task)
+            continue
+
+        result_fields = {}
         success = False
-        task = {}
+        task_id = task.get('task_id')
+        _set_current_task(task_id)
         try:
-            task = json.loads(line)
-            if task.get("action") == "quit":
-                log("Quit command received. Shutting down gracefully.")
-                break 
-
             task_counter.set_current(task.get('global_task_number', 0))
             task_counter.set_total(task.get('total_tasks', 0))
             
+            report_phase("load_file")
             bpy.ops.wm.open_mainfile(filepath=task['task_blend_file'], load_ui=False)
             log("Loaded task-specific file: %s", os.path.basename(task.get('task_blend_file', '')))
             
+            report_phase("setup_render_engine")
             setup_render_engine()
+            report_phase("repath_textures")
             _apply_texture_translation_map(task)
 
             obj = bpy.data.objects.get(task['object_name'])
@@ -890,22 +1009,25 @@ def persistent_worker_loop():
                     task['object_name'], task['material_name'], task.get('material_uuid'))
                 success = False
 
-            result_payload = {
+            result_fields = {
                 "status": "success" if success else "failure",
                 "details": f"Task for material {task.get('material_name')} on {task.get('object_name')}"
             }
-        except json.JSONDecodeError:
-            result_payload = {"status": "error", "details": f"invalid_json: {line}"}
         except Exception as e:
             log(f"!!! UNHANDLED WORKER ERROR during task loop: {e}")
             log(traceback.format_exc())
-            result_payload = {"status": "error", "details": str(e)}
+            result_fields = {"status": "error", "details": str(e)}
 
-        send_json_message(result_payload)
+        result_fields['timings'] = _collect_task_timings()
+        result_fields['peak_rss'] = _peak_rss_bytes()
+        send_message(remix_ipc.MSG_RESULT, task_id=task_id, **result_fields)
         
         log("  > Cleaning up worker scene after task...")
+        report_phase("cleanup")
         bpy.ops.wm.read_factory_settings(use_empty=True)
+        _set_current_task(None)
 
+    heartbeat_stop.set()
     log("Worker task processing complete. Exiting.")
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+"""
+Headless batch export: runs the addon's full export pipeline over many .blend files.
+
+    blender --background --python remix_batch_export.py -- --files a.blend b.blend [--report out.json]
+
+Each file goes through the same collection, bake pool, finalize and ingest
+steps as the 'Export and Ingest' button, driven without a window. The addon's
+preferences (server URL, ingest directory, bake settings) come from the user
+preferences, so do not pass --factory-startup. Bake workers are kept alive
+between files and the material bake cache is shared across the whole batch,
+so materials that repeat across files are baked once. A throughput summary is
+printed at the end and optionally written as JSON.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import addon_utils
+import bpy
+
+ADDON_DISPLAY_NAME = "Remix Asset Ingestion"
+
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="remix_batch_export", description="Headless Remix export over many .blend files.")
+    parser.add_argument("--files", nargs="+", required=True, help=".blend files to export, in order.")
+    parser.add_argument("--addon", default=None, help="Addon module name, if it cannot be found by its display name.")
+    parser.add_argument("--report", default=None, help="Write a JSON report with per-file results and throughput.")
+    parser.add_argument("--stop-on-error", action="store_true", help="Stop at the first file that fails.")
+    return parser.parse_args(argv)
+
+
+def _enable_addon(module_name=None):
+    """Enables the addon and returns its module, or None if it is not installed."""
+    if module_name is None:
+        module_name = next((m.__name__ for m in addon_utils.modules()
+                            if getattr(m, 'bl_info', {}).get('name') == ADDON_DISPLAY_NAME), None)
+    if module_name is None:
+        return None
+    addon_utils.enable(module_name, default_set=True)
+    return sys.modules.get(module_name)
+
+
+def _export_file(addon, blend_path):
+    entry = {'file': blend_path, 'result': 'CANCELLED', 'total_tasks': 0, 'failed_tasks': 0}
+    start = time.perf_counter()
+    try:
+        bpy.ops.wm.open_mainfile(filepath=blend_path)
+        addon.LAST_EXPORT_STATS.clear()
+        result = bpy.ops.object.export_and_ingest(headless=True)
+        entry.update(addon.LAST_EXPORT_STATS)
+        entry['result'] = next(iter(result), entry['result'])
+    except Exception as e:
+        entry['error'] = str(e)
+    entry['duration_sec'] = time.perf_counter() - start
+    return entry
+
+
+def main():
+    args = _parse_args()
+    addon = _enable_addon(args.addon)
+    if addon is None:
+        print(f"ERROR: The '{ADDON_DISPLAY_NAME}' addon is not installed (use --addon to name its module).", file=sys.stderr)
+        return 2
+
+    results = []
+    batch_start = time.perf_counter()
+    try:
+        for index, path in enumerate(args.files, 1):
+            blend_path = os.path.abspath(path)
+            print(f"=== [{index}/{len(args.files)}] Exporting {blend_path}")
+            entry = _export_file(addon, blend_path)
+            results.append(entry)
+            print(f"=== [{index}/{len(args.files)}] {entry['result']} in {entry['duration_sec']:.1f}s "
+                  f"({entry['total_tasks']} bake task(s), {entry['failed_tasks']} failed)"
+                  + (f": {entry['error']}" if 'error' in entry else ""))
+            if args.stop_on_error and entry['result'] != 'FINISHED':
+                break
+    finally:
+        addon.shutdown_parked_workers()
+
+    elapsed = time.perf_counter() - batch_start
+    succeeded = sum(1 for r in results if r['result'] == 'FINISHED')
+    total_tasks = sum(r['total_tasks'] for r in results)
+    summary = {
+        'files': len(results),
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'bake_tasks': total_tasks,
+        'elapsed_sec': elapsed,
+        'files_per_hour': len(results) / elapsed * 3600.0 if elapsed > 0 else 0.0,
+        'bake_tasks_per_minute': total_tasks / elapsed * 60.0 if elapsed > 0 else 0.0,
+    }
+
+    print("=== Batch export summary")
+    print(f"    Files      : {summary['succeeded']}/{summary['files']} succeeded")
+    print(f"    Bake tasks : {summary['bake_tasks']}")
+    print(f"    Elapsed    : {summary['elapsed_sec']:.1f}s")
+    print(f"    Throughput : {summary['files_per_hour']:.1f} files/hour, {summary['bake_tasks_per_minute']:.1f} bakes/minute")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'files': results}, f, indent=2)
+        print(f"    Report     : {args.report}")
+
+    return 0 if succeeded == len(args.files) else 1
+
+
+if __name__ == "__main__":
+    # Blender quits with this status instead of idling after the script.
+    sys.exit(main())
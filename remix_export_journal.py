@@ -0,0 +1,269 @@
+"""
+Durable, per-.blend journal of a bake export.
+
+The journal records every bake task of an export together with a fingerprint
+of its inputs, and, once a worker reports success, the output file's size and
+MD5 checksum. It is rewritten atomically (temp file + fsync + os.replace)
+after every change, so a crash or a cancel leaves a consistent record on disk.
+Task results are recorded on the journal's own writer thread (record_done /
+record_failed), so the checksum and the rewrite never hold up the caller.
+A resumed export recomputes its tasks and skips those whose fingerprint and
+output checksum still match. This module must stay free of bpy.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+JOURNAL_VERSION = 1
+
+STATE_RUNNING = "running"
+STATE_INTERRUPTED = "interrupted"
+
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# Task fields that determine what a bake produces. Everything else in a task
+# dict is per-run plumbing (task ids, attempt counters, temp .blend paths).
+FINGERPRINT_KEYS = (
+    'material_hash', 'material_name', 'object_name', 'target_socket_name',
+    'bake_type', 'is_value_bake', 'is_color_data', 'resolution_x', 'resolution_y',
+    'uv_layer', 'bake_method', 'is_decal_composite',
+)
+
+
+def task_inputs(task):
+    return {key: task.get(key) for key in FINGERPRINT_KEYS}
+
+
+def task_fingerprint(task):
+    payload = json.dumps(task_inputs(task), sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def file_checksum(path, chunk_size=1 << 20):
+    md5 = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def journal_path_for(journal_dir, blend_filepath):
+    """One journal per .blend file, named after a hash of its absolute path."""
+    key = os.path.normcase(os.path.abspath(blend_filepath))
+    return os.path.join(journal_dir, f"export_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.json")
+
+
+def _task_key(task):
+    # Output paths are derived from the material hash and channel, so they are
+    # stable across sessions and unique per task.
+    return os.path.basename(task['output_path'])
+
+
+class ExportJournal:
+    def __init__(self, path, data):
+        self.path = path
+        self._data = data
+        self._lock = threading.Lock()
+        # Serializes snapshot + write so an older snapshot never replaces a newer one.
+        self._write_lock = threading.Lock()
+        # One thread, so queued results are checksummed and saved in submission order.
+        self._writer = None
+
+    @classmethod
+    def create(cls, path, blend_filepath):
+        now = datetime.now().isoformat(timespec='seconds')
+        return cls(path, {
+            'version': JOURNAL_VERSION,
+            'blend_file': blend_filepath,
+            'created': now,
+            'updated': now,
+            'state': STATE_RUNNING,
+            'tasks': {},
+        })
+
+    @classmethod
+    def load(cls, path):
+        """Returns the journal at `path`, or None if it is missing or unreadable."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable export journal '{path}': {e}")
+            return None
+        if not isinstance(data, dict) or data.get('version') != JOURNAL_VERSION:
+            logging.warning(f"Ignoring export journal '{path}' with unsupported version.")
+            return None
+        return cls(path, data)
+
+    def is_completed(self, task):
+        """True if the task finished in an earlier run and its output is intact."""
+        with self._lock:
+            entry = self._data['tasks'].get(_task_key(task))
+        if not entry or entry.get('status') != STATUS_DONE or entry.get('fingerprint') != task_fingerprint(task):
+            return False
+        output_path = entry.get('output_path')
+        try:
+            if os.path.getsize(output_path) != entry.get('size'):
+                return False
+            return file_checksum(output_path) == entry.get('checksum')
+        except OSError:
+            return False
+
+    def register_tasks(self, tasks):
+        """Adds tasks as pending. Entries already done with the same inputs are kept."""
+        with self._lock:
+            for task in tasks:
+                key = _task_key(task)
+                fingerprint = task_fingerprint(task)
+                entry = self._data['tasks'].get(key)
+                if entry and entry.get('status') == STATUS_DONE and entry.get('fingerprint') == fingerprint:
+                    continue
+                self._data['tasks'][key] = {
+                    'status': STATUS_PENDING,
+                    'fingerprint': fingerprint,
+                    'inputs': task_inputs(task),
+                    'output_path': task['output_path'],
+                }
+        self.save()
+
+    def mark_done(self, task):
+        """Records a finished task with its output checksum. Returns False if the output is missing."""
+        output_path = task['output_path']
+        try:
+            size = os.path.getsize(output_path)
+            checksum = file_checksum(output_path)
+        except OSError as e:
+            logging.warning(f"Journal: output of task {task.get('task_id')} is not readable, leaving it pending: {e}")
+            return False
+        self._update_entry(task, status=STATUS_DONE, size=size, checksum=checksum,
+                           completed=datetime.now().isoformat(timespec='seconds'))
+        return True
+
+    def refresh_outputs(self, paths):
+        """
+        Re-records size and checksum of done entries whose output is in `paths`,
+        after the export rewrote them without changing their pixels (final PNG
+        compression). Returns how many entries were refreshed.
+        """
+        wanted = {os.path.normpath(p) for p in paths}
+        with self._lock:
+            entries = [e for e in self._data['tasks'].values()
+                       if e.get('status') == STATUS_DONE and os.path.normpath(e.get('output_path') or '') in wanted]
+        refreshed = 0
+        for entry in entries:
+            try:
+                size, checksum = os.path.getsize(entry['output_path']), file_checksum(entry['output_path'])
+            except OSError as e:
+                logging.warning(f"Journal: could not re-read '{entry['output_path']}', leaving its entry as is: {e}")
+                continue
+            with self._lock:
+                entry.update(size=size, checksum=checksum)
+            refreshed += 1
+        if refreshed:
+            self.save()
+        return refreshed
+
+    def mark_failed(self, task):
+        self._update_entry(task, status=STATUS_FAILED)
+
+    def record_done(self, task):
+        """Queues mark_done on the writer thread. Returns a Future of its result."""
+        return self._submit(self.mark_done, task)
+
+    def record_failed(self, task):
+        """Queues mark_failed on the writer thread. Returns a Future."""
+        return self._submit(self.mark_failed, task)
+
+    def _submit(self, fn, *args):
+        with self._lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RemixJournal")
+            return self._writer.submit(fn, *args)
+
+    def flush(self):
+        """Blocks until every queued result has been written."""
+        with self._lock:
+            writer = self._writer
+        if writer is not None:
+            writer.submit(lambda: None).result()
+
+    def close(self):
+        """Writes out queued results and stops the writer thread."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.shutdown(wait=True)
+
+    def _update_entry(self, task, **fields):
+        with self._lock:
+            entry = self._data['tasks'].setdefault(_task_key(task), {
+                'fingerprint': task_fingerprint(task),
+                'inputs': task_inputs(task),
+                'output_path': task['output_path'],
+            })
+            for stale_key in ('size', 'checksum', 'completed'):
+                entry.pop(stale_key, None)
+            entry.update(fields)
+        self.save()
+
+    def set_state(self, state):
+        with self._lock:
+            self._data['state'] = state
+        self.save()
+
+    def counts(self):
+        """Returns (done, total) task counts."""
+        with self._lock:
+            entries = list(self._data['tasks'].values())
+        return sum(1 for e in entries if e.get('status') == STATUS_DONE), len(entries)
+
+    def referenced_outputs(self):
+        with self._lock:
+            return {os.path.normpath(e['output_path']) for e in self._data['tasks'].values()
+                    if e.get('status') == STATUS_DONE and e.get('output_path')}
+
+    def save(self):
+        with self._write_lock:
+            with self._lock:
+                self._data['updated'] = datetime.now().isoformat(timespec='seconds')
+                payload = json.dumps(self._data, indent=1)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                logging.error(f"Could not write export journal '{self.path}': {e}")
+
+    def discard(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Could not remove export journal '{self.path}': {e}")
+
+
+def referenced_outputs_in(journal_dir):
+    """Normalized paths of every completed output recorded by any journal in `journal_dir`."""
+    referenced = set()
+    if not os.path.isdir(journal_dir):
+        return referenced
+    for name in os.listdir(journal_dir):
+        if name.endswith('.json'):
+            journal = ExportJournal.load(os.path.join(journal_dir, name))
+            if journal is not None:
+                referenced |= journal.referenced_outputs()
+    return referenced
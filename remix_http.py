@@ -0,0 +1,144 @@
+"""
+Shared HTTP layer for talking to the RTX Remix toolkit server.
+
+Every thread gets its own requests.Session (sessions are not thread-safe),
+and each session keeps a keep-alive connection pool per host, so the long
+runs of sequential stagecraft/ingestcraft calls an export or import makes
+reuse one TCP connection instead of opening a new one per request.
+
+request_with_retries() retries transient failures with exponential backoff
+and full jitter, honours Retry-After, and only retries requests that are
+safe to repeat: idempotent methods, or any request whose connection was
+never established. Connect and read timeouts are set per endpoint class.
+This module must stay free of bpy.
+"""
+
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+# Statuses worth retrying: the server is busy or a proxy lost it. Other errors are final.
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+SUCCESS_STATUSES = frozenset({200, 201, 204})
+
+# (connect, read) timeouts in seconds. Ingest calls block while the server
+# converts textures and meshes, so they get a much longer read timeout.
+TIMEOUTS = {
+    'query': (3.05, 30.0),
+    'mutation': (3.05, 60.0),
+    'ingest': (3.05, 600.0),
+}
+
+DEFAULT_BACKOFF_BASE = 0.5
+MAX_BACKOFF = 8.0
+POOL_MAXSIZE = 8
+
+_local = threading.local()
+_sessions = []
+_sessions_lock = threading.Lock()
+
+
+def endpoint_class(method, url):
+    """'ingest' for ingestcraft jobs, 'query' for reads, 'mutation' for everything else."""
+    if '/ingestcraft/' in urlsplit(url).path:
+        return 'ingest'
+    return 'query' if method.upper() in ('GET', 'HEAD', 'OPTIONS') else 'mutation'
+
+
+def get_session():
+    """The calling thread's session, created on first use."""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        # Retries are handled in request_with_retries, not by urllib3.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _local.session = session
+        with _sessions_lock:
+            _sessions.append(session)
+    return session
+
+
+def close_sessions():
+    """Closes every pooled connection (addon unregister). Threads get fresh sessions on their next request."""
+    with _sessions_lock:
+        sessions = list(_sessions)
+        _sessions.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except Exception:
+            pass
+    _local.session = None
+
+
+def backoff_delay(attempt, base=DEFAULT_BACKOFF_BASE, cap=MAX_BACKOFF):
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**(attempt - 1))]."""
+    return random.uniform(0.0, min(cap, base * (2 ** (attempt - 1))))
+
+
+def _retry_after(response):
+    value = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return min(MAX_BACKOFF, max(0.0, float(value))) if value else None
+    except ValueError:
+        return None
+
+
+def _never_sent(exc):
+    """True if the request failed before reaching the server, so repeating it cannot duplicate work."""
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        reason = getattr(exc.args[0], 'reason', None) if exc.args else None
+        return type(reason).__name__ == 'NewConnectionError'
+    return False
+
+
+def request_with_retries(method, url, headers=None, json_payload=None, retries=3, delay=DEFAULT_BACKOFF_BASE,
+                         idempotent=None, timeout=None, **kwargs):
+    """
+    Sends a request on the thread's pooled session. Returns the first successful
+    response, otherwise the last response received (or None if the server never
+    answered). `idempotent` defaults to the method's HTTP semantics; `timeout`
+    defaults to the endpoint class's (connect, read) pair.
+    """
+    method = method.upper()
+    if idempotent is None:
+        idempotent = method in IDEMPOTENT_METHODS
+    if timeout is None:
+        timeout = TIMEOUTS[endpoint_class(method, url)]
+
+    last_response = None
+    for attempt in range(1, retries + 1):
+        wait = None
+        try:
+            logging.debug(f"Attempt {attempt}: {method} {url}")
+            response = get_session().request(method, url, headers=headers, json=json_payload, timeout=timeout, **kwargs)
+            last_response = response
+            logging.debug(f"Response: {response.status_code} - {response.text}")
+            if response.status_code in SUCCESS_STATUSES:
+                return response
+            logging.warning(f"Attempt {attempt} failed with status {response.status_code}")
+            if not (idempotent and response.status_code in RETRYABLE_STATUSES):
+                return response
+            wait = _retry_after(response)
+        except requests.exceptions.RequestException as e:
+            logging.warning(f"Attempt {attempt} encountered exception: {e}")
+            if not (idempotent or _never_sent(e)):
+                break
+        if attempt < retries:
+            time.sleep(wait if wait is not None else backoff_delay(attempt, delay))
+
+    if last_response is not None:
+        logging.error(f"Request failed for {method} {url}. Last status: {last_response.status_code}")
+    else:
+        logging.error(f"Request failed for {method} {url}. No response from server (network error).")
+    return last_response
@@ -0,0 +1,453 @@
+"""
+Image conversion jobs that run outside Blender's main thread.
+
+The export converts EXR textures to PNG for the bake workers. Each conversion
+here reads the EXR and writes the PNG directly with OpenImageIO (bundled with
+recent Blender builds, or installed into the addon's library path), so it can
+run in a multiprocessing pool instead of copying pixels through bpy.
+Results are cached by a fingerprint of the source file (path, size, mtime) and
+the output encoding, so unchanged EXRs are converted once across exports.
+
+The same module encodes pixel buffers recovered from packed or generated
+images: the main thread reads them with foreach_get and hands the NumPy
+buffers to encode_png, which is safe to run from a thread pool (Pillow
+releases the GIL while compressing).
+
+UDIM atlases are stitched here too: tiles are decoded and resized on a thread
+pool one band (row of tiles) at a time, and the atlas PNG is streamed out
+scanline by scanline, so the full atlas is never held in memory. Atlases are
+cached by the fingerprints of their tiles.
+
+Intermediate PNGs (bake outputs, composites, recovered images) are written
+uncompressed so the steps that read them back decode them cheaply. The
+textures an export actually uses get their one real compression pass from
+finalize_pngs, which re-deflates the image data without decoding pixels, so
+16-bit maps come through untouched.
+This module must stay free of bpy.
+"""
+
+import hashlib
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+CACHE_VERSION = 1
+# The cache is pruned back under this size (least recently used first).
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# zlib level for PNGs that are read again within the export, and for the final upload.
+INTERMEDIATE_COMPRESS_LEVEL = 0
+FINAL_COMPRESS_LEVEL = 6
+
+
+def exr_reader_available(lib_path=None):
+    """True if OpenImageIO can be imported (the pool workers need it)."""
+    return _import_oiio(lib_path) is not None
+
+
+def _import_oiio(lib_path=None):
+    if lib_path and os.path.isdir(lib_path) and lib_path not in sys.path:
+        sys.path.insert(0, lib_path)
+    try:
+        import OpenImageIO
+        return OpenImageIO
+    except ImportError:
+        return None
+
+
+def source_fingerprint(exr_path, high_precision):
+    stat = os.stat(exr_path)
+    key = f"{CACHE_VERSION}|{os.path.normcase(os.path.abspath(exr_path))}|{stat.st_size}|{stat.st_mtime_ns}|{int(high_precision)}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def cached_png_path(cache_dir, exr_path, high_precision):
+    """Where the converted PNG of `exr_path` lives in the cache (it may not exist yet)."""
+    stem = os.path.splitext(os.path.basename(exr_path))[0]
+    return os.path.join(cache_dir, f"{stem}_{source_fingerprint(exr_path, high_precision)[:16]}.png")
+
+
+def _linear_to_srgb(pixels):
+    pixels = np.clip(pixels, 0.0, 1.0)
+    return np.where(pixels <= 0.0031308, pixels * 12.92, 1.055 * np.power(pixels, 1.0 / 2.4) - 0.055)
+
+
+def convert_exr_job(job):
+    """
+    Pool entry point. `job` is (exr_path, png_path, high_precision, lib_path).
+    High precision sources are written as 16-bit PNGs with the linear values
+    encoded to sRGB, matching what Blender writes when it saves a float image
+    as PNG; others are written as 8-bit PNGs from the clamped values.
+    Returns (exr_path, png_path, error), with error None on success.
+    """
+    exr_path, png_path, high_precision, lib_path = job
+    oiio = _import_oiio(lib_path)
+    if oiio is None:
+        return exr_path, png_path, "OpenImageIO is not available"
+
+    temp_path = f"{png_path}.{os.getpid()}.tmp.png"
+    try:
+        source = oiio.ImageInput.open(exr_path)
+        if source is None:
+            return exr_path, png_path, f"could not open: {oiio.geterror()}"
+        try:
+            spec = source.spec()
+            pixels = source.read_image(0, 0, 0, spec.nchannels, 'float')
+        finally:
+            source.close()
+        if pixels is None:
+            return exr_path, png_path, f"could not read pixels: {oiio.geterror()}"
+
+        pixels = np.asarray(pixels, dtype=np.float32).reshape(spec.height, spec.width, spec.nchannels)
+        channels = min(spec.nchannels, 4)
+        pixels = pixels[:, :, :channels]
+        if high_precision:
+            color = min(channels, 3)
+            pixels = pixels.copy()
+            if channels == 4:
+                # EXR stores premultiplied colour; PNG wants straight alpha.
+                alpha = pixels[:, :, 3:4]
+                pixels[:, :, :3] = np.where(alpha > 0.0, pixels[:, :, :3] / np.maximum(alpha, 1e-8), 0.0)
+            pixels[:, :, :color] = _linear_to_srgb(pixels[:, :, :color])
+            out_format, scale, dtype = 'uint16', 65535.0, np.uint16
+        else:
+            out_format, scale, dtype = 'uint8', 255.0, np.uint8
+        out_pixels = (np.clip(pixels, 0.0, 1.0) * scale + 0.5).astype(dtype)
+
+        out_spec = oiio.ImageSpec(spec.width, spec.height, channels, out_format)
+        # The values are already straight alpha; stop OpenImageIO from unpremultiplying again.
+        out_spec.attribute("oiio:UnassociatedAlpha", 1)
+        output = oiio.ImageOutput.create(temp_path)
+        if output is None or not output.open(temp_path, out_spec):
+            return exr_path, png_path, f"could not create PNG: {oiio.geterror()}"
+        try:
+            if not output.write_image(out_pixels):
+                return exr_path, png_path, f"could not write PNG: {output.geterror()}"
+        finally:
+            output.close()
+        os.replace(temp_path, png_path)
+        return exr_path, png_path, None
+    except Exception as e:
+        return exr_path, png_path, str(e)
+    finally:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def pixel_fingerprint(pixels):
+    """Fingerprint of a recovered pixel buffer, for images that have no packed file to hash."""
+    return hashlib.sha1(np.ascontiguousarray(pixels).view(np.uint8)).hexdigest()
+
+
+def encode_png(pixels, width, height, png_path):
+    """
+    Writes a Blender pixel buffer (float RGBA, bottom row first) as an 8-bit RGBA
+    PNG, the same bytes Blender stores when those floats are assigned to a byte
+    image and saved. Written to a temp file and renamed, so a cached path is
+    either complete or absent. Returns (png_path, error), with error None on success.
+    """
+    from PIL import Image
+
+    temp_path = f"{png_path}.{os.getpid()}.{id(pixels)}.tmp.png"
+    try:
+        channels = pixels.size // (width * height)
+        rows = np.asarray(pixels, dtype=np.float32).reshape(height, width, channels)[::-1]
+        if channels == 3:
+            rows = np.concatenate([rows, np.ones((height, width, 1), dtype=np.float32)], axis=2)
+        elif channels != 4:
+            return png_path, f"unsupported channel count {channels}"
+        rgba = (np.clip(rows, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+        Image.fromarray(rgba, 'RGBA').save(temp_path, format='PNG', compress_level=INTERMEDIATE_COMPRESS_LEVEL)
+        os.replace(temp_path, png_path)
+        return png_path, None
+    except Exception as e:
+        return png_path, str(e)
+    finally:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def file_fingerprint(path):
+    """Cheap identity of a file on disk: path, size and modification time."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"{path}|missing"
+    return f"{os.path.normcase(os.path.abspath(path))}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+def atlas_fingerprint(bands, tile_size):
+    """Fingerprint of an atlas layout: its tile grid (paths, None for gaps) and tile size."""
+    sha = hashlib.sha1(f"atlas{CACHE_VERSION}|{tile_size[0]}x{tile_size[1]}".encode('utf-8'))
+    for band in bands:
+        sha.update(b"|band")
+        for path in band:
+            sha.update(f"|{file_fingerprint(path) if path else '-'}".encode('utf-8'))
+    return sha.hexdigest()
+
+
+def _write_chunk(f, tag, data):
+    f.write(struct.pack(">I", len(data)))
+    f.write(tag)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(tag)) & 0xFFFFFFFF))
+
+
+class PngStreamWriter:
+    """
+    Writes an 8-bit RGBA PNG one scanline at a time, compressing as it goes.
+    The file is written under a temporary name and renamed by close().
+    """
+
+    def __init__(self, path, width, height, compress_level=1):
+        self.path = path
+        self.width, self.height = width, height
+        self._rows_written = 0
+        self._temp_path = f"{path}.{os.getpid()}.{id(self)}.tmp.png"
+        self._compressor = zlib.compressobj(compress_level)
+        self._file = open(self._temp_path, 'wb')
+        self._file.write(PNG_SIGNATURE)
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+
+    def _chunk(self, tag, data):
+        _write_chunk(self._file, tag, data)
+
+    def write_row(self, row_bytes):
+        """One scanline: width * 4 bytes of RGBA, top row first."""
+        data = self._compressor.compress(b"\x00" + row_bytes)  # Filter type 0 (None).
+        if data:
+            self._chunk(b"IDAT", data)
+        self._rows_written += 1
+
+    def close(self):
+        self._chunk(b"IDAT", self._compressor.flush())
+        self._chunk(b"IEND", b"")
+        self._file.close()
+        if self._rows_written != self.height:
+            self.abort()
+            raise ValueError(f"PNG stream got {self._rows_written} of {self.height} rows.")
+        os.replace(self._temp_path, self.path)
+
+    def abort(self):
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+
+def load_tile(path, tile_size):
+    """Decodes one UDIM tile as a (height, width, 4) uint8 array, resized to tile_size if needed."""
+    from PIL import Image
+
+    with Image.open(path) as tile:
+        tile = tile.convert('RGBA')
+        if tile.size != tuple(tile_size):
+            tile = tile.resize(tuple(tile_size), Image.Resampling.LANCZOS)
+        return np.asarray(tile, dtype=np.uint8)
+
+
+def stitch_atlas(bands, tile_size, output_path, max_workers=4):
+    """
+    Stitches a grid of tiles into one PNG. `bands` lists the atlas's rows of
+    tiles from the top, each a list of tile paths (None leaves a transparent
+    gap). Each band's tiles are decoded in parallel, then its scanlines are
+    streamed to the file; only one band of tiles is held at a time.
+    Returns (output_path, error), with error None on success.
+    """
+    tile_width, tile_height = tile_size
+    columns = max(len(band) for band in bands)
+    writer = None
+    try:
+        writer = PngStreamWriter(output_path, tile_width * columns, tile_height * len(bands))
+        blank = np.zeros((tile_height, tile_width, 4), dtype=np.uint8)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="RemixUdimTile") as pool:
+            for band in bands:
+                futures = [pool.submit(load_tile, path, tile_size) if path and os.path.exists(path) else None for path in band]
+                tiles = []
+                for path, future in zip(band, futures):
+                    if future is None:
+                        tiles.append(blank)
+                        continue
+                    try:
+                        tiles.append(future.result())
+                    except Exception as e:
+                        return output_path, f"could not read tile '{path}': {e}"
+                tiles.extend([blank] * (columns - len(tiles)))
+                for y in range(tile_height):
+                    writer.write_row(b"".join(tile[y].tobytes() for tile in tiles))
+                del tiles, futures
+        writer.close()
+        writer = None
+        return output_path, None
+    except Exception as e:
+        return output_path, str(e)
+    finally:
+        if writer is not None:
+            writer.abort()
+
+
+def png_needs_final_encode(path):
+    """
+    True if the PNG's image data was deflated at zlib's fastest levels (0 or 1,
+    which includes Blender's default 15%), i.e. it is still an intermediate.
+    Only reads up to the first IDAT chunk header.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read(8) != PNG_SIGNATURE:
+                return False
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return False
+                length, tag = struct.unpack(">I4s", header)
+                if tag == b"IDAT":
+                    zlib_header = f.read(2)
+                    # FLEVEL, the top two bits of the second zlib header byte, is 0 for levels 0-1.
+                    return len(zlib_header) == 2 and (zlib_header[1] >> 6) == 0
+                f.seek(length + 4, os.SEEK_CUR)
+    except OSError:
+        return False
+
+
+def recompress_png(path, compress_level=FINAL_COMPRESS_LEVEL):
+    """
+    Re-deflates a PNG's image data in place at `compress_level`. Pixels, row
+    filters and every other chunk are copied as they are, so this is lossless
+    for any bit depth. Returns (path, error), with error None on success.
+    """
+    temp_path = f"{path}.{os.getpid()}.{id(path)}.tmp.png"
+    try:
+        with open(path, 'rb') as src, open(temp_path, 'wb') as dst:
+            if src.read(8) != PNG_SIGNATURE:
+                return path, "not a PNG file"
+            dst.write(PNG_SIGNATURE)
+            inflater, deflater = zlib.decompressobj(), zlib.compressobj(compress_level)
+            in_image_data = False
+            while True:
+                header = src.read(8)
+                if len(header) < 8:
+                    return path, "truncated PNG file"
+                length, tag = struct.unpack(">I4s", header)
+                data = src.read(length)
+                src.read(4)  # CRC; rewritten by _write_chunk.
+                if tag == b"IDAT":
+                    in_image_data = True
+                    out = deflater.compress(inflater.decompress(data))
+                    if out:
+                        _write_chunk(dst, b"IDAT", out)
+                    continue
+                if in_image_data:
+                    _write_chunk(dst, b"IDAT", deflater.compress(inflater.flush()) + deflater.flush())
+                    in_image_data = False
+                _write_chunk(dst, tag, data)
+                if tag == b"IEND":
+                    break
+        os.replace(temp_path, path)
+        return path, None
+    except (OSError, zlib.error, struct.error) as e:
+        return path, str(e)
+    finally:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def finalize_pngs(paths, max_workers=4):
+    """
+    Gives every still-intermediate PNG in `paths` its final compression, in
+    parallel (zlib releases the GIL). PNGs that were already compressed are
+    skipped, so repeated exports of cached textures cost one header read each.
+    Returns (encoded_count, [(path, error), ...]).
+    """
+    pending = [path for path in paths if png_needs_final_encode(path)]
+    if not pending:
+        return 0, []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending))), thread_name_prefix="RemixPngEncode") as pool:
+        results = list(pool.map(recompress_png, pending))
+    errors = [(path, error) for path, error in results if error]
+    return len(pending) - len(errors), errors
+
+
+def udim_tile_index_path(template):
+    """Index file listing the tiles written for a cached UDIM set ('<name>.<UDIM>.png' template)."""
+    return os.path.splitext(template.replace('.<UDIM>', ''))[0] + '.tiles'
+
+
+def cached_udim_tiles(template):
+    """
+    Paths of a cached UDIM set (its tile PNGs, then its index), or None unless
+    the index exists and every tile it lists is still there. Tiles without
+    pixel data are never written, so the index, not image.tiles, says which
+    PNGs make up the set.
+    """
+    index_path = udim_tile_index_path(template)
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            numbers = [int(n) for n in f.read().split()]
+    except (OSError, ValueError):
+        return None
+    tile_paths = [template.replace('<UDIM>', str(n)) for n in numbers]
+    if not tile_paths or not all(os.path.exists(path) for path in tile_paths):
+        return None
+    return tile_paths + [index_path]
+
+
+def record_udim_tiles(template, tile_numbers):
+    """Writes the index of a UDIM set whose tiles were written; returns its paths like cached_udim_tiles."""
+    index_path = udim_tile_index_path(template)
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(" ".join(str(n) for n in sorted(tile_numbers)))
+    os.replace(temp_path, index_path)
+    return [template.replace('<UDIM>', str(n)) for n in sorted(tile_numbers)] + [index_path]
+
+
+def touch(path):
+    """Marks a cache entry as recently used."""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+def prune_cache(cache_dir, max_bytes=DEFAULT_CACHE_MAX_BYTES, keep=()):
+    """Deletes the least recently used PNGs until the cache fits in max_bytes. Returns the number removed."""
+    try:
+        entries = []
+        for name in os.listdir(cache_dir):
+            path = os.path.join(cache_dir, name)
+            if name.endswith('.png') and os.path.isfile(path):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+    except OSError:
+        return 0
+
+    total = sum(size for _, size, _ in entries)
+    keep = {os.path.normpath(p) for p in keep}
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if os.path.normpath(path) in keep:
+            continue
+        try:
+            os.remove(path)
+            total -= size
+            removed += 1
+        except OSError:
+            pass
+    return removed
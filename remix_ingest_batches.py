@@ -0,0 +1,102 @@
+"""
+Concurrent, adaptively sized batch ingestion for the toolkit server.
+
+Special textures (height, emissive, ...) are ingested through /material,
+which converts each file to DDS before it answers. Sending fixed batches one
+after another left the server idle between requests and let one bad batch
+abort the whole assignment. ingest_in_batches keeps a bounded number of
+batches in flight and sizes new batches with additive-increase /
+multiplicative-decrease on the observed per-item latency: batches grow while
+the server keeps up and halve when it slows down or fails. A failed batch is
+retried on its own, split in half, so one unreadable file cannot take its
+neighbours down with it. This module must stay free of bpy.
+"""
+
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+try:
+    from . import remix_http
+except ImportError:  # Imported outside the addon package (benchmarks).
+    import remix_http
+
+DEFAULT_MAX_IN_FLIGHT = 3
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+class AdaptiveBatchSizer:
+    """AIMD batch size: +1 after a batch that met the latency target, halved after one that did not."""
+
+    def __init__(self, initial=5, minimum=1, maximum=16, target_sec_per_item=4.0):
+        self.minimum, self.maximum = minimum, maximum
+        self.size = max(minimum, min(maximum, initial))
+        self.target_sec_per_item = target_sec_per_item
+
+    def record(self, batch_len, elapsed_sec, succeeded):
+        if succeeded and batch_len > 0 and elapsed_sec / batch_len <= self.target_sec_per_item:
+            # Only a full-size batch is evidence that the current size is fine.
+            if batch_len >= self.size:
+                self.size = min(self.maximum, self.size + 1)
+        else:
+            self.size = max(self.minimum, self.size // 2)
+        return self.size
+
+
+def ingest_in_batches(items, send_batch, max_in_flight=DEFAULT_MAX_IN_FLIGHT, sizer=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """
+    Calls send_batch(list_of_items) -> bool from a thread pool until every item
+    has been sent in a successful batch or has failed max_attempts times.
+    Returns (succeeded_items, failed_items), each in the input order.
+    """
+    items = list(items)
+    sizer = sizer or AdaptiveBatchSizer()
+    pending = deque(range(len(items)))
+    retries = deque()  # (indices, attempt) of failed batches, sent before new work.
+    succeeded, failed = set(), set()
+    in_flight = {}
+
+    def _timed_send(batch, attempt):
+        if attempt > 1:
+            # Retries back off like any other request, so a struggling server gets room.
+            time.sleep(remix_http.backoff_delay(attempt - 1))
+        start = time.perf_counter()
+        try:
+            ok = bool(send_batch(batch))
+        except Exception as e:
+            logging.warning(f"Ingest batch raised: {e}")
+            ok = False
+        return ok, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max(1, max_in_flight), thread_name_prefix="RemixIngest") as pool:
+        while pending or retries or in_flight:
+            while len(in_flight) < max_in_flight and (pending or retries):
+                if retries:
+                    indices, attempt = retries.popleft()
+                else:
+                    count = min(sizer.size, len(pending))
+                    indices, attempt = [pending.popleft() for _ in range(count)], 1
+                future = pool.submit(_timed_send, [items[i] for i in indices], attempt)
+                in_flight[future] = (indices, attempt)
+                logging.info(f"  > Ingest batch of {len(indices)} item(s) sent (attempt {attempt}, {len(in_flight)} in flight).")
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                indices, attempt = in_flight.pop(future)
+                ok, elapsed = future.result()
+                sizer.record(len(indices), elapsed, ok)
+                if ok:
+                    succeeded.update(indices)
+                    logging.info(f"    - Ingest batch of {len(indices)} item(s) finished in {elapsed:.1f}s; next batch size {sizer.size}.")
+                elif attempt >= max_attempts:
+                    failed.update(indices)
+                    logging.error(f"    - Ingest batch of {len(indices)} item(s) failed {attempt} time(s); giving up on it.")
+                else:
+                    logging.warning(f"    - Ingest batch of {len(indices)} item(s) failed; retrying it on its own.")
+                    half = (len(indices) + 1) // 2
+                    for part in (indices[:half], indices[half:]):
+                        if part:
+                            retries.append((part, attempt + 1))
+
+    return [items[i] for i in sorted(succeeded)], [items[i] for i in sorted(failed)]
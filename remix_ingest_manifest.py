@@ -0,0 +1,125 @@
+"""
+Local manifest of textures the toolkit server has already ingested.
+
+Special textures are converted to DDS by the server on every ingest, which is
+the slowest part of an export. The manifest maps a texture's content digest
+(and its texture type, which picks the DDS format) to the '.rtex.dds' path the
+server wrote for it under the project's ingest directory. An export that
+finds a byte-identical texture in the manifest reconnects the existing DDS by
+path instead of ingesting it again.
+
+Entries are only trusted while their DDS file still exists with the size and
+modification time recorded for it, so this applies when the ingest directory
+is reachable from this machine (the usual local toolkit setup); otherwise
+every lookup misses and textures are ingested as before. A server path
+belongs to at most one entry: ingesting different content to the same DDS
+name replaces the older entry. The file is rewritten atomically (temp file + os.replace).
+This module must stay free of bpy.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+MANIFEST_VERSION = 2
+
+
+def file_digest(path, chunk_size=1 << 20):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _dds_signature(server_path):
+    """(size, mtime_ns) of a DDS file, or (None, None) if it is not reachable."""
+    try:
+        stat = os.stat(server_path)
+    except OSError:
+        return None, None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _directory_key(ingest_dir):
+    return os.path.normcase(os.path.normpath(ingest_dir.rstrip('/\\')))
+
+
+class IngestManifest:
+    def __init__(self, path, data=None):
+        self.path = path
+        self._data = data or {'version': MANIFEST_VERSION, 'directories': {}}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path):
+        """Reads the manifest, or starts an empty one if it is missing or unreadable."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION and isinstance(data.get('directories'), dict):
+                return cls(path, data)
+            logging.info(f"Ingest manifest '{path}' has an old format; starting a new one.")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read ingest manifest '{path}', starting a new one: {e}")
+        return cls(path)
+
+    def lookup(self, ingest_dir, digest, texture_type):
+        """The server path of an identical, already ingested texture, or None."""
+        key = f"{texture_type}:{digest}"
+        with self._lock:
+            entries = self._data['directories'].get(_directory_key(ingest_dir), {})
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if _dds_signature(entry['server_path']) != (entry.get('size'), entry.get('mtime_ns')):
+                # Deleted or regenerated on the server side; ingest it again.
+                del entries[key]
+                self._dirty = True
+                return None
+            return entry['server_path']
+
+    def record(self, ingest_dir, digest, texture_type, server_path, source_name=None):
+        """Remembers the DDS written for a texture. Call it once the ingest finished."""
+        size, mtime_ns = _dds_signature(server_path)
+        with self._lock:
+            entries = self._data['directories'].setdefault(_directory_key(ingest_dir), {})
+            # The DDS now holds this texture; older entries that named the same
+            # file describe content that was overwritten.
+            for stale_key in [k for k, e in entries.items() if e['server_path'] == server_path]:
+                del entries[stale_key]
+            if size is None:
+                self._dirty = True
+                return
+            entries[f"{texture_type}:{digest}"] = {
+                'server_path': server_path,
+                'size': size,
+                'mtime_ns': mtime_ns,
+                'source_name': source_name,
+                'recorded': datetime.now().isoformat(timespec='seconds'),
+            }
+            self._dirty = True
+
+    def save(self):
+        """Writes the manifest if it changed. Returns False if it could not be written."""
+        with self._lock:
+            if not self._dirty:
+                return True
+            payload = json.dumps(self._data, indent=1)
+            self._dirty = False
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temp_path, self.path)
+            return True
+        except OSError as e:
+            logging.error(f"Could not write ingest manifest '{self.path}': {e}")
+            return False
@@ -0,0 +1,117 @@
+"""
+Framed message protocol shared by the Remix addon and its persistent bake workers.
+
+Every message is a single line: FRAME_MARKER followed by compact JSON. Blender
+prints its own output (file loads, bake progress) to the same stdout pipe, so
+the marker is what lets the reader separate protocol frames from that noise.
+This module must stay free of bpy so both sides can import it.
+
+Remote bake agents (remix_bake_agent.py) use a second, socket transport: there
+is no console noise on a TCP stream, so messages are length-prefixed and may
+carry a binary payload (file contents).
+"""
+
+import hashlib
+import json
+import struct
+
+PROTOCOL_VERSION = 1
+FRAME_MARKER = "@@REMIX_IPC@@"
+
+# --- Worker -> addon message types ---
+MSG_READY = "ready"          # Worker finished initializing and can take a task.
+MSG_HEARTBEAT = "heartbeat"  # Periodic liveness signal, sent even while a bake blocks.
+MSG_PROGRESS = "progress"    # A task entered a new phase.
+MSG_RESULT = "result"        # A task finished; carries status success/failure/error.
+MSG_ERROR = "error"          # Worker-level failure outside of any task.
+
+# --- Addon -> worker actions ---
+ACTION_BAKE = "bake"
+ACTION_QUIT = "quit"
+# Carries the export's texture translation map. Sent once per worker before its
+# first task (and again if the map changes); tasks then name only the images
+# they use and the map version they expect.
+ACTION_SET_TEXTURE_MAP = "set_texture_map"
+
+# Workers send a heartbeat this often. The addon treats a worker as hung when it
+# has been silent for HANG_TIMEOUT_SEC while holding a task.
+HEARTBEAT_INTERVAL_SEC = 2.0
+HANG_TIMEOUT_SEC = 120.0
+
+# --- Addon <-> bake agent message types (socket transport only) ---
+MSG_HELLO = "hello"      # Handshake, both directions. Carries PROTOCOL_VERSION.
+MSG_HAVE = "have"        # Addon -> agent: content digests the next task needs.
+MSG_MISSING = "missing"  # Agent -> addon: the subset of those digests it does not store.
+MSG_BLOB = "blob"        # Addon -> agent: one input file; payload is its content.
+MSG_OUTPUT = "output"    # Agent -> addon: one baked file; sent before the task's MSG_RESULT.
+MSG_LOG = "log"          # Agent -> addon: a line of the remote worker's console output.
+
+AGENT_DEFAULT_PORT = 47820
+# Socket frame header: JSON length, payload length.
+SOCKET_HEADER = struct.Struct(">IQ")
+
+
+def texture_map_version(texture_map):
+    """Content version of a texture translation map: equal maps get equal versions."""
+    payload = json.dumps(texture_map, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def encode_frame(message):
+    """Serializes a message dict into a single newline-terminated frame."""
+    return FRAME_MARKER + json.dumps(message, separators=(',', ':')) + "\n"
+
+
+def decode_frame(line):
+    """
+    Parses one line read from the pipe. Returns the message dict, or None when
+    the line is not a protocol frame (e.g. regular Blender console output).
+    """
+    if not line:
+        return None
+    line = line.strip()
+    if not line.startswith(FRAME_MARKER):
+        return None
+    try:
+        message = json.loads(line[len(FRAME_MARKER):])
+    except (json.JSONDecodeError, ValueError):
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size > 0:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def send_socket_message(sock, message, payload=b""):
+    """Sends one length-prefixed message (and optional binary payload) over a socket."""
+    body = json.dumps(message, separators=(',', ':')).encode("utf-8")
+    sock.sendall(SOCKET_HEADER.pack(len(body), len(payload)) + body)
+    if payload:
+        sock.sendall(payload)
+
+
+def recv_socket_message(sock):
+    """
+    Receives one message sent by send_socket_message(). Returns (message, payload),
+    or (None, None) when the peer closed the connection.
+    """
+    header = _recv_exact(sock, SOCKET_HEADER.size)
+    if header is None:
+        return None, None
+    body_size, payload_size = SOCKET_HEADER.unpack(header)
+    body = _recv_exact(sock, body_size)
+    payload = _recv_exact(sock, payload_size) if payload_size else b""
+    if body is None or payload is None:
+        return None, None
+    message = json.loads(body.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("Socket message is not an object.")
+    return message, payload
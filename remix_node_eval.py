@@ -0,0 +1,346 @@
+"""
+CPU evaluator for simple shader-node chains.
+
+Some bake channels are nothing more than an image texture pushed through a few
+per-pixel nodes (Invert, Gamma, Hue/Saturation/Value, Mix with a constant,
+Math, Separate RGB/Color). Baking those in Cycles costs a worker round trip;
+evaluating the same math on the source pixels with NumPy gives the same
+result in a fraction of the time.
+
+build_eval_plan() runs on Blender's main thread and turns a node chain into a
+plain-data plan (or None when anything in the chain is unsupported).
+evaluate_plan() only touches that plan, NumPy and Pillow, so it is safe to run
+in a thread pool. Node formulas follow Cycles' SVM implementations.
+"""
+
+import os
+
+import numpy as np
+
+try:
+    from .remix_array_ops import linear_to_srgb, srgb_to_linear, float_to_byte
+    from .remix_image_jobs import INTERMEDIATE_COMPRESS_LEVEL
+except ImportError:  # Imported outside the addon package (worker, benchmarks).
+    from remix_array_ops import linear_to_srgb, srgb_to_linear, float_to_byte
+    from remix_image_jobs import INTERMEDIATE_COMPRESS_LEVEL
+
+# Luminance weights used for implicit color -> float socket conversion
+# (Rec.709 scene-linear, Blender's default OCIO configuration).
+LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+PILLOW_READABLE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.tga', '.bmp', '.tif', '.tiff')
+SRGB_COLORSPACES = {'sRGB'}
+DATA_COLORSPACES = {'Non-Color', 'Raw', 'Linear', 'Linear Rec.709'}
+MIX_BLEND_TYPES = {'MIX', 'MULTIPLY', 'ADD', 'SUBTRACT', 'SCREEN', 'DARKEN', 'LIGHTEN'}
+MATH_OPERATIONS = {'MULTIPLY', 'ADD', 'SUBTRACT'}
+SEPARATE_OUTPUTS = {'R': 0, 'G': 1, 'B': 2, 'Red': 0, 'Green': 1, 'Blue': 2}
+
+
+class UnsupportedChain(Exception):
+    """Raised while building a plan when the chain needs Cycles."""
+
+
+# --- Plan building (main thread, reads bpy node data) ---
+
+def _const_float(socket):
+    if socket.is_linked:
+        raise UnsupportedChain(f"input '{socket.name}' must be constant")
+    return float(socket.default_value)
+
+
+def _const_color(socket):
+    if socket.is_linked:
+        raise UnsupportedChain(f"input '{socket.name}' must be constant")
+    return [float(c) for c in socket.default_value[:3]]
+
+
+def _input_by_identifier(node, identifier):
+    return next((s for s in node.inputs if s.identifier == identifier), None)
+
+
+def _follow_link(socket):
+    """Returns (from_node, from_socket) for a linked input, skipping reroutes."""
+    link = socket.links[0]
+    while True:
+        if link.is_muted or not link.is_valid:
+            raise UnsupportedChain("muted or invalid link")
+        node = link.from_node
+        if node.mute:
+            raise UnsupportedChain(f"muted node '{node.name}'")
+        if node.type != 'REROUTE':
+            return node, link.from_socket
+        if not node.inputs[0].is_linked:
+            raise UnsupportedChain("dangling reroute")
+        link = node.inputs[0].links[0]
+
+
+def _pick_chain_and_constant(first, second):
+    """For two-input nodes: exactly one side may continue the chain."""
+    if first.is_linked and not second.is_linked:
+        return first, second, 0
+    if second.is_linked and not first.is_linked:
+        return second, first, 1
+    raise UnsupportedChain("exactly one operand must be linked")
+
+
+def build_eval_plan(socket, resolve_image_path, max_depth=16):
+    """
+    Walks backwards from `socket` (the input the EMIT bake reads) and returns
+    a plan dict, or None when the chain contains anything unsupported.
+    `resolve_image_path(image)` must return the on-disk file for an image.
+    """
+    ops = []
+    try:
+        if not socket.is_linked:
+            raise UnsupportedChain("socket is not linked")
+        node, from_socket = _follow_link(socket)
+
+        for _ in range(max_depth):
+            node_type = node.type
+
+            if node_type == 'TEX_IMAGE':
+                image = node.image
+                if image is None or image.source != 'FILE':
+                    raise UnsupportedChain("image texture must be a single file")
+                if node.inputs['Vector'].is_linked or node.projection != 'FLAT':
+                    raise UnsupportedChain("image texture must use default UV mapping")
+                if image.alpha_mode not in ('STRAIGHT', 'CHANNEL_PACKED', 'NONE'):
+                    raise UnsupportedChain(f"unsupported alpha mode '{image.alpha_mode}'")
+                colorspace = image.colorspace_settings.name
+                if colorspace not in SRGB_COLORSPACES and colorspace not in DATA_COLORSPACES:
+                    raise UnsupportedChain(f"unsupported colorspace '{colorspace}'")
+                path = resolve_image_path(image)
+                if not path or not os.path.isfile(path) or not path.lower().endswith(PILLOW_READABLE_EXTENSIONS):
+                    raise UnsupportedChain(f"image file not readable: '{path}'")
+                ops.reverse()
+                return {
+                    'image_path': path,
+                    'image_is_srgb': colorspace in SRGB_COLORSPACES,
+                    'image_output': 'alpha' if from_socket.name == 'Alpha' else 'color',
+                    'ops': ops,
+                }
+
+            if node_type == 'INVERT':
+                ops.append({'op': 'invert', 'fac': _const_float(node.inputs['Fac'])})
+                chain_socket = node.inputs['Color']
+
+            elif node_type == 'GAMMA':
+                ops.append({'op': 'gamma', 'gamma': _const_float(node.inputs['Gamma'])})
+                chain_socket = node.inputs['Color']
+
+            elif node_type == 'HUE_SAT':
+                ops.append({
+                    'op': 'hue_sat',
+                    'hue': _const_float(node.inputs['Hue']),
+                    'saturation': _const_float(node.inputs['Saturation']),
+                    'value': _const_float(node.inputs['Value']),
+                    'fac': _const_float(node.inputs['Fac']),
+                })
+                chain_socket = node.inputs['Color']
+
+            elif node_type in ('MIX_RGB', 'MIX'):
+                if node_type == 'MIX':
+                    if node.data_type != 'RGBA':
+                        raise UnsupportedChain("Mix node must be in Color mode")
+                    fac_socket = _input_by_identifier(node, 'Factor_Float')
+                    a_socket, b_socket = _input_by_identifier(node, 'A_Color'), _input_by_identifier(node, 'B_Color')
+                    clamp_fac, clamp_result = node.clamp_factor, node.clamp_result
+                else:
+                    fac_socket, a_socket, b_socket = node.inputs['Fac'], node.inputs['Color1'], node.inputs['Color2']
+                    clamp_fac, clamp_result = True, node.use_clamp
+                if node.blend_type not in MIX_BLEND_TYPES:
+                    raise UnsupportedChain(f"unsupported blend type '{node.blend_type}'")
+                chain_socket, const_socket, chain_index = _pick_chain_and_constant(a_socket, b_socket)
+                fac = _const_float(fac_socket)
+                ops.append({
+                    'op': 'mix',
+                    'blend_type': node.blend_type,
+                    'fac': min(max(fac, 0.0), 1.0) if clamp_fac else fac,
+                    'constant': _const_color(const_socket),
+                    'chain_is_a': chain_index == 0,
+                    'clamp': clamp_result,
+                })
+
+            elif node_type == 'MATH':
+                if node.operation not in MATH_OPERATIONS:
+                    raise UnsupportedChain(f"unsupported math operation '{node.operation}'")
+                chain_socket, const_socket, chain_index = _pick_chain_and_constant(node.inputs[0], node.inputs[1])
+                ops.append({
+                    'op': 'math',
+                    'operation': node.operation,
+                    'constant': _const_float(const_socket),
+                    'chain_is_a': chain_index == 0,
+                    'clamp': node.use_clamp,
+                })
+
+            elif node_type in ('SEPRGB', 'SEPARATE_COLOR'):
+                if node_type == 'SEPARATE_COLOR' and node.mode != 'RGB':
+                    raise UnsupportedChain("Separate Color must be in RGB mode")
+                if from_socket.name not in SEPARATE_OUTPUTS:
+                    raise UnsupportedChain(f"unsupported separate output '{from_socket.name}'")
+                ops.append({'op': 'separate', 'channel': SEPARATE_OUTPUTS[from_socket.name]})
+                chain_socket = node.inputs[0]
+
+            else:
+                raise UnsupportedChain(f"unsupported node type '{node_type}'")
+
+            if not chain_socket.is_linked:
+                raise UnsupportedChain(f"chain input of '{node.name}' is not linked")
+            node, from_socket = _follow_link(chain_socket)
+
+        raise UnsupportedChain("chain too deep")
+    except (UnsupportedChain, KeyError, AttributeError, IndexError, TypeError):
+        return None
+
+
+# --- Evaluation (thread-safe: no bpy) ---
+
+def _to_color(value):
+    """float -> color socket conversion: (f, f, f)."""
+    return np.repeat(value[..., None], 3, axis=-1) if value.ndim == 2 else value
+
+
+def _to_float(value):
+    """color -> float socket conversion: luminance."""
+    return value @ LUMINANCE_WEIGHTS if value.ndim == 3 else value
+
+
+def _rgb_to_hsv(rgb):
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    cmax = np.maximum(np.maximum(r, g), b)
+    cmin = np.minimum(np.minimum(r, g), b)
+    cdelta = cmax - cmin
+    v = cmax
+    s = np.where(cmax != 0.0, cdelta / np.where(cmax != 0.0, cmax, 1.0), 0.0)
+    safe_delta = np.where(cdelta != 0.0, cdelta, 1.0)
+    rc, gc, bc = (cmax - r) / safe_delta, (cmax - g) / safe_delta, (cmax - b) / safe_delta
+    h = np.where(r == cmax, bc - gc, np.where(g == cmax, 2.0 + rc - bc, 4.0 + gc - rc)) / 6.0
+    h = np.where(h < 0.0, h + 1.0, h)
+    h = np.where(s != 0.0, h, 0.0)
+    return np.stack([h, s, v], axis=-1)
+
+
+def _hsv_to_rgb(hsv):
+    h, s, v = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+    h6 = np.where(h == 1.0, 0.0, h) * 6.0
+    i = np.floor(h6)
+    f = h6 - i
+    p, q, t = v * (1.0 - s), v * (1.0 - s * f), v * (1.0 - s * (1.0 - f))
+    i = i.astype(np.int32) % 6
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    rgb = np.stack([r, g, b], axis=-1)
+    return np.where((s != 0.0)[..., None], rgb, v[..., None])
+
+
+def _apply_mix(op, chain):
+    a = _to_color(chain)
+    b = np.asarray(op['constant'], dtype=np.float32)
+    if not op['chain_is_a']:
+        a, b = np.broadcast_to(b, a.shape), a
+    fac = np.float32(op['fac'])
+    blend = op['blend_type']
+    if blend == 'MIX':
+        result = (1.0 - fac) * a + fac * b
+    elif blend == 'MULTIPLY':
+        result = a * ((1.0 - fac) + fac * b)
+    elif blend == 'ADD':
+        result = a + fac * b
+    elif blend == 'SUBTRACT':
+        result = a - fac * b
+    elif blend == 'SCREEN':
+        result = 1.0 - ((1.0 - fac) + fac * (1.0 - b)) * (1.0 - a)
+    elif blend == 'DARKEN':
+        result = (1.0 - fac) * a + fac * np.minimum(a, b)
+    else:  # LIGHTEN
+        result = (1.0 - fac) * a + fac * np.maximum(a, b)
+    return np.clip(result, 0.0, 1.0) if op['clamp'] else result
+
+
+def _apply_op(op, value):
+    kind = op['op']
+    if kind == 'invert':
+        color = _to_color(value)
+        fac = np.float32(op['fac'])
+        return (1.0 - fac) * color + fac * (1.0 - color)
+    if kind == 'gamma':
+        color = _to_color(value)
+        gamma = np.float32(op['gamma'])
+        return np.where(color > 0.0, np.power(np.maximum(color, 0.0), gamma), color)
+    if kind == 'hue_sat':
+        color = _to_color(value)
+        hsv = _rgb_to_hsv(color)
+        hue = hsv[..., 0] + np.float32(op['hue'] + 0.5)
+        hsv = np.stack([
+            hue - np.floor(hue),
+            np.clip(hsv[..., 1] * np.float32(op['saturation']), 0.0, 1.0),
+            hsv[..., 2] * np.float32(op['value']),
+        ], axis=-1)
+        fac = np.float32(op['fac'])
+        result = fac * _hsv_to_rgb(hsv) + (1.0 - fac) * color
+        # Cycles clamps negatives caused by over-saturation.
+        return np.maximum(result, 0.0)
+    if kind == 'mix':
+        return _apply_mix(op, value)
+    if kind == 'math':
+        a = _to_float(value)
+        b = np.float32(op['constant'])
+        if not op['chain_is_a']:
+            a, b = b, a
+        if op['operation'] == 'MULTIPLY':
+            result = a * b
+        elif op['operation'] == 'ADD':
+            result = a + b
+        else:
+            result = a - b
+        result = np.broadcast_to(result, value.shape[:2]).astype(np.float32)
+        return np.clip(result, 0.0, 1.0) if op['clamp'] else result
+    if kind == 'separate':
+        return _to_color(value)[..., op['channel']]
+    raise ValueError(f"Unknown op '{kind}'")
+
+
+def _load_source(plan):
+    """Loads the source image as top-down float32 in the space the shader sees it."""
+    from PIL import Image
+
+    with Image.open(plan['image_path']) as img:
+        if img.mode in ('I;16', 'I;16B', 'I'):
+            gray = np.asarray(img, dtype=np.float32) / 65535.0
+            rgba = np.dstack([gray, gray, gray, np.ones_like(gray)])
+        else:
+            rgba = np.asarray(img.convert('RGBA'), dtype=np.float32) / 255.0
+
+    if plan['image_output'] == 'alpha':
+        return np.ascontiguousarray(rgba[..., 3])
+    rgb = rgba[..., :3]
+    if plan['image_is_srgb']:
+        rgb = srgb_to_linear(rgb).astype(np.float32)
+    return np.ascontiguousarray(rgb)
+
+
+def evaluate_plan(plan, output_path, width, height, is_value_bake, is_color_data):
+    """
+    Evaluates a plan and writes the PNG an EMIT bake of the chain would produce:
+    value bakes emit (v, v, v) through the Strength input, color bakes emit the
+    color directly; color targets are sRGB-encoded. The result is resized to the
+    task resolution when the source texture differs.
+    """
+    from PIL import Image
+
+    value = _load_source(plan)
+    for op in plan['ops']:
+        value = _apply_op(op, value)
+
+    emitted = _to_color(_to_float(value)) if is_value_bake else _to_color(value)
+    if is_color_data:
+        emitted = linear_to_srgb(emitted)
+    rgb_bytes = float_to_byte(emitted)
+    alpha = np.full(rgb_bytes.shape[:2] + (1,), 255, dtype=np.uint8)
+
+    result = Image.fromarray(np.concatenate([rgb_bytes, alpha], axis=-1), 'RGBA')
+    if result.size != (width, height):
+        result = result.resize((width, height), Image.Resampling.LANCZOS)
+    result.save(output_path, "PNG", compress_level=INTERMEDIATE_COMPRESS_LEVEL)
+    return output_path
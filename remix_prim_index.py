@@ -0,0 +1,101 @@
+"""
+Client-side index of the prims in the open Remix project.
+
+Version matching used to download the full prim listing at the end of every
+export and regex-scan every segment of every path for '<base name>_<number>'.
+RemixPrimIndex does that scan once when it is built, keying each path by the
+base name of every versioned segment it contains and by its 'ref_' prim, so
+lookups are dictionary hits. The export fetches the listing in the background
+during the pre-flight check, then reuses the index for version matching and
+replace/append. This module must stay free of bpy.
+"""
+
+import logging
+import re
+
+try:
+    from . import remix_http
+except ImportError:  # Imported outside the addon package (benchmarks).
+    import remix_http
+
+REMIX_ACCEPT_HEADER = {'accept': 'application/lightspeed.remix.service+json; version=1.0'}
+# A prim name ending in an asset number, e.g. 'Test6_16' -> base 'Test6'.
+_VERSIONED_SEGMENT = re.compile(r"^(.+)_\d+$")
+
+
+def prim_paths_from_response(data):
+    """The prim list of an /assets/ response (older servers name it 'asset_paths')."""
+    return data.get("prim_paths", data.get("asset_paths", []))
+
+
+def assets_url(server_url, selection):
+    """The /assets/ query used for every prim listing, so listings can be reused for each other."""
+    return f"{server_url.rstrip('/')}/assets/?selection={'true' if selection else 'false'}&filter_session_assets=false&exists=true"
+
+
+def fetch_prim_paths(server_url, selection, verify_ssl=True):
+    """
+    Lists the project's prims (selection=False) or only the selected ones.
+    Returns the list of paths, or None if the server could not be queried.
+    """
+    url = assets_url(server_url, selection)
+    logging.info(f"Fetching prims from: {url}")
+    response = remix_http.request_with_retries('GET', url, headers=REMIX_ACCEPT_HEADER, verify=verify_ssl)
+    if response is None or response.status_code != 200:
+        logging.error(f"Failed to fetch prims. Status: {response.status_code if response is not None else 'No Response'}")
+        return None
+    return prim_paths_from_response(response.json())
+
+
+def reference_prim_of(path):
+    """The path up to and including its first 'ref_' segment, or None."""
+    segments = path.strip('/').split('/')
+    for i, segment in enumerate(segments):
+        if segment.lower().startswith('ref_'):
+            return '/' + '/'.join(segments[:i + 1])
+    return None
+
+
+class RemixPrimIndex:
+    def __init__(self, prim_paths):
+        self.prim_paths = list(prim_paths)
+        # lower-cased base name -> paths with a '<base>_<number>' segment, in listing order.
+        self._by_base_name = {}
+        # path -> its 'ref_' prim (None when it has none).
+        self._reference_prims = {}
+        for path in self.prim_paths:
+            self._reference_prims[path] = reference_prim_of(path)
+            bases = set()
+            for segment in path.strip('/').split('/'):
+                match = _VERSIONED_SEGMENT.match(segment)
+                if match:
+                    bases.add(match.group(1).lower())
+            for base in bases:
+                self._by_base_name.setdefault(base, []).append(path)
+
+    @classmethod
+    def fetch(cls, server_url, verify_ssl=True):
+        """Builds the index from one full listing. Returns None if the server could not be queried."""
+        prim_paths = fetch_prim_paths(server_url, selection=False, verify_ssl=verify_ssl)
+        return cls(prim_paths) if prim_paths is not None else None
+
+    def __len__(self):
+        return len(self.prim_paths)
+
+    def reference_prim(self, path):
+        if path in self._reference_prims:
+            return self._reference_prims[path]
+        return reference_prim_of(path)
+
+    def find_versioned_asset(self, base_name):
+        """
+        First prim (in listing order) with a segment named '<base_name>_<number>'
+        that sits under a 'ref_' prim. Case-insensitive, and 'Test' never matches
+        'Test6_16'. Returns (path, reference_prim_path) or (None, None).
+        """
+        for path in self._by_base_name.get(base_name.lower(), ()):
+            reference_prim_path = self._reference_prims[path]
+            if reference_prim_path:
+                return path, reference_prim_path
+            logging.warning(f"Found asset matching '{base_name}_<version>' but no 'ref_' prim in path '{path}'.")
+        return None, None
@@ -0,0 +1,510 @@
+"""
+Request flows an export runs against the toolkit server.
+
+The export's network half (model ingest, replace or append, prim selection,
+special texture ingest and texture assignment) lives here, with the request
+payloads, so that the operators and benchmarks/bench_remix_flows.py send
+exactly the same requests in the same order. Every flow takes `settings`,
+any object with the addon's server preferences as attributes
+(remix_server_url, remix_export_url, remix_verify_ssl; main.py passes its
+server_settings_snapshot or the detached preferences). Failures are logged
+and reported through the return value; place_asset raises RuntimeError.
+This module must stay free of bpy.
+"""
+
+import copy
+import json
+import logging
+import os
+import urllib.parse
+
+try:
+    from . import remix_http
+    from . import remix_ingest_batches
+    from . import remix_ingest_manifest
+    from . import remix_prim_index
+except ImportError:  # Imported outside the addon package (benchmarks).
+    import remix_http
+    import remix_ingest_batches
+    import remix_ingest_manifest
+    import remix_prim_index
+
+REMIX_HEADERS = {
+    **remix_prim_index.REMIX_ACCEPT_HEADER,
+    'Content-Type': 'application/lightspeed.remix.service+json; version=1.0',
+}
+# Special texture type -> the AperturePBR input it is connected to.
+SPECIAL_TEXTURE_MAP = {
+    "HEIGHT": "height_texture",
+    "EMISSIVE": "emissive_mask_texture",
+    "ANISOTROPY": "anisotropy_texture",
+    "TRANSMITTANCE": "transmittance_texture",
+    "SINGLE_SCATTERING": "subsurface_color_texture",
+    "MEASUREMENT_DISTANCE": "subsurface_radius_texture"
+}
+DEFAULT_APPEND_PARENT = "/RootNode/meshes"
+
+MODEL_INGEST_PAYLOAD = {
+    "executor": 1,
+    "name": "Model(s)",
+    "context_plugin": {
+        "name": "AssetImporter",
+        "data": {
+            "allow_empty_input_files_list": True, "bake_material": False, "baking_scales": False,
+            "channel": "Default", "close_stage_on_exit": True, "context_name": "ingestcraft",
+            "convert_fbx_to_y_up": False, "convert_fbx_to_z_up": False, "convert_stage_up_y": False,
+            "convert_stage_up_z": False, "cook_mass_template": True, "create_context_if_not_exist": True,
+            "create_output_directory_if_missing": True, "create_world_as_default_root_prim": True,
+            "data_flows": [
+                {"channel": "write_metadata", "name": "InOutData", "push_input_data": True, "push_output_data": True},
+                {"channel": "ingestion_output", "name": "InOutData", "push_input_data": False, "push_output_data": True}
+            ],
+            "default_output_endpoint": "/stagecraft/assets/default-directory", "disabling_instancing": False,
+            "embed_mdl_in_usd": True, "embed_textures": True, "export_hidden_props": False,
+            "export_mdl_gltf_extension": False, "export_preview_surface": False, "export_separate_gltf": False,
+            "expose_mass_queue_action_ui": True, "expose_mass_ui": True, "full_path_keep": False,
+            "global_progress_value": 0, "hide_context_ui": True, "ignore_animations": False,
+            "ignore_camera": False, "ignore_flip_rotations": False, "ignore_light": False,
+            "ignore_materials": False, "ignore_pivots": False, "ignore_unbound_bones": False,
+            "input_files": [], "keep_all_materials": False, "merge_all_meshes": False,
+            "output_directory": "", "output_usd_extension": "usd", "progress": [0, "Initializing", True],
+            "single_mesh": False, "smooth_normals": True, "support_point_instancer": False,
+            "use_double_precision_to_usd_transform_op": False, "use_meter_as_world_unit": False
+        }
+    },
+    "check_plugins": [
+        {"name": "ClearUnassignedMaterial", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "include_geom_subset": True, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllMeshes"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
+        {"name": "DefaultMaterial", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "include_geom_subset": False, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllMeshes"}], "data": {"channel": "Default", "context_name": "", "cook_mass_template": False, "default_material_mdl_name": "OmniPBR", "default_material_mdl_url": "OmniPBR.mdl", "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
+        {"name": "MaterialShaders", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllMaterials"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "ignore_not_convertable_shaders": False, "progress": [0, "Initializing", True], "save_on_fix_failure": True, "shader_subidentifiers": {"AperturePBR_Opacity": ".*", "AperturePBR_Translucent": "translucent|glass|trans"}}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
+        {"name": "ValueMapping", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllShaders"}], "data": {"attributes": {"inputs:emissive_intensity": [{"input_value": 10000, "operator": "=", "output_value": 1}]}, "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True}, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
+        {"name": "ConvertToOctahedral", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllShaders"}], "data": {"channel": "Default", "conversion_args": {"inputs:normalmap_texture": {"encoding_attr": "inputs:encoding", "replace_suffix": "_Normal", "suffix": "_OTH_Normal"}}, "cook_mass_template": False, "data_flows": [{"channel": "cleanup_files", "name": "InOutData", "push_input_data": True, "push_output_data": True}], "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "replace_udim_textures_by_empty": True, "save_on_fix_failure": True}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
+        {"name": "ConvertToDDS", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllShaders"}], "data": {"channel": "Default", "conversion_args": {"inputs:diffuse_texture": {"args": ["--format", "bc7", "--mip-gamma-correct"]}, "inputs:emissive_mask_texture": {"args": ["--format", "bc7", "--mip-gamma-correct"]}, "inputs:height_texture": {"args": ["--format", "bc4", "--no-mip-gamma-correct", "--mip-filter", "max"]}, "inputs:metallic_texture": {"args": ["--format", "bc4", "--no-mip-gamma-correct"]}, "inputs:normalmap_texture": {"args": ["--format", "bc5", "--no-mip-gamma-correct"]}, "inputs:reflectionroughness_texture": {"args": ["--format", "bc4", "--no-mip-gamma-correct"]}, "inputs:transmittance_texture": {"args": ["--format", "bc7", "--mip-gamma-correct"]}}, "cook_mass_template": False, "data_flows": [{"channel": "cleanup_files", "name": "InOutData", "push_input_data": True, "push_output_data": True}, {"channel": "write_metadata", "name": "InOutData", "push_input_data": False, "push_output_data": True}], "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "replace_udim_textures_by_empty": True, "save_on_fix_failure": True, "suffix": ".rtex.dds"}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
+        {"name": "RelativeAssetPaths", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllPrims"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
+        {"name": "RelativeReferences", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "AllPrims"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_dependency_between_round": True, "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_all_layers_on_exit": True}, "name": "DependencyIterator"}},
+        {"name": "WrapRootPrims", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "Nothing"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True, "set_default_prim": True, "wrap_prim_name": "XForms"}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_on_exit": True}, "name": "CurrentStage"}},
+        {"name": "ApplyUnitScale", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False, "select_session_layer_prims": False}, "name": "RootPrims"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": True, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True, "scale_target": 1}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_on_exit": True}, "name": "CurrentStage"}},
+        {"name": "WrapRootPrims", "selector_plugins": [{"data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "select_from_root_layer_only": False}, "name": "Nothing"}], "data": {"channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True], "save_on_fix_failure": True, "set_default_prim": True, "wrap_prim_name": "ReferenceTarget"}, "stop_if_fix_failed": True, "context_plugin": {"data": {"channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [0, "Initializing", True], "save_on_exit": True}, "name": "CurrentStage"}}
+    ],
+    "resultor_plugins": [
+        {"name": "FileCleanup", "data": {"channel": "cleanup_files", "cleanup_input": True, "cleanup_output": False, "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True]}},
+        {"name": "FileMetadataWritter", "data": {"channel": "write_metadata", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [0, "Initializing", True]}}
+    ]
+}
+
+TEXTURE_INGEST_PAYLOAD = { "executor": 1, "name": "Material(s)", "context_plugin": { "name": "TextureImporter", "data": { "allow_empty_input_files_list": True, "channel": "Default", "context_name": "ingestcraft", "cook_mass_template": True, "create_context_if_not_exist": True, "create_output_directory_if_missing": True, "data_flows": [ { "channel": "Default", "name": "InOutData", "push_input_data": True, "push_output_data": False } ], "default_output_endpoint": "/stagecraft/assets/default-directory", "expose_mass_queue_action_ui": False, "expose_mass_ui": True, "global_progress_value": 0, "hide_context_ui": True, "input_files": [], "output_directory": "", "progress": [ 0, "Initializing", True ] } }, "check_plugins": [ { "name": "MaterialShaders", "selector_plugins": [ { "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "select_from_root_layer_only": False }, "name": "AllMaterials" } ], "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "ignore_not_convertable_shaders": False, "progress": [ 0, "Initializing", True ], "save_on_fix_failure": True, "shader_subidentifiers": { "AperturePBR_Opacity": ".*" } }, "stop_if_fix_failed": True, "context_plugin": { "data": { "channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [ 0, "Initializing", True ], "save_on_exit": False }, "name": "CurrentStage" } }, { "name": "ConvertToOctahedral", "selector_plugins": [ { "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "select_from_root_layer_only": False }, "name": "AllShaders" } ], "resultor_plugins": [ { "data": { "channel": "cleanup_files_normal", "cleanup_input": True, "cleanup_output": False, "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ] }, "name": "FileCleanup" } ], "data": { "channel": "Default", "conversion_args": { "inputs:normalmap_texture": { "encoding_attr": "inputs:encoding", "replace_suffix": "_Normal", "suffix": "_OTH_Normal" } }, "cook_mass_template": False, "data_flows": [ { "channel": "cleanup_files_normal", "name": "InOutData", "push_input_data": True, "push_output_data": True } ], "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "replace_udim_textures_by_empty": False, "save_on_fix_failure": True }, "stop_if_fix_failed": True, "context_plugin": { "data": { "channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [ 0, "Initializing", True ], "save_on_exit": False }, "name": "CurrentStage" } }, { "name": "ConvertToDDS", "selector_plugins": [ { "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "select_from_root_layer_only": False }, "name": "AllShaders" } ], "resultor_plugins": [ { "data": { "channel": "cleanup_files", "cleanup_input": True, "cleanup_output": False, "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ] }, "name": "FileCleanup" } ], "data": { "channel": "Default", "conversion_args": { "inputs:diffuse_texture": { "args": [ "--format", "bc7", "--mip-gamma-correct" ] }, "inputs:emissive_mask_texture": { "args": [ "--format", "bc7", "--mip-gamma-correct" ] }, "inputs:height_texture": { "args": [ "--format", "bc4", "--no-mip-gamma-correct", "--mip-filter", "max" ] }, "inputs:metallic_texture": { "args": [ "--format", "bc4", "--no-mip-gamma-correct" ] }, "inputs:normalmap_texture": { "args": [ "--format", "bc5", "--no-mip-gamma-correct" ] }, "inputs:reflectionroughness_texture": { "args": [ "--format", "bc4", "--no-mip-gamma-correct" ] }, "inputs:transmittance_texture": { "args": [ "--format", "bc7", "--mip-gamma-correct" ] }, "inputs:subsurface_color_texture": {"args": ["--format", "bc7", "--mip-gamma-correct"]}, "inputs:subsurface_radius_texture": {"args": ["--format", "bc4", "--no-mip-gamma-correct"]} }, "cook_mass_template": False, "data_flows": [ { "channel": "cleanup_files", "name": "InOutData", "push_input_data": True, "push_output_data": True }, { "channel": "write_metadata", "name": "InOutData", "push_input_data": False, "push_output_data": True }, { "channel": "ingestion_output", "name": "InOutData", "push_input_data": False, "push_output_data": True } ], "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "replace_udim_textures_by_empty": False, "save_on_fix_failure": True, "suffix": ".rtex.dds" }, "stop_if_fix_failed": True, "context_plugin": { "data": { "channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [ 0, "Initializing", True ], "save_on_exit": False }, "name": "CurrentStage" } }, { "name": "MassTexturePreview", "selector_plugins": [ { "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "select_from_root_layer_only": False }, "name": "Nothing" } ], "data": { "channel": "Default", "cook_mass_template": False, "expose_mass_queue_action_ui": True, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ], "save_on_fix_failure": True }, "stop_if_fix_failed": True, "context_plugin": { "data": { "channel": "Default", "close_stage_on_exit": False, "cook_mass_template": False, "create_context_if_not_exist": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "hide_context_ui": False, "progress": [ 0, "Initializing", True ], "save_on_exit": False }, "name": "CurrentStage" } } ], "resultor_plugins": [ { "name": "FileMetadataWritter", "data": { "channel": "write_metadata", "cook_mass_template": False, "expose_mass_queue_action_ui": False, "expose_mass_ui": False, "global_progress_value": 0, "progress": [ 0, "Initializing", True ] } } ] }
+
+
+def upload_model(settings, obj_path, ingest_dir):
+    """
+    Ingests an exported OBJ through /model. Returns (usd_path, error_message):
+    the USD the server wrote, or None and a message worth showing the artist
+    (None when the console log says it all).
+    """
+    try:
+        url = settings.remix_export_url.rstrip('/') + "/model"
+        payload = copy.deepcopy(MODEL_INGEST_PAYLOAD)
+        payload["context_plugin"]["data"]["input_files"] = [os.path.abspath(obj_path).replace('\\', '/')]
+        payload["context_plugin"]["data"]["output_directory"] = os.path.join(ingest_dir, "meshes").replace('\\', '/')
+
+        logging.info(f"Uploading OBJ to {url}")
+        response = remix_http.request_with_retries('POST', url, json_payload=payload, verify=settings.remix_verify_ssl, retries=1)
+
+        if response is None or response.status_code not in [200, 201, 204]:
+            error_detail = "No response from server (network error)."
+            status_code = "N/A"
+            if response is not None:
+                status_code = response.status_code
+                try:
+                    error_detail = response.json().get("detail", response.text)
+                except json.JSONDecodeError:
+                    error_detail = response.text
+
+            logging.error(f"Failed to upload OBJ. Status: {status_code}, Response: {error_detail}")
+            if status_code == 500 and "validation did not complete successfully" in error_detail:
+                return None, "Ingestion failed: The server validation failed. Check server logs and ensure Ingest Directory is a valid project path."
+            return None, None
+
+        completed_schemas = response.json().get("completed_schemas", [])
+        if not completed_schemas:
+            logging.error("No completed schemas found in successful response.")
+            return None, None
+
+        # The USD path comes back in the 'ingestion_output' data flow of the payload above.
+        try:
+            data_flows = completed_schemas[0].get("context_plugin", {}).get("data", {}).get("data_flows", [])
+            for flow in data_flows:
+                if flow.get("channel") == "ingestion_output" and flow.get("output_data"):
+                    final_usd_path = flow["output_data"][0].replace('\\', '/')
+                    logging.info(f"Successfully ingested. Server returned USD Path: {final_usd_path}")
+                    return final_usd_path, None
+            logging.error("Could not find final USD path in server response's 'ingestion_output' data flow.")
+            return None, None
+        except (IndexError, KeyError) as e_parse:
+            logging.error(f"Error parsing successful response for USD path: {e_parse}", exc_info=True)
+            return None, None
+
+    except Exception as e_general:
+        logging.error(f"An unexpected error occurred while uploading the model: {e_general}", exc_info=True)
+        return None, None
+
+
+def _reference_path_from(response, action):
+    try:
+        reference_paths = response.json().get("reference_paths", [])
+    except ValueError:
+        logging.error(f"Failed to parse JSON response from {action} request.")
+        return None
+    if not reference_paths or not reference_paths[0]:
+        logging.error(f"No reference paths returned in the {action} response.")
+        return None
+    return reference_paths[0][0]
+
+
+def replace_asset_file(settings, prim_path, new_usd):
+    """Points the asset that `prim_path` belongs to at `new_usd` (PUT). Returns (success, new_reference_path)."""
+    segments = prim_path.strip('/').split('/')
+    trimmed_prim_path = remix_prim_index.reference_prim_of(prim_path)
+    if trimmed_prim_path is None:
+        if len(segments) < 3:
+            logging.error(f"Invalid prim path: {prim_path}")
+            return False, None
+        trimmed_prim_path = '/' + '/'.join(segments[:3])
+
+    url = f"{settings.remix_server_url.rstrip('/')}/assets/{urllib.parse.quote(trimmed_prim_path, safe='')}/file-paths"
+    payload = {"asset_file_path": new_usd.replace('/', '\\'), "force": False}
+    logging.info(f"Replacing mesh via PUT request to: {url} with payload: {payload}")
+    response = remix_http.request_with_retries(
+        'PUT', url, headers={'Content-Type': REMIX_HEADERS['Content-Type']},
+        json_payload=payload, verify=settings.remix_verify_ssl
+    )
+    if response is None or response.status_code not in [200, 204]:
+        status = response.status_code if response is not None else 'No Response'
+        response_text = response.text if response is not None else 'No Response'
+        logging.error(f"Failed to replace mesh via PUT. Status: {status}, Response: {response_text}")
+        return False, None
+
+    logging.info(f"Mesh replaced successfully via PUT request for prim: {trimmed_prim_path}")
+    new_reference_path = _reference_path_from(response, "PUT")
+    if new_reference_path:
+        logging.info(f"New Reference Path: {new_reference_path}")
+    return new_reference_path is not None, new_reference_path
+
+
+def append_asset_file(settings, parent_prim, ingested_usd):
+    """References `ingested_usd` under `parent_prim` (POST). Returns (success, new_reference_path)."""
+    base_url = settings.remix_server_url.rstrip('/')
+    if not base_url.endswith('/stagecraft'):
+        base_url = f"{base_url}/stagecraft"
+    url = f"{base_url}/assets/{urllib.parse.quote(parent_prim, safe='')}/file-paths"
+    payload = {"asset_file_path": ingested_usd.replace('\\', '/'), "force": False}
+    logging.info(f"Appending mesh via POST to: {url} with payload: {payload}")
+    response = remix_http.request_with_retries('POST', url, json_payload=payload, headers=REMIX_HEADERS, verify=settings.remix_verify_ssl)
+    if response is None or response.status_code not in [200, 201, 204]:
+        status = response.status_code if response is not None else 'No Response'
+        response_text = response.text if response is not None else 'No Response'
+        logging.error(f"Failed to append mesh via POST. Status: {status}, Response: {response_text}")
+        return False, None
+
+    reference_path = _reference_path_from(response, "POST")
+    if reference_path:
+        logging.info(f"Mesh appended successfully via POST request. Reference path: {reference_path}")
+    return reference_path is not None, reference_path
+
+
+def select_prim(settings, reference_prim):
+    """Selects `reference_prim` in Remix. Returns True on success."""
+    url = f"{settings.remix_server_url.rstrip('/')}/assets/selection/{urllib.parse.quote(reference_prim, safe='')}"
+    logging.info(f"Selecting mesh prim at: {url}")
+    response = remix_http.request_with_retries('PUT', url, headers=remix_prim_index.REMIX_ACCEPT_HEADER, verify=settings.remix_verify_ssl)
+    if response is not None and response.status_code in [200, 204]:
+        logging.info("Mesh prim selected successfully.")
+        return True
+    status = response.status_code if response is not None else 'No Response'
+    response_text = response.text if response is not None else 'No Response'
+    logging.error(f"Failed to select mesh prim. Status: {status}, Response: {response_text}")
+    return False
+
+
+def mesh_prim_paths(prim_paths):
+    """The mesh prims of a selection listing, each with a single leading slash."""
+    return ['/' + path.rstrip('/').lstrip('/') for path in prim_paths if "/meshes/" in path.lower()]
+
+
+def append_parent_prim(selected_mesh_prims):
+    """Where a new asset is appended: the asset root of the first selected mesh, or the default parent."""
+    valid_parent_prims = [p for p in selected_mesh_prims if "/Looks/" not in p]
+    if not valid_parent_prims:
+        logging.info(f"No usable prim selected in Remix. Appending to default location: {DEFAULT_APPEND_PARENT}")
+        return DEFAULT_APPEND_PARENT
+    full_path = valid_parent_prims[0]
+    # Trim the full prim path back to the asset's root container, /RootNode/meshes/mesh_...
+    segments = full_path.strip('/').split('/')
+    if len(segments) >= 3 and segments[1] == 'meshes':
+        target_prim = '/' + '/'.join(segments[:3])
+        logging.info(f"Selected prim path '{full_path}' was trimmed to '{target_prim}' for append operation.")
+        return target_prim
+    logging.warning(f"Could not determine asset root from '{full_path}'. Using full path as parent.")
+    return full_path
+
+
+def place_asset(settings, ingested_usd, base_name, prim_index_future=None, selected_mesh_prims=(), replace_selected=False):
+    """
+    Puts an ingested USD into the project: replaces the asset whose prims carry
+    '<base_name>_<number>' if there is one (or, with `replace_selected`, the
+    selected mesh), otherwise appends it under the selection. The prim index is
+    taken from `prim_index_future` (fetched while the export baked) or fetched
+    now. Selects the new reference prim in Remix and returns it.
+    Raises RuntimeError if the asset could not be placed.
+    """
+    prim_index = None
+    if prim_index_future is not None:
+        try:
+            prim_index = prim_index_future.result()
+        except Exception as e:
+            logging.warning(f"Background prim listing failed, fetching it again: {e}")
+    if prim_index is None:
+        prim_index = remix_prim_index.RemixPrimIndex.fetch(settings.remix_server_url, settings.remix_verify_ssl)
+
+    prim_path_on_server = None
+    if prim_index is not None:
+        logging.info(f"Searching {len(prim_index)} prims for an existing asset named '{base_name}_<version>'")
+        prim_path_on_server, _ = prim_index.find_versioned_asset(base_name)
+
+    if prim_path_on_server or replace_selected:
+        prim_to_replace = prim_path_on_server
+        if not prim_to_replace:
+            logging.info("No match found by name, but 'Replace' is checked. Replacing current selection.")
+            if not selected_mesh_prims:
+                raise RuntimeError("The 'Replace Stock Mesh' option is ticked, but no mesh is selected in Remix.")
+            prim_to_replace = selected_mesh_prims[0]
+
+        logging.info(f"Entering REPLACE workflow. Target prim: {prim_to_replace}")
+        success, new_ref = replace_asset_file(settings, prim_to_replace, ingested_usd)
+        if not success:
+            raise RuntimeError(f"Failed to replace mesh for prim: {prim_to_replace}")
+    else:
+        logging.info("Entering APPEND workflow (no existing asset found by name).")
+        target_prim = append_parent_prim(selected_mesh_prims)
+        success, new_ref = append_asset_file(settings, target_prim, ingested_usd)
+        if not success:
+            raise RuntimeError(f"Failed to append mesh under prim: {target_prim}")
+
+    select_prim(settings, new_ref)
+    return new_ref
+
+
+def fetch_selected_usd_files(settings):
+    """
+    Resolves the meshes selected in Remix to the USD files the project keeps for
+    them on disk. Returns (usd_files, base_dir), base_dir being the project
+    directory textures are resolved against: (None, None) if the selection could
+    not be listed, ([], None) if it holds no mesh. Raises RuntimeError if the
+    selected meshes' files cannot be resolved.
+    """
+    prim_paths = remix_prim_index.fetch_prim_paths(settings.remix_server_url, selection=True, verify_ssl=settings.remix_verify_ssl)
+    if prim_paths is None:
+        return None, None
+    mesh_prim_paths = [path for path in prim_paths if "/meshes/" in path.lower()]
+    if not mesh_prim_paths:
+        return [], None
+
+    first_mesh_path = mesh_prim_paths[0]
+    segments = first_mesh_path.strip('/').split('/')
+    if len(segments) < 3:
+        raise RuntimeError(f"Cannot determine reference prim from path: {first_mesh_path}")
+
+    ref_prim_for_path_api = '/' + '/'.join(segments[:3])
+    file_paths_url = f"{settings.remix_server_url.rstrip('/')}/assets/{urllib.parse.quote(ref_prim_for_path_api, safe='')}/file-paths"
+    response_files = remix_http.request_with_retries('GET', file_paths_url, headers=remix_prim_index.REMIX_ACCEPT_HEADER, verify=settings.remix_verify_ssl)
+    if response_files is None or response_files.status_code != 200:
+        raise RuntimeError("Failed to retrieve file paths for selected prims.")
+
+    try:
+        base_dir_source = response_files.json()['reference_paths'][0][1][1]
+        base_dir = os.path.dirname(base_dir_source).replace('\\', '/')
+    except (IndexError, KeyError, TypeError):
+        raise RuntimeError("Could not determine base directory from server response.")
+
+    usd_files = []
+    for mesh_path in mesh_prim_paths:
+        mesh_name = mesh_path.strip('/').split('/')[2]
+        usd_path = os.path.join(base_dir, "meshes", f"{mesh_name}.usd").replace('\\', '/')
+        if os.path.exists(usd_path) and usd_path not in usd_files:
+            usd_files.append(usd_path)
+    return usd_files, base_dir
+
+
+def ingest_special_textures(settings, assignments_by_material, manifest_path):
+    """
+    [DEFINITIVE V20 - SHARED CONCURRENT ADAPTIVE INGEST]
+    Ingests special textures (height, emissive, ...) through /material.
+    `assignments_by_material` maps a material name to its texture dicts
+    ({'path', 'type'}); each gets its 'usd_input' and, unless its ingest failed,
+    the 'server_path' of its DDS. Textures found in the ingest manifest are
+    reconnected to their existing DDS, and identical files in the same run share
+    one ingest. The rest go out in concurrent batches sized to the server's
+    latency (see remix_ingest_batches).
+    Returns {'status', 'assignments', 'failed_count', 'ingested_count',
+    'reused_count', 'duplicate_count'}; 'assignments' is empty if nothing can be
+    connected.
+    """
+    result = {'status': 'FINISHED', 'assignments': {}, 'failed_count': 0,
+              'ingested_count': 0, 'reused_count': 0, 'duplicate_count': 0}
+    try:
+        ingest_dir_server = settings.remix_ingest_directory.rstrip('/\\')
+        server_textures_output_dir = os.path.join(ingest_dir_server, "textures").replace('\\', '/')
+
+        manifest = remix_ingest_manifest.IngestManifest.load(manifest_path)
+        textures_for_ingest = []
+        queued = {}  # local_path -> (digest, server_path) of textures sent this run
+        queued_by_digest = {}  # (digest, type) -> local_path of the queued copy
+        duplicates = {}  # local_path -> local_path of the identical queued copy it waits on
+        reused_count = 0
+
+        # This loop builds the complete list of files to upload
+        for texture_list in assignments_by_material.values():
+            for texture_data in texture_list:
+                local_path, tex_type = texture_data.get('path'), texture_data.get('type')
+                if not (local_path and tex_type and os.path.exists(local_path)):
+                    continue
+                texture_data['usd_input'] = SPECIAL_TEXTURE_MAP.get(tex_type)
+
+                if local_path in queued:
+                    texture_data['server_path'] = queued[local_path][1]
+                    continue
+                if local_path in duplicates:
+                    texture_data['server_path'] = queued[duplicates[local_path]][1]
+                    continue
+                digest = remix_ingest_manifest.file_digest(local_path)
+                primary_path = queued_by_digest.get((digest, tex_type.upper()))
+                if primary_path:
+                    # Identical to a file queued this run; it shares that file's DDS.
+                    duplicates[local_path] = primary_path
+                    texture_data['server_path'] = queued[primary_path][1]
+                    continue
+                known_server_path = manifest.lookup(ingest_dir_server, digest, tex_type.upper())
+                if known_server_path:
+                    texture_data['server_path'] = known_server_path
+                    reused_count += 1
+                    continue
+
+                textures_for_ingest.append([local_path, tex_type.upper()])
+                base_name = os.path.splitext(os.path.basename(local_path))[0]
+                server_path = os.path.join(server_textures_output_dir, f"{base_name}.{tex_type[0].lower()}.rtex.dds").replace('\\', '/')
+                texture_data['server_path'] = server_path
+                queued[local_path] = (digest, server_path)
+                queued_by_digest[(digest, tex_type.upper())] = local_path
+
+        result['reused_count'] = reused_count
+        result['duplicate_count'] = len(duplicates)
+        if reused_count:
+            logging.info(f"Reconnecting {reused_count} special texture(s) already ingested in an earlier export.")
+            result['assignments'] = assignments_by_material
+        if not textures_for_ingest:
+            if not reused_count:
+                logging.warning("No valid special textures found to upload.")
+            manifest.save()
+            return result
+        result['assignments'] = assignments_by_material
+
+        base_api_url = settings.remix_export_url.rstrip('/')
+
+        def _ingest_batch(batch):
+            # Each batch gets its own copy of the payload; several run at once.
+            ingest_payload = copy.deepcopy(TEXTURE_INGEST_PAYLOAD)
+            ingest_payload["context_plugin"]["data"]["input_files"] = batch
+            ingest_payload["context_plugin"]["data"]["output_directory"] = server_textures_output_dir
+            ingest_response = remix_http.request_with_retries(
+                'POST',
+                f"{base_api_url}/material",
+                json_payload=ingest_payload,
+                verify=settings.remix_verify_ssl
+            )
+            return ingest_response is not None and ingest_response.status_code < 400
+
+        logging.info(f"Ingesting {len(textures_for_ingest)} total special textures in concurrent, adaptively sized batches...")
+        succeeded_ingests, failed_ingests = remix_ingest_batches.ingest_in_batches(textures_for_ingest, _ingest_batch)
+        for local_path, tex_type in succeeded_ingests:
+            digest, server_path = queued[local_path]
+            manifest.record(ingest_dir_server, digest, tex_type, server_path, source_name=os.path.basename(local_path))
+        manifest.save()
+        result['ingested_count'] = len(succeeded_ingests)
+
+        if failed_ingests:
+            failed_paths = {local_path for local_path, _ in failed_ingests}
+            ingest_failed_count = len(failed_paths)
+            # Duplicates only point at their primary's DDS, which was never written.
+            failed_paths.update(path for path, primary_path in duplicates.items() if primary_path in failed_paths)
+            logging.error(f"    - {len(failed_paths)} special texture(s) could not be ingested and will not be assigned: {sorted(failed_paths)}")
+            result['failed_count'] = len(failed_paths)
+            for texture_list in assignments_by_material.values():
+                for texture_data in texture_list:
+                    if texture_data.get('path') in failed_paths:
+                        texture_data.pop('server_path', None)
+            if ingest_failed_count == len(queued) and not reused_count:
+                result['status'] = 'CANCELLED'
+        else:
+            logging.info("All special texture ingest batches completed successfully.")
+        return result
+
+    except Exception as e:
+        logging.error(f"A critical error occurred while ingesting special textures: {e}", exc_info=True)
+        result['status'] = 'CANCELLED'
+        return result
+
+
+def assign_special_textures(settings, material_name_map, assignments_by_material):
+    """
+    Connects ingested special textures to the exported materials' shaders with a
+    single texture PUT. `material_name_map` maps a material name to the name it
+    was exported under. Returns 'FINISHED' or 'CANCELLED'.
+    """
+    try:
+        stagecraft_api_url_base = settings.remix_server_url.rstrip('/')
+        all_inputs_url = f"{stagecraft_api_url_base}/textures/?selection=true&filter_session_prims=false&exists=true"
+        all_inputs_response = remix_http.request_with_retries('GET', all_inputs_url, headers=remix_prim_index.REMIX_ACCEPT_HEADER, verify=settings.remix_verify_ssl)
+        if all_inputs_response is None or all_inputs_response.status_code != 200:
+            return 'CANCELLED'
+
+        server_mat_name_to_prim_map = {}
+        for prim_path, _ in all_inputs_response.json().get("textures", []):
+            try:
+                if "/Looks/" in prim_path:
+                    base_shader_path, _ = prim_path.rsplit('.inputs:', 1)
+                    material_name_from_server = base_shader_path.rsplit('/Looks/', 1)[-1].split('/')[0]
+                    if material_name_from_server not in server_mat_name_to_prim_map:
+                        server_mat_name_to_prim_map[material_name_from_server] = base_shader_path
+            except ValueError: continue
+
+        final_put_payload_list = []
+        for original_blender_name, assignments_list in assignments_by_material.items():
+            final_exported_name = material_name_map.get(original_blender_name)
+            if not final_exported_name:
+                logging.warning(f"  Could not find a temporary name mapping for '{original_blender_name}'.")
+                continue
+
+            sanitized_name_to_find = final_exported_name.replace('-', '_')
+            server_shader_prim = server_mat_name_to_prim_map.get(sanitized_name_to_find)
+            if server_shader_prim:
+                logging.info(f"  SUCCESS: Matched Blender material '{original_blender_name}' to server prim '{server_shader_prim}' using sanitized name '{sanitized_name_to_find}'.")
+                for assignment in assignments_list:
+                    if assignment.get('usd_input') and assignment.get('server_path'):
+                        final_put_payload_list.append([f"{server_shader_prim}.inputs:{assignment['usd_input']}", assignment['server_path']])
+            else:
+                logging.warning(f"  FAILED: Could not find server prim for sanitized name '{sanitized_name_to_find}'. Available server names: {list(server_mat_name_to_prim_map.keys())}")
+
+        if not final_put_payload_list:
+            logging.warning("Assignment payload is empty after matching. No special textures will be assigned.")
+            return 'FINISHED'
+
+        put_payload = {"force": False, "textures": final_put_payload_list}
+        put_response = remix_http.request_with_retries('PUT', f"{stagecraft_api_url_base}/textures/", json_payload=put_payload, headers=REMIX_HEADERS, verify=settings.remix_verify_ssl)
+        if put_response is None or put_response.status_code >= 400:
+            return 'CANCELLED'
+
+        logging.info("--- Finished Special Texture Assignment Successfully ---")
+        return 'FINISHED'
+
+    except Exception as e:
+        logging.error(f"A critical error occurred while assigning special textures: {e}", exc_info=True)
+        return 'CANCELLED'